@@ -16,32 +16,719 @@ Created on Wed May 7 20:39:48 2025
 #------------------------------------------------------------------------------
 
 
+import time
+_startzeit = time.perf_counter()                                                                   # Referenzpunkt für die Startphasen-Messung
 import sys
 import os
 import logging
 import re
+import math
+import json
+import functools
+import contextlib
+import threading
+import atexit
+import collections
+import cProfile
+import tracemalloc
+import importlib
+import asyncio
+import random
+import html
+import bisect
+import sqlite3
+import queue
+import struct
+import mmap
+import unicodedata
+import abc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QComboBox, QLineEdit, QPushButton, QGridLayout, QMessageBox,
-                             QTableWidget, QTableWidgetItem, QProgressBar, QFileDialog)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QIntValidator
-import numpy as np
-import openpyxl
-from openpyxl.utils import get_column_letter
+                             QTableWidget, QTableWidgetItem, QProgressBar, QFileDialog, QMenu,
+                             QCheckBox, QShortcut, QTableView, QHeaderView, QAbstractItemView, QSpinBox,
+                             QInputDialog)
+from PyQt5.QtCore import Qt, QTimer, QByteArray, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QPixmap, QIntValidator, QKeySequence, QFont, QImage, QPainter
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+_zeit_importe = time.perf_counter()
 
 import resources  # Importiere die Ressourcendatei
+_zeit_ressourcen = time.perf_counter()
 
 # Umgebungsvariablen fuer Unicode und Qt-Warnungen
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['QT_LOGGING_RULES'] = 'qt5ct.debug=false'
 
 # Logging fuer Debugging
-logging.basicConfig(filename='darts.log', level=logging.DEBUG, encoding='utf-8')
+const_logDatei = 'darts.log'
+logging.basicConfig(filename=const_logDatei, level=logging.DEBUG, encoding='utf-8')
 
 
 const_defaultHighscore = 10000
 const_anzeigeRunden = 8
 const_groesseScheibe = 480
+const_spalteGesamt = const_anzeigeRunden + 1
+const_spaltePlatz = const_anzeigeRunden + 2
+const_serverPort = 47011
+const_httpPort = 47080
+const_deltaPort = 47012
+const_datenbank = 'darts.sqlite'
+const_autosave = 'autosave.drt'
+const_archivOrdner = 'archiv'
+const_archivIndex = 'archiv_index.sqlite'
+const_spielerRegister = 'spieler_register.json'
+const_erwartungCache = 'erwartung_cache'
+const_aufnahmenJeStunde = 111                                                                       # Erfahrungswert je Spieler und Stunde
+const_punkteJeAufnahme = 5185.92 / const_aufnahmenJeStunde                                          # Durchschnitt, wenn kein Streuungsmodell vorliegt
+
+
+def ausgabe_pfad(dateiname):
+    # Diagnosedateien landen im selben Verzeichnis wie darts.log
+    return os.path.join(os.path.dirname(os.path.abspath(const_logDatei)), dateiname)
+
+
+# Schwere Abhängigkeiten (openpyxl, NumPy) werden erst bei Bedarf geladen
+const_vorwaermModule = ('openpyxl', 'openpyxl.utils', 'numpy')
+importzeiten = {}
+_import_lock = threading.Lock()
+
+
+def lade_modul(name):
+    # Importiert ein Modul beim ersten Zugriff und merkt sich die Importzeit
+    modul = sys.modules.get(name)
+    if modul is not None and name in importzeiten:
+        return modul
+    with _import_lock:
+        if name not in importzeiten:
+            t0 = time.perf_counter()
+            modul = importlib.import_module(name)
+            importzeiten[name] = time.perf_counter() - t0
+            logging.info(f"Import {name}: {importzeiten[name] * 1000:.1f} ms ({threading.current_thread().name})")
+    return sys.modules[name]
+
+
+def vorwaermen(module=const_vorwaermModule):
+    # Lädt Module im Hintergrund vor, während der Benutzer noch das Setup ausfüllt
+    def lade_alle():
+        for name in module:
+            try:
+                lade_modul(name)
+            except ImportError as e:
+                logging.error(f"Vorwärmen von {name} fehlgeschlagen: {e}")
+    thread = threading.Thread(target=lade_alle, name="Vorwaermen", daemon=True)
+    thread.start()
+    return thread
+
+
+def importbericht():
+    zeilen = [f"{name}: {dauer * 1000:.1f} ms" for name, dauer in sorted(importzeiten.items(), key=lambda x: -x[1])]
+    return "\n".join(zeilen) if zeilen else "Noch keine verzögerten Importe"
+
+
+class StartProfil:
+    # Misst die Phasen des Programmstarts bis zum ersten Zeichnen des Fensters
+    def __init__(self):
+        self.phasen = [("Importe", _zeit_importe - _startzeit),
+                       ("Ressourcen registrieren", _zeit_ressourcen - _zeit_importe)]
+        self.letzte_marke = _zeit_ressourcen
+        self.abgeschlossen = False
+
+    def markiere(self, phase):
+        if self.abgeschlossen:
+            return
+        jetzt = time.perf_counter()
+        self.phasen.append((phase, jetzt - self.letzte_marke))
+        self.letzte_marke = jetzt
+
+    def abschliessen(self):
+        # Nach dem ersten Zeichnen: Bericht ins Log schreiben
+        if self.abgeschlossen:
+            return
+        self.markiere("Erstes Zeichnen")
+        self.abgeschlossen = True
+        logging.info("Startzeiten:\n" + self.bericht())
+
+    def bericht(self):
+        zeilen = [f"{phase}: {dauer * 1000:.1f} ms" for phase, dauer in self.phasen]
+        zeilen.append(f"Gesamt: {(self.letzte_marke - _startzeit) * 1000:.1f} ms")
+        return "\n".join(zeilen)
+
+
+startprofil = StartProfil()
+_scheibe_pixmap = None
+
+
+def lade_scheibe():
+    # Dekodiert die Dartscheibe nur einmal pro Prozess (wichtig für den Warmstart)
+    global _scheibe_pixmap
+    if _scheibe_pixmap is None or _scheibe_pixmap.isNull():
+        with abschnitt("Dartscheibe dekodieren", "pixmap"):
+            pixmap = QPixmap(":/dartscheibe.png")
+            if pixmap.isNull():
+                # Fallback: Lade aus Dateisystem
+                pixmap = QPixmap("dartscheibe.png")
+        _scheibe_pixmap = pixmap
+    return _scheibe_pixmap
+
+
+const_schalterEin = ('1', 'true', 'yes', 'on', 'ja', 'an')                                          # schalten ein, ohne einen Wert (Pfad, Port) anzugeben
+
+
+def env_schalter(name, standard=False):
+    # Umgebungsvariable als Ein/Aus-Schalter auswerten ("", "0", "false", "nein" = aus)
+    return os.environ.get(name, '1' if standard else '').strip().lower() not in ('', '0', 'false', 'nein', 'off')
+
+
+# Geometrie der Dartscheibe im virtuellen 480x480-Raum: Mittelpunkt (0, 0),
+# x positiv nach links, y positiv nach oben (wie in SpielGUI.virtuelle_koordinaten)
+const_rBullseye = 7.5
+const_rBull = 17.5
+const_rScheibe = 178
+const_rDreifach = 100
+const_bRing = 12
+const_sektoren = [6, 13, 4, 18, 1, 20, 5, 12, 9, 14, 11, 8, 16, 7, 19, 3, 17, 2, 15, 10]           # gegen den Uhrzeigersinn ab 3 Uhr
+
+
+def feld_virtuell(x, y):
+    # Liefert (sektor, faktor); Bull ist Sektor 25, ein Fehlwurf (0, 0)
+    r = math.hypot(x, y)
+    if r <= const_rBullseye:
+        return 25, 2
+    elif r <= const_rBull:
+        return 25, 1
+    elif r > const_rScheibe:
+        return 0, 0
+    #Faktor bestimmen:
+    if r >= const_rDreifach and r <= const_rDreifach + const_bRing:
+        faktor = 3
+    elif r >= const_rScheibe - const_bRing and r <= const_rScheibe:
+        faktor = 2
+    else: faktor = 1
+
+    # Winkel in Grad berechnen:
+    winkel = math.degrees(math.atan2(y, -x))
+    if winkel < 0:
+        winkel += 360
+
+    # Berechnung der Punktzahl basierend auf dem Winkel (vereinfacht):
+    sektorgröße = 360 / len(const_sektoren)
+    sektor_index = (int((winkel + sektorgröße/2) // sektorgröße) % len(const_sektoren))
+    return const_sektoren[sektor_index], faktor
+
+
+def feld_name(sektor, faktor):
+    # "T20", "D16", "5", "Bull", "Bullseye", "daneben"
+    if sektor == 25:
+        return "Bullseye" if faktor == 2 else "Bull"
+    if sektor == 0:
+        return "daneben"
+    return {1: "", 2: "D", 3: "T"}[faktor] + str(sektor)
+
+
+def punktzahl_virtuell(x, y):
+    sektor, faktor = feld_virtuell(x, y)
+    return sektor * faktor
+
+
+def zielpunkt(sektor, faktor):
+    # Mittelpunkt eines Feldes im virtuellen Raum, z. B. zielpunkt(20, 3) für Triple 20
+    if sektor == 25:
+        return 0.0, (0.0 if faktor == 2 else (const_rBullseye + const_rBull) / 2)
+    if faktor == 3:
+        r = const_rDreifach + const_bRing / 2
+    elif faktor == 2:
+        r = const_rScheibe - const_bRing / 2
+    else:
+        r = (const_rBull + const_rDreifach) / 2
+    winkel = math.radians(const_sektoren.index(sektor) * 360 / len(const_sektoren))
+    return -r * math.cos(winkel), r * math.sin(winkel)
+
+
+def punktzahl_raster(x, y):
+    # Vektorisierte Fassung von punktzahl_virtuell für NumPy-Arrays gleicher Form
+    np = lade_modul('numpy')
+    r = np.hypot(x, y)
+    winkel = np.degrees(np.arctan2(y, -x)) % 360
+    sektorgroesse = 360 / len(const_sektoren)
+    sektor = np.array(const_sektoren)[((winkel + sektorgroesse / 2) // sektorgroesse).astype(int) % len(const_sektoren)]
+    faktor = np.ones(r.shape, dtype=int)
+    faktor[(r >= const_rDreifach) & (r <= const_rDreifach + const_bRing)] = 3
+    faktor[(r >= const_rScheibe - const_bRing) & (r <= const_rScheibe)] = 2
+    punkte = sektor * faktor
+    punkte[r > const_rScheibe] = 0
+    punkte[r <= const_rBull] = 25
+    punkte[r <= const_rBullseye] = 50
+    return punkte
+
+
+# Mit drei Darts nicht erreichbare Aufnahmen zwischen 0 und 180
+const_unmoeglicheSummen = frozenset((163, 166, 169, 172, 173, 175, 176, 178, 179))
+# Mit einem Dart erreichbare Punktzahlen: daneben, Single/Double/Triple 1-20, Bull, Bullseye
+const_wurfPunkte = frozenset([0, 25, 50] + [zahl * faktor for zahl in range(1, 21) for faktor in (1, 2, 3)])
+const_wurfMuster = re.compile(r'([SDT]?)(\d{1,2})')
+
+
+def wurf_aus_text(token):
+    # Einzelner Wurf als Text: "T20", "D16", "S5", "5", "25", "50", "BULL", "DB"; 0 = daneben
+    # Bezeichnungen wie in feld_name: Bull = 25, Bullseye = 50
+    token = token.upper()
+    if token in ('DB', 'BULLSEYE'):
+        return 50
+    if token in ('SB', 'BULL'):
+        return 25
+    treffer = const_wurfMuster.fullmatch(token)
+    if not treffer:
+        raise ValueError(f"'{token}' ist kein Wurf")
+    faktor = {'': 1, 'S': 1, 'D': 2, 'T': 3}[treffer.group(1)]
+    zahl = int(treffer.group(2))
+    if not treffer.group(1) and zahl in (0, 50):
+        return zahl
+    if 1 <= zahl <= 20 or (zahl == 25 and faktor < 3):
+        return zahl * faktor
+    raise ValueError(f"'{token}' gibt es auf der Scheibe nicht")
+
+
+def zellwert(zeile, spalte, name):
+    # Wert einer Excel-Zeile über den Spaltenkopf; fehlende Spalte oder kurze Zeile ergibt None
+    return zeile[spalte[name]] if name in spalte and spalte[name] < len(zeile) else None
+
+
+def normalisiere_name(vorname, nachname):
+    # Spieler-Identität über Turniere hinweg: "Jörg  Müller-Lüdenscheidt" und "joerg mueller luedenscheidt" sind gleich
+    def norm(text):
+        text = text.strip().lower()
+        for alt, neu in (('ä', 'ae'), ('ö', 'oe'), ('ü', 'ue'), ('ß', 'ss')):
+            text = text.replace(alt, neu)
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+        return ' '.join(re.split(r'[\s\-]+', text)).strip()
+    return f"{norm(vorname)}|{norm(nachname)}"
+
+
+def summe_aus_text(text):
+    # Aufnahme als ganze Zahl 0-180 ohne unmögliche Summen ("12.0", "1e2" sind ungültig)
+    if not (text.isascii() and text.isdigit()) or int(text) > 180 or int(text) in const_unmoeglicheSummen:
+        raise ValueError(f"'{text}' ist keine mögliche Aufnahme")
+    return int(text)
+
+
+def parse_eingabe(text):
+    # Schnelleingabe: bis zu drei Würfe ("T20 T20 5") oder eine Aufnahme ("=85", bzw. eine Zahl über 60).
+    # Liefert ('wuerfe', [punkte, ...]) oder ('summe', punkte); ValueError bei ungültiger Eingabe.
+    text = text.strip()
+    summe = None
+    if text.startswith('='):
+        summe = text[1:].strip()
+    elif text.isdigit() and int(text) > 60:
+        summe = text
+    if summe is not None:
+        return 'summe', summe_aus_text(summe)
+    token = [t for t in re.split(r'[\s,;+]+', text) if t]
+    if not 1 <= len(token) <= 3:
+        raise ValueError("Ein bis drei Würfe eingeben")
+    return 'wuerfe', [wurf_aus_text(t) for t in token]
+
+
+def parse_block(text):
+    # Aus der Zwischenablage eingefügter Block von Aufnahmen (Zeilen = Spieler, Tab/Semikolon = Runden).
+    # Liefert Höhe, Breite und die belegten Felder [(zeile, spalte, summe)]; leere Felder bleiben unverändert.
+    zeilen = [re.split(r'[\t;]', zeile) for zeile in text.strip('\r\n').splitlines()]
+    eintraege = []
+    ungueltig = []
+    for i, zeile in enumerate(zeilen):
+        for j, feld in enumerate(zeile):
+            feld = feld.strip()
+            if not feld:
+                continue
+            try:
+                eintraege.append((i, j, summe_aus_text(feld)))
+            except ValueError:
+                ungueltig.append((i, j, feld))
+    if ungueltig:
+        zeile, spalte, feld = ungueltig[0]
+        raise ValueError(f"{len(ungueltig)} ungültige Aufnahme(n), erste in Zeile {zeile + 1}, "
+                         f"Spalte {spalte + 1}: {feld}")
+    return len(zeilen), max(len(zeile) for zeile in zeilen), eintraege
+
+
+class LatenzHistogramm:
+    # Histogramm mit logarithmischen Buckets (4 pro Zweierpotenz) über Mikrosekunden.
+    # Feste Größe, damit auch ein ganzer Turnierabend keinen Speicher ansammelt.
+    const_bucketsProOktave = 4
+    const_anzBuckets = 4 * 28                                                                       # reicht bis ca. 268 s
+
+    def __init__(self):
+        self.zaehler = [0] * self.const_anzBuckets
+        self.anzahl = 0
+        self.summe_us = 0.0
+        self.maximum_us = 0.0
+
+    def erfasse(self, dauer_us):
+        if dauer_us > 1:
+            idx = min(int(math.log2(dauer_us) * self.const_bucketsProOktave), self.const_anzBuckets - 1)
+        else:
+            idx = 0
+        self.zaehler[idx] += 1
+        self.anzahl += 1
+        self.summe_us += dauer_us
+        if dauer_us > self.maximum_us:
+            self.maximum_us = dauer_us
+
+    def perzentil(self, p):
+        # Obere Bucket-Grenze des p-ten Perzentils (Fehler < 19 %)
+        if self.anzahl == 0:
+            return 0.0
+        grenze = p / 100 * self.anzahl
+        kumuliert = 0
+        for idx, anzahl in enumerate(self.zaehler):
+            kumuliert += anzahl
+            if kumuliert >= grenze:
+                return min(2 ** ((idx + 1) / self.const_bucketsProOktave), self.maximum_us)
+        return self.maximum_us
+
+    def mittelwert(self):
+        return self.summe_us / self.anzahl if self.anzahl else 0.0
+
+
+class LatenzMonitor:
+    # Sammelt Latenzen der Event-Handler. Ist die Messung aus, kostet ein gemessener
+    # Aufruf nur eine Attributabfrage. Gemessen wird auch im Datenbank- und in den asyncio-Threads
+    # (Log-Handler), daher laufen Erfassen und Auslesen unter einer Sperre.
+    def __init__(self):
+        self.aktiv = env_schalter('DARTS_LATENZ')
+        self.histogramme = {}
+        self.lock = threading.Lock()
+
+    def setze_aktiv(self, aktiv):
+        self.aktiv = aktiv
+        logging.info(f"Latenzmessung {'aktiviert' if aktiv else 'deaktiviert'}")
+
+    def erfasse(self, name, dauer_us):
+        with self.lock:
+            histogramm = self.histogramme.get(name)
+            if histogramm is None:
+                histogramm = self.histogramme[name] = LatenzHistogramm()
+            histogramm.erfasse(dauer_us)
+
+    def zuruecksetzen(self):
+        with self.lock:
+            self.histogramme = {}
+
+    def bericht(self):
+        # Liste von Zeilen (Name, Anzahl, Mittel, p50, p95, p99, Max), Zeiten in ms
+        zeilen = []
+        with self.lock:
+            for name, h in sorted(self.histogramme.items()):
+                zeilen.append((name, h.anzahl, h.mittelwert() / 1000, h.perzentil(50) / 1000,
+                               h.perzentil(95) / 1000, h.perzentil(99) / 1000, h.maximum_us / 1000))
+        return zeilen
+
+    def dump(self, pfad=None):
+        if pfad is None:
+            pfad = ausgabe_pfad(time.strftime('latenz_%Y%m%d_%H%M%S.json'))
+        with self.lock:                                                                             # nicht beim Schreiben und Loggen halten, der Log-Handler misst selbst
+            daten = {
+                'zeitpunkt': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'bucketsProOktave': LatenzHistogramm.const_bucketsProOktave,
+                'handler': {
+                    name: {'anzahl': h.anzahl, 'mittel_ms': h.mittelwert() / 1000,
+                           'p50_ms': h.perzentil(50) / 1000, 'p95_ms': h.perzentil(95) / 1000,
+                           'p99_ms': h.perzentil(99) / 1000, 'max_ms': h.maximum_us / 1000,
+                           'buckets': list(h.zaehler)}
+                    for name, h in self.histogramme.items()
+                }
+            }
+        with open(pfad, 'w', encoding='utf-8') as f:
+            json.dump(daten, f, indent=2)
+        logging.info(f"Latenzen gespeichert: {pfad}")
+        return pfad
+
+
+class TraceRecorder:
+    # Zeichnet Aktivität im Chrome-Trace-Event-Format auf (chrome://tracing, ui.perfetto.dev).
+    # Die Ereignisse liegen als Tupel in einem Ringpuffer und werden erst beim Speichern
+    # in JSON umgewandelt, damit die Aufzeichnung den Qt-Event-Thread kaum belastet.
+    # Häufige Ereignisse (Mausbewegung) werden nur abgetastet aufgezeichnet, langsame immer.
+    const_maxEreignisse = 50000                                                                     # ca. 8 MB, die letzten Minuten bis Stunden
+    const_abtastung = {'mouseMoveEvent': 0.05}                                                      # s Mindestabstand je Ereignisname
+    const_langsam = 0.016                                                                           # s, länger als ein Frame
+
+    def __init__(self):
+        self.aktiv = False
+        self.ereignisse = collections.deque(maxlen=self.const_maxEreignisse)
+        self.zuletzt = {}
+        self.pfad = None
+        self.pid = os.getpid()
+
+    def start(self, pfad=None):
+        self.ereignisse.clear()
+        self.zuletzt.clear()
+        self.pfad = pfad
+        self.aktiv = True
+        logging.info("Trace-Aufzeichnung gestartet")
+
+    def stopp(self):
+        # Beendet die Aufzeichnung und schreibt die Trace-Datei
+        if not self.aktiv:
+            return None
+        self.aktiv = False
+        pfad = self.speichern(self.pfad)
+        return pfad
+
+    def umschalten(self):
+        if self.aktiv:
+            return self.stopp()
+        self.start()
+        return None
+
+    def erfasse(self, name, kategorie, start, dauer):
+        abstand = self.const_abtastung.get(name)
+        if abstand is not None and dauer < self.const_langsam:
+            if start - self.zuletzt.get(name, -abstand) < abstand:
+                return
+            self.zuletzt[name] = start
+        self.ereignisse.append(('X', name, kategorie, start, dauer, threading.get_ident()))
+
+    def markiere(self, name, kategorie):
+        # Zeitpunkt ohne Dauer (z. B. Spielende)
+        if self.aktiv:
+            self.ereignisse.append(('i', name, kategorie, time.perf_counter(), 0.0, threading.get_ident()))
+
+    def speichern(self, pfad=None):
+        if pfad is None:
+            pfad = ausgabe_pfad(time.strftime('trace_%Y%m%d_%H%M%S.json'))
+        thread_namen = {t.ident: t.name for t in threading.enumerate()}
+        events = []
+        tids = set()
+        for phase, name, kategorie, start, dauer, tid in list(self.ereignisse):
+            event = {'name': name, 'cat': kategorie, 'ph': phase, 'ts': start * 1e6,
+                     'pid': self.pid, 'tid': tid}
+            if phase == 'X':
+                event['dur'] = dauer * 1e6
+            else:
+                event['s'] = 'p'
+            events.append(event)
+            tids.add(tid)
+        for tid in tids:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                           'args': {'name': thread_namen.get(tid, str(tid))}})
+        with open(pfad, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        logging.info(f"Trace gespeichert: {pfad} ({len(events)} Ereignisse)")
+        return pfad
+
+
+latenz = LatenzMonitor()
+trace = TraceRecorder()
+
+
+def gemessen(name, kategorie="event"):
+    # Dekorator für Handler; misst nur, wenn Latenzmessung oder Trace aktiv ist.
+    # Achtung: Qt-Signale mit Argumenten per Lambda verbinden, da der Wrapper *args annimmt.
+    def dekorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (latenz.aktiv or trace.aktiv):
+                return func(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                dauer = time.perf_counter() - t0
+                if latenz.aktiv:
+                    latenz.erfasse(name, dauer * 1e6)
+                if trace.aktiv:
+                    trace.erfasse(name, kategorie, t0, dauer)
+        return wrapper
+    return dekorator
+
+
+_leerer_abschnitt = contextlib.nullcontext()
+
+
+def abschnitt(name, kategorie="event"):
+    # Kontextmanager für Teilschritte innerhalb eines Handlers
+    if not (latenz.aktiv or trace.aktiv):
+        return _leerer_abschnitt
+    return _messe_abschnitt(name, kategorie)
+
+
+@contextlib.contextmanager
+def _messe_abschnitt(name, kategorie):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dauer = time.perf_counter() - t0
+        if latenz.aktiv:
+            latenz.erfasse(name, dauer * 1e6)
+        if trace.aktiv:
+            trace.erfasse(name, kategorie, t0, dauer)
+
+
+class SitzungsProfiler:
+    # Umhüllt eine SpielGUI-Sitzung mit cProfile und tracemalloc und schreibt pro Runde
+    # ein Profil (.prof) und einen Speicher-Snapshot (.snap) neben darts.log.
+    # Auswertung z. B. mit "python -m pstats profil_runde_0001.prof" bzw. tracemalloc.Snapshot.load().
+    # Von den Snapshots bleiben nur die letzten auf der Platte; für den Vergleich zwischen zwei Runden
+    # wird nur die Top-Statistik je Quellzeile behalten, nicht der ganze Snapshot.
+    const_snapshotFrames = 5
+    const_topDifferenzen = 10
+    const_topStatistik = 200
+    const_maxSnapshots = 5
+
+    def __init__(self):
+        self.aktiv = False
+        self.verzeichnis = None
+        self.profil = None
+        self.letzte_statistik = None                                                                # (Datei, Zeile) -> Bytes
+
+    def start(self):
+        if self.aktiv:
+            return
+        self.verzeichnis = ausgabe_pfad(time.strftime('profil_%Y%m%d_%H%M%S'))
+        os.makedirs(self.verzeichnis, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.const_snapshotFrames)
+        self.letzte_statistik = None
+        self.profil = cProfile.Profile()
+        self.profil.enable()
+        self.aktiv = True
+        logging.info(f"Profiling gestartet: {self.verzeichnis}")
+
+    def runde_abgeschlossen(self, runde):
+        # Profil und Speicherstand der abgelaufenen Runde sichern, danach neu beginnen
+        if not self.aktiv:
+            return
+        self.profil.disable()
+        try:
+            self.profil.dump_stats(os.path.join(self.verzeichnis, f"profil_runde_{runde:04d}.prof"))
+            self._speicher_snapshot(f"runde_{runde:04d}")
+        except OSError as e:
+            logging.error(f"Profil konnte nicht gespeichert werden: {e}")
+        self.profil = cProfile.Profile()
+        self.profil.enable()
+
+    def stopp(self, bezeichnung="ende"):
+        if not self.aktiv:
+            return
+        self.profil.disable()
+        self.aktiv = False
+        try:
+            self.profil.dump_stats(os.path.join(self.verzeichnis, f"profil_{bezeichnung}.prof"))
+            self._speicher_snapshot(bezeichnung)
+        except OSError as e:
+            logging.error(f"Profil konnte nicht gespeichert werden: {e}")
+        self.profil = None
+        self.letzte_statistik = None
+        tracemalloc.stop()
+        logging.info(f"Profiling beendet: {self.verzeichnis}")
+
+    def umschalten(self):
+        if self.aktiv:
+            self.stopp()
+        else:
+            self.start()
+
+    def _speicher_snapshot(self, bezeichnung):
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+        ))
+        snapshot.dump(os.path.join(self.verzeichnis, f"speicher_{bezeichnung}.snap"))
+        self._raeume_snapshots_auf()
+        statistik = {(s.traceback[0].filename, s.traceback[0].lineno): s.size
+                     for s in snapshot.statistics('lineno')[:self.const_topStatistik]}
+        del snapshot
+        aktuell, spitze = tracemalloc.get_traced_memory()
+        with open(os.path.join(self.verzeichnis, "speicher.txt"), 'a', encoding='utf-8') as f:
+            f.write(f"{time.strftime('%H:%M:%S')} {bezeichnung}: aktuell {aktuell / 1024:.0f} KiB, "
+                    f"Spitze {spitze / 1024:.0f} KiB\n")
+            if self.letzte_statistik is not None:
+                differenzen = [(groesse - self.letzte_statistik.get(stelle, 0), groesse, stelle)
+                               for stelle, groesse in statistik.items()]
+                differenzen += [(-groesse, 0, stelle) for stelle, groesse in self.letzte_statistik.items()
+                                if stelle not in statistik]
+                differenzen.sort(key=lambda d: abs(d[0]), reverse=True)
+                for differenz, groesse, (datei, zeile) in differenzen[:self.const_topDifferenzen]:
+                    f.write(f"    {datei}:{zeile}: {groesse / 1024:.1f} KiB ({differenz / 1024:+.1f} KiB)\n")
+        self.letzte_statistik = statistik
+
+    def _raeume_snapshots_auf(self):
+        # Nur die letzten const_maxSnapshots Speicher-Snapshots behalten
+        dateien = sorted((os.path.join(self.verzeichnis, name) for name in os.listdir(self.verzeichnis)
+                          if name.startswith('speicher_') and name.endswith('.snap')), key=os.path.getmtime)
+        for pfad in dateien[:-self.const_maxSnapshots]:
+            os.remove(pfad)
+
+
+profiler = SitzungsProfiler()
+
+
+# Zeit für das Schreiben der Log-Einträge ebenfalls erfassen
+for _handler in logging.getLogger().handlers:
+    _handler.handle = gemessen("logging", "logging")(_handler.handle)
+
+if env_schalter('DARTS_TRACE'):
+    trace.start()
+atexit.register(trace.stopp)
+
+
+class LatenzPanel(QWidget):
+    # Debug-Fenster mit den Latenz-Histogrammen aller gemessenen Handler
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Latenzen")
+        self.resize(700, 300)
+        layout = QVBoxLayout(self)
+
+        self.chk_aktiv = QCheckBox("Messung aktiv")
+        self.chk_aktiv.setChecked(latenz.aktiv)
+        self.chk_aktiv.toggled.connect(latenz.setze_aktiv)
+        layout.addWidget(self.chk_aktiv)
+
+        self.tabelle = QTableWidget()
+        self.tabelle.setColumnCount(7)
+        self.tabelle.setHorizontalHeaderLabels(["Handler", "Anzahl", "Mittel ms", "p50 ms", "p95 ms", "p99 ms", "Max ms"])
+        layout.addWidget(self.tabelle)
+
+        button_layout = QHBoxLayout()
+        btn_zuruecksetzen = QPushButton("Zurücksetzen")
+        btn_zuruecksetzen.clicked.connect(self.zuruecksetzen)
+        btn_speichern = QPushButton("In Datei schreiben")
+        btn_speichern.clicked.connect(self.speichern)
+        button_layout.addWidget(btn_zuruecksetzen)
+        button_layout.addWidget(btn_speichern)
+        layout.addLayout(button_layout)
+
+        self.timer = QTimer(self)                                                                   # Aktualisierung nur solange das Panel sichtbar ist
+        self.timer.timeout.connect(self.aktualisiere)
+
+    def showEvent(self, event):
+        self.chk_aktiv.setChecked(latenz.aktiv)
+        self.aktualisiere()
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def aktualisiere(self):
+        zeilen = latenz.bericht()
+        self.tabelle.setRowCount(len(zeilen))
+        for row, zeile in enumerate(zeilen):
+            for col, wert in enumerate(zeile):
+                text = f"{wert:.3f}" if isinstance(wert, float) else str(wert)
+                self.tabelle.setItem(row, col, QTableWidgetItem(text))
+
+    def zuruecksetzen(self):
+        latenz.zuruecksetzen()
+        self.aktualisiere()
+
+    def speichern(self):
+        pfad = latenz.dump()
+        QMessageBox.information(self, "Latenzen", f"Latenzen gespeichert: {pfad}")
 
 class DartscheibeLabel(QLabel):
     def __init__(self, parent=None):
@@ -51,75 +738,1828 @@ class DartscheibeLabel(QLabel):
         # Referenz auf das SpielGUI-Objekt für Punktzahl-Berechnung
         self.spiel_gui = None
         self.original_pixmap = None  # Speichert die ursprüngliche Pixmap
+        self.overlay = None          # Trefferbild, auf die aktuelle Größe skaliert
+        self.overlay_schluessel = None
         self.setAlignment(Qt.AlignCenter)
         self.setScaledContents(False)  # Verhindert automatische Skalierung mit Verzerrung
 
-    def set_spiel_gui(self, spiel_gui):
-        # Setze die Referenz auf das SpielGUI-Objekt
-        self.spiel_gui = spiel_gui
+    def set_spiel_gui(self, spiel_gui):
+        # Setze die Referenz auf das SpielGUI-Objekt
+        self.spiel_gui = spiel_gui
+
+    def set_pixmap(self, pixmap):
+        self.original_pixmap = pixmap
+        self.update_pixmap()
+
+    @gemessen("rescale", "pixmap")
+    def update_pixmap(self):
+        if not self.original_pixmap or self.original_pixmap.isNull():
+            return
+        # Skaliere die Pixmap basierend auf der aktuellen Label-Größe, behalte Seitenverhältnis bei
+        label_size = min(self.width(), self.height())
+        scaled_pixmap = self.original_pixmap.scaled(
+            label_size, label_size,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        super().setPixmap(scaled_pixmap)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        heatmap = self.spiel_gui.heatmap if self.spiel_gui else None
+        pixmap = self.pixmap()
+        if heatmap is None or heatmap.auswahl is None or not pixmap or pixmap.isNull():
+            return
+        groesse = min(pixmap.width(), pixmap.height())
+        schluessel = (heatmap.version, groesse)
+        if schluessel != self.overlay_schluessel:                                                   # nur nach neuen Treffern oder Größenänderung skalieren
+            bild = heatmap.bild()
+            self.overlay = QPixmap.fromImage(bild.scaled(groesse, groesse, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)) if bild else None
+            self.overlay_schluessel = schluessel
+        if self.overlay is not None:
+            with abschnitt("Trefferbild", "pixmap"):
+                painter = QPainter(self)
+                painter.drawPixmap((self.width() - groesse) // 2, (self.height() - groesse) // 2, self.overlay)
+                painter.end()
+
+    @gemessen("resizeEvent", "layout")
+    def resizeEvent(self, event):
+        # Bei Größenänderung des Labels Pixmap neu skalieren
+        self.update_pixmap()
+        super().resizeEvent(event)
+
+    @gemessen("mouseMoveEvent")
+    def mouseMoveEvent(self, event):
+        # Behandle Mausbewegungen über dem Label
+        if self.spiel_gui and self.pixmap() and not self.pixmap().isNull():
+            # Hole die Mausposition relativ zum Label
+            x = event.x()
+            y = event.y()
+            # Berechne die Punktzahl basierend auf den Koordinaten
+            punktzahl = self.spiel_gui.AuswertenScheibe(x, y, self.width(), self.height())
+            # Aktualisiere das Punktzahl-Label im SpielGUI
+            self.spiel_gui.update_punktzahl_label(punktzahl)
+        super().mouseMoveEvent(event)
+        
+    @gemessen("mousePressEvent")
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.spiel_gui and self.pixmap():
+            x = event.x()
+            y = event.y()
+            punktzahl = self.spiel_gui.AuswertenScheibe(x, y, self.width(), self.height())
+            position = self.spiel_gui.virtuelle_koordinaten(x, y, self.width(), self.height())
+            self.spiel_gui.fuehre_aus(WurfBefehl(self.spiel_gui, punktzahl, position))
+        super().mousePressEvent(event)
+
+class Spieler:
+    __slots__ = ('vorname', 'nachname', 'startnr', 'id')                                            # kein __dict__ je Spieler
+
+    def __init__(self, vorname, nachname, startnr, id=None):
+        self.vorname = vorname
+        self.nachname = nachname
+        self.startnr = startnr
+        self.id = id                                                                                # dauerhafte Nummer aus dem SpielerRegister
+
+class SpielerRegister:
+    # Dauerhafte Spieler-IDs über Turniere und Importe hinweg. Der Schlüssel ist der normalisierte
+    # Name (normalisiere_name), damit Schreibvarianten wie "Jörg"/"Joerg" dieselbe ID erhalten;
+    # Duplikate werden per Dict-Zugriff in O(1) erkannt.
+    def __init__(self, pfad=None):
+        self.pfad = pfad or ausgabe_pfad(const_spielerRegister)
+        self.ids = {}                                                                               # Schlüssel -> ID
+        self.namen = {}                                                                             # ID -> (vorname, nachname) der ersten Erfassung
+        self.naechste_id = 1
+        self.geaendert = False
+
+    @classmethod
+    def laden(cls, pfad=None):
+        register = cls(pfad)
+        try:
+            with open(register.pfad, encoding='utf-8') as f:
+                daten = json.load(f)
+        except FileNotFoundError:
+            return register
+        except (OSError, ValueError) as e:
+            logging.error(f"Spieler-Register {register.pfad} nicht lesbar: {e}")
+            return register
+        for id, vorname, nachname in daten.get('spieler', ()):
+            register.ids[normalisiere_name(vorname, nachname)] = id
+            register.namen[id] = (vorname, nachname)
+        register.naechste_id = max(daten.get('naechste_id', 1), max(register.namen, default=0) + 1)
+        return register
+
+    def speichern(self):
+        if not self.geaendert:
+            return
+        daten = {'naechste_id': self.naechste_id,
+                 'spieler': [[id, vorname, nachname] for id, (vorname, nachname) in self.namen.items()]}
+        temp = self.pfad + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(daten, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp, self.pfad)                                                                 # nie ein halb geschriebenes Register
+        self.geaendert = False
+
+    def finde(self, vorname, nachname):
+        return self.ids.get(normalisiere_name(vorname, nachname))
+
+    def id_von(self, vorname, nachname):
+        # Vorhandene ID oder neu vergeben
+        schluessel = normalisiere_name(vorname, nachname)
+        id = self.ids.get(schluessel)
+        if id is None:
+            id = self.naechste_id
+            self.naechste_id += 1
+            self.ids[schluessel] = id
+            self.namen[id] = (vorname, nachname)
+            self.geaendert = True
+        return id
+
+    @staticmethod
+    def dedupliziere(namen, bekannt=()):
+        # Liefert (eindeutige Namen in Eingabereihenfolge, Duplikate); bekannt sind bereits erfasste Namen
+        gesehen = {normalisiere_name(v, n) for v, n in bekannt}
+        eindeutig = []
+        doppelt = []
+        for vorname, nachname in namen:
+            schluessel = normalisiere_name(vorname, nachname)
+            if schluessel in gesehen:
+                doppelt.append((vorname, nachname))
+            else:
+                gesehen.add(schluessel)
+                eindeutig.append((vorname, nachname))
+        return eindeutig, doppelt
+
+class RanglistenIndex:
+    # Ordnungsstatistik über die Ranglisten-Schlüssel (gesamt, beste Runde): aufsteigend sortierte
+    # Liste, die pro Änderung per Bisektion aktualisiert wird statt die Rangliste neu zu sortieren.
+    # Ändern sich alle Spieler zugleich (Abgabe), wird einmal sortiert; die Liste ist dann fast
+    # sortiert, was Timsort in nahezu linearer Zeit erledigt.
+    def __init__(self, anzahl):
+        self.schluessel = [(0, 0)] * anzahl
+        self.sortiert = [(0, 0)] * anzahl
+
+    def aktualisiere(self, spieler, neuer_schluessel):
+        alter_schluessel = self.schluessel[spieler]
+        if alter_schluessel == neuer_schluessel:
+            return
+        del self.sortiert[bisect.bisect_left(self.sortiert, alter_schluessel)]
+        bisect.insort(self.sortiert, neuer_schluessel)
+        self.schluessel[spieler] = neuer_schluessel
+
+    def aktualisiere_alle(self, schluessel):
+        self.schluessel = list(schluessel)
+        self.sortiert = sorted(self.schluessel)
+
+    def platz(self, spieler):
+        # Gleichstand teilt sich den Platz (1, 2, 2, 4, ...)
+        return len(self.sortiert) - bisect.bisect_right(self.sortiert, self.schluessel[spieler]) + 1
+
+    def spitze(self):
+        return self.sortiert[-1] if self.sortiert else (0, 0)
+
+
+class PunkteSpeicher:
+    # Gemeinsamer Punktestand eines Turniers: abgeschlossene Runden und offene Zellen.
+    # Threadsicher, da neben der SpielGUI auch der Punkteserver aus seinem Thread schreibt.
+    # Runden werden absolut ab 1 gezählt, Spieler über ihren Zeilenindex.
+    # Eine als Summe eingegebene Aufnahme (Schnelleingabe "=100", Einfügen) hat keine Einzelwürfe;
+    # sie steht in eingaben statt in zellen. Deltas (spieler, runde, summe, anzahl) tragen die
+    # Summe der Zelle (None = leer) und die Zahl der erfassten Einzelwürfe.
+    def __init__(self, spielerliste):
+        self.anz_spieler = len(spielerliste)
+        self.index_von_startnr = {s.startnr: i for i, s in enumerate(spielerliste)}
+        self.startnr = [s.startnr for s in spielerliste]
+        self.runden = []                                                                            # abgeschlossene Runden [runde][spieler]
+        self.summen = [0] * self.anz_spieler                                                        # laufend mitgeführt, kein Aufsummieren aller Runden
+        self.beste = [0] * self.anz_spieler
+        self.rangliste = RanglistenIndex(self.anz_spieler)
+        self.zellen = {}                                                                            # offene Zellen: (spieler, runde) -> Würfe
+        self.eingaben = {}                                                                          # offene Zellen: (spieler, runde) -> eingegebene Summe
+        self.version = 0
+        self.lock = threading.RLock()
+
+    def anz_runden(self):
+        return len(self.runden)
+
+    def wuerfe(self, spieler, runde):
+        return self.zellen.get((spieler, runde), ())
+
+    def summe(self, spieler, runde):
+        # Summe einer offenen Zelle, None wenn leer
+        schluessel = (spieler, runde)
+        if schluessel in self.eingaben:
+            return self.eingaben[schluessel]
+        wuerfe = self.zellen.get(schluessel)
+        return sum(wuerfe) if wuerfe else None
+
+    def inhalt(self, spieler, runde):
+        # (Würfe, eingegebene Summe oder None), z. B. zum Wiederherstellen beim Rückgängigmachen
+        return tuple(self.zellen.get((spieler, runde), ())), self.eingaben.get((spieler, runde))
+
+    def _setze(self, spieler, runde, wuerfe, summe):
+        schluessel = (spieler, runde)
+        self.zellen.pop(schluessel, None)
+        self.eingaben.pop(schluessel, None)
+        if summe is not None:
+            self.eingaben[schluessel] = summe
+        elif wuerfe:
+            self.zellen[schluessel] = list(wuerfe)
+        return (spieler, runde, self.summe(spieler, runde), len(wuerfe) if summe is None else 0)
+
+    def setze_zelle(self, spieler, runde, wuerfe, summe=None):
+        # Ersetzt eine offene Zelle durch Einzelwürfe oder, mit summe, durch eine eingegebene Aufnahme;
+        # liefert das Delta (spieler, runde, summe, anzahl)
+        with self.lock:
+            delta = self._setze(spieler, runde, wuerfe, summe)
+            self.version += 1
+            return delta
+
+    def setze_zellen(self, eintraege):
+        # Wie setze_zelle für viele Zellen (spieler, runde, wuerfe, summe) unter einer Sperre und einer Version
+        with self.lock:
+            deltas = [self._setze(spieler, runde, wuerfe, summe) for spieler, runde, wuerfe, summe in eintraege]
+            self.version += 1
+            return deltas
+
+    def offene_zellen(self):
+        # Deltas aller offenen Zellen, z. B. für einen Schnappschuss
+        with self.lock:
+            return ([(s, r, sum(w), len(w)) for (s, r), w in self.zellen.items()] +
+                    [(s, r, summe, 0) for (s, r), summe in self.eingaben.items()])
+
+    def wende_an(self, ereignisse):
+        # Übernimmt einen Stapel von Wurf-Ereignissen unter einer einzigen Sperre.
+        # Liefert die Deltas der geänderten Zellen und die Fehler je Ereignis-Index.
+        deltas = {}
+        fehler = {}
+        with self.lock:
+            for nr, ereignis in enumerate(ereignisse):
+                spieler = self.index_von_startnr.get(ereignis.get('spieler'))
+                runde = ereignis.get('runde')
+                if spieler is None:
+                    fehler[nr] = "unbekannter Spieler"
+                    continue
+                if not isinstance(runde, int) or isinstance(runde, bool) or runde <= len(self.runden):
+                    fehler[nr] = "Runde bereits abgegeben oder ungültig"
+                    continue
+                if runde > len(self.runden) + 2:                                                    # offene Runde und die folgende
+                    fehler[nr] = "Runde liegt zu weit voraus"
+                    continue
+                schluessel = (spieler, runde)
+                if ereignis.get('typ') == 'reset':
+                    self.zellen.pop(schluessel, None)
+                    self.eingaben.pop(schluessel, None)
+                else:
+                    punkte = ereignis.get('punkte')
+                    if not isinstance(punkte, int) or isinstance(punkte, bool) or punkte not in const_wurfPunkte:
+                        fehler[nr] = "ungültige Punktzahl"
+                        continue
+                    if schluessel in self.eingaben:
+                        fehler[nr] = "Aufnahme bereits als Summe erfasst"
+                        continue
+                    wuerfe = self.zellen.setdefault(schluessel, [])
+                    if len(wuerfe) >= 3:
+                        fehler[nr] = "bereits drei Würfe"
+                        continue
+                    wuerfe.append(punkte)
+                wuerfe = self.zellen.get(schluessel, ())
+                deltas[schluessel] = (spieler, runde, self.summe(spieler, runde), len(wuerfe))
+            if deltas:
+                self.version += 1
+        return list(deltas.values()), fehler
+
+    def runde_abschliessen(self, werte):
+        # Übernimmt die Rundensummen aller Spieler als nächste abgeschlossene Runde
+        with self.lock:
+            self.runden.append(werte)
+            runde = len(self.runden)
+            for spieler, wert in enumerate(werte):
+                self.summen[spieler] += wert
+                if wert > self.beste[spieler]:
+                    self.beste[spieler] = wert
+                self.zellen.pop((spieler, runde), None)
+                self.eingaben.pop((spieler, runde), None)
+            self.rangliste.aktualisiere_alle(zip(self.summen, self.beste))
+            self.version += 1
+            return runde
+
+    def runde_zuruecknehmen(self, beste, zellen):
+        # Macht runde_abschliessen rückgängig; beste und offene Zellen (spieler -> inhalt) kommen aus dem Rückgängig-Befehl
+        with self.lock:
+            werte = self.runden.pop()
+            runde = len(self.runden) + 1
+            for spieler, wert in enumerate(werte):
+                self.summen[spieler] -= wert
+                self.beste[spieler] = beste[spieler]
+                if spieler in zellen:
+                    self._setze(spieler, runde, *zellen[spieler])
+            self.rangliste.aktualisiere_alle(zip(self.summen, self.beste))
+            self.version += 1
+            return werte
+
+    def korrigiere(self, spieler, runde, wert):
+        # Ändert eine abgegebene Runde und führt Summe, beste Runde und Rangliste nach.
+        # Die Rundenzeile wird ersetzt statt verändert, damit bestehende Schnappschüsse gültig bleiben.
+        with self.lock:
+            zeile = list(self.runden[runde - 1])
+            alt = zeile[spieler]
+            if alt == wert:
+                return alt
+            zeile[spieler] = wert
+            self.runden[runde - 1] = zeile
+            self.summen[spieler] += wert - alt
+            if wert >= self.beste[spieler]:
+                self.beste[spieler] = wert
+            elif alt == self.beste[spieler]:
+                # Nur wenn das bisherige Maximum sinkt, die Runden dieses einen Spielers durchsuchen
+                self.beste[spieler] = max(r[spieler] for r in self.runden)
+            self.rangliste.aktualisiere(spieler, (self.summen[spieler], self.beste[spieler]))
+            self.version += 1
+            return alt
+
+    def plaetze(self):
+        # Platz je Spieler nach Gesamtpunkten, bei Gleichstand nach bester Runde (wie die Excel-Auswertung)
+        with self.lock:
+            return [self.rangliste.platz(spieler) for spieler in range(self.anz_spieler)]
+
+    def hoechste_summe(self):
+        return self.rangliste.spitze()[0]
+
+
+class Erwartungskarte:
+    # Erwartete Punktzahl je Zielpunkt bei normalverteilter Streuung (sigma in virtuellen Einheiten,
+    # eine Zahl oder (sigma_x, sigma_y), rho = Korrelation für schräg liegende Streuung). Die Karte ist
+    # die Faltung des Punkterasters mit dem Gauß-Kern und wird per FFT berechnet. Die Streuung wird auf
+    # ganze Einheiten, rho auf 0.1 gerundet; Ergebnisse werden je (Streuung, rho, Schrittweite) im Speicher und als .npz neben darts.log zwischengespeichert, beides mit
+    # begrenzter Anzahl. Eine geänderte Scheibengeometrie macht den Cache ungültig.
+    const_maxKarten = 8                                                                             # im Speicher, je Karte knapp 2 MB
+    const_maxDateien = 32
+    _cache = collections.OrderedDict()
+    _sperre = threading.Lock()
+
+    def __init__(self, sigma, schritt, karte, rho=0.0):
+        self.sigma = sigma
+        self.rho = rho
+        self.schritt = schritt
+        self.karte = karte                                                                          # [zeile, spalte] = [y, x], Ursprung in der Mitte
+        self.mitte = (karte.shape[0] - 1) / 2
+
+    @staticmethod
+    def geometrie():
+        return [const_rBullseye, const_rBull, const_rScheibe, const_rDreifach, const_bRing] + const_sektoren
+
+    @classmethod
+    def fuer(cls, sigma, schritt=1.0, rho=0.0):
+        # sigma: Zahl oder (sigma_x, sigma_y); threadsicher, der Setup-Dialog rechnet im Hintergrund
+        with cls._sperre:
+            return cls._lade(sigma, schritt, rho)
+
+    @classmethod
+    def _lade(cls, sigma, schritt, rho):
+        np = lade_modul('numpy')
+        sx, sy = (sigma, sigma) if isinstance(sigma, (int, float)) else sigma
+        rho = round(max(min(float(rho), 0.9), -0.9), 1) + 0.0                                       # + 0.0: kein "-0" im Dateinamen
+        schluessel = (max(1, round(float(sx))), max(1, round(float(sy))), rho, float(schritt))
+        karte = cls._cache.get(schluessel)
+        if karte is not None:
+            cls._cache.move_to_end(schluessel)
+            return karte
+        pfad = os.path.join(ausgabe_pfad(const_erwartungCache),
+                            f"erwartung_{schluessel[0]:g}_{schluessel[1]:g}_{rho:g}_{schritt:g}.npz")
+        try:
+            with np.load(pfad) as daten:
+                if daten['geometrie'].tolist() == cls.geometrie():
+                    karte = cls(schluessel[:2], schritt, daten['karte'], rho)
+        except (OSError, KeyError, ValueError):
+            pass
+        if karte is None:
+            karte = cls(schluessel[:2], schritt, cls.berechne(schluessel[0], schluessel[1], schritt, rho), rho)
+            try:
+                os.makedirs(os.path.dirname(pfad), exist_ok=True)
+                np.savez_compressed(pfad, karte=karte.karte, geometrie=np.array(cls.geometrie()))
+                cls.raeume_auf(os.path.dirname(pfad))
+            except OSError as e:
+                logging.warning(f"Erwartungskarte nicht zwischengespeichert: {e}")
+        cls._cache[schluessel] = karte
+        if len(cls._cache) > cls.const_maxKarten:
+            cls._cache.popitem(last=False)
+        return karte
+
+    @classmethod
+    def raeume_auf(cls, ordner):
+        # Nur die zuletzt geschriebenen Karten auf der Platte behalten
+        dateien = sorted((os.path.join(ordner, name) for name in os.listdir(ordner)
+                          if name.startswith('erwartung_') and name.endswith('.npz')), key=os.path.getmtime)
+        for pfad in dateien[:-cls.const_maxDateien]:
+            os.remove(pfad)
+
+    @staticmethod
+    @gemessen("Erwartungskarte.berechne", "numpy")
+    def berechne(sx, sy, schritt, rho=0.0):
+        np = lade_modul('numpy')
+        n = int(round(const_groesseScheibe / schritt)) + 1
+        achse = (np.arange(n) - (n - 1) / 2) * schritt
+        x, y = np.meshgrid(achse, achse)
+        raster = punktzahl_raster(x, y).astype(np.float64)
+        # Rand so groß wie der Kern, damit die zyklische FFT-Faltung nichts vom Gegenrand einmischt;
+        # außerhalb des Rasters liegt ohnehin nur 0 Punkte (neben der Scheibe)
+        rand = int(math.ceil(4 * max(sx, sy) / schritt))
+        groesse = (n + 2 * rand, n + 2 * rand)
+        versatz = (np.arange(groesse[0]) - groesse[0] // 2) * schritt
+        kx, ky = np.meshgrid(versatz, versatz)
+        kern = np.exp(-(kx ** 2 / sx ** 2 - 2 * rho * kx * ky / (sx * sy) + ky ** 2 / sy ** 2) / (2 * (1 - rho * rho)))
+        kern /= kern.sum()
+        kern = np.fft.ifftshift(kern)                                                               # Kernmitte auf Index (0, 0)
+        gefaltet = np.fft.irfft2(np.fft.rfft2(raster, groesse) * np.fft.rfft2(kern), groesse)
+        return gefaltet[:n, :n]
+
+    def wert(self, x, y):
+        # Erwartete Punkte beim Zielen auf (x, y) im virtuellen Raum (nächster Rasterpunkt)
+        zeile = int(round(self.mitte + y / self.schritt))
+        spalte = int(round(self.mitte + x / self.schritt))
+        if not (0 <= zeile < self.karte.shape[0] and 0 <= spalte < self.karte.shape[1]):
+            return 0.0
+        return float(self.karte[zeile, spalte])
+
+    def bester_zielpunkt(self):
+        np = lade_modul('numpy')
+        zeile, spalte = np.unravel_index(np.argmax(self.karte), self.karte.shape)
+        x = float((spalte - self.mitte) * self.schritt)
+        y = float((zeile - self.mitte) * self.schritt)
+        return x, y, float(self.karte[zeile, spalte])
+
+
+class StreuungsFit:
+    # Angepasste zweidimensionale Normalverteilung der Treffer um den Zielpunkt Triple 20:
+    # Ablage (Mittelwert minus Zielpunkt) und Kovarianz, alles in virtuellen Einheiten.
+    __slots__ = ('anzahl', 'ablage_x', 'ablage_y', 'cxx', 'cyy', 'cxy')
+
+    def __init__(self, anzahl, ablage_x, ablage_y, cxx, cyy, cxy):
+        self.anzahl = anzahl
+        self.ablage_x = ablage_x
+        self.ablage_y = ablage_y
+        self.cxx = cxx
+        self.cyy = cyy
+        self.cxy = cxy
+
+    def sigma(self):
+        return math.sqrt(max(self.cxx, 1e-6)), math.sqrt(max(self.cyy, 1e-6))
+
+    def korrelation(self):
+        sx, sy = self.sigma()
+        return self.cxy / (sx * sy)
+
+    def erwartete_aufnahme(self):
+        # Erwartete Punkte je Aufnahme (3 Darts) bei diesem Modell, über die Erwartungskarte
+        ziel_x, ziel_y = zielpunkt(20, 3)
+        return 3 * Erwartungskarte.fuer(self.sigma(), rho=self.korrelation()).wert(ziel_x + self.ablage_x, ziel_y + self.ablage_y)
+
+    def ziehe(self, zufall):
+        # Simulierter Treffer (x, y) mit Ablage und korrelierter Streuung (Cholesky-Zerlegung)
+        ziel_x, ziel_y = zielpunkt(20, 3)
+        sx, sy = self.sigma()
+        rho = max(min(self.korrelation(), 0.999), -0.999)
+        z1, z2 = zufall.gauss(0, 1), zufall.gauss(0, 1)
+        return (ziel_x + self.ablage_x + sx * z1,
+                ziel_y + self.ablage_y + sy * (rho * z1 + math.sqrt(1 - rho * rho) * z2))
+
+    def __repr__(self):
+        sx, sy = self.sigma()
+        return (f"StreuungsFit(n={self.anzahl}, Ablage=({self.ablage_x:.1f}, {self.ablage_y:.1f}), "
+                f"sigma=({sx:.1f}, {sy:.1f}), rho={self.korrelation():.2f})")
+
+
+class StreuungsSchaetzer:
+    # Laufende suffiziente Statistiken der Trefferpositionen je Spieler (Anzahl, Summen, Quadrat-
+    # und Produktsummen). Wie bei Statistik trägt jede Zelle genau einmal bei und wird beim Ersetzen
+    # zuerst abgezogen. Als Zielpunkt wird Triple 20 angenommen, das übliche Ziel im Highscore-Spiel.
+    const_minWuerfe = 10
+
+    def __init__(self, anz_spieler):
+        np = lade_modul('numpy')
+        self.summen = np.zeros((anz_spieler, 6))                                                    # n, Σx, Σy, Σxx, Σyy, Σxy
+        self.positionen = {}                                                                        # (spieler, runde) -> ((x, y), ...)
+
+    def setze_treffer(self, spieler, runde, positionen):
+        neu = tuple(p for p in positionen if p is not None)
+        alt = self.positionen.pop((spieler, runde), ())
+        if neu:
+            self.positionen[(spieler, runde)] = neu
+        if alt == neu:
+            return
+        zeile = self.summen[spieler]
+        for (x, y), vorzeichen in [(p, -1) for p in alt] + [(p, 1) for p in neu]:
+            zeile += (vorzeichen, vorzeichen * x, vorzeichen * y, vorzeichen * x * x, vorzeichen * y * y, vorzeichen * x * y)
+
+    @staticmethod
+    def fits(summen):
+        # Vektorisiert über alle Zeilen [n, Σx, Σy, Σxx, Σyy, Σxy]; None bei zu wenigen Würfen
+        np = lade_modul('numpy')
+        summen = np.asarray(summen, dtype=np.float64).reshape(-1, 6)
+        n = np.maximum(summen[:, 0], 1)
+        mx, my = summen[:, 1] / n, summen[:, 2] / n
+        cxx = summen[:, 3] / n - mx * mx
+        cyy = summen[:, 4] / n - my * my
+        cxy = summen[:, 5] / n - mx * my
+        ziel_x, ziel_y = zielpunkt(20, 3)
+        return [StreuungsFit(int(summen[i, 0]), float(mx[i] - ziel_x), float(my[i] - ziel_y),
+                             float(cxx[i]), float(cyy[i]), float(cxy[i]))
+                if summen[i, 0] >= StreuungsSchaetzer.const_minWuerfe else None
+                for i in range(len(summen))]
+
+    def fit(self, spieler):
+        return self.fits(self.summen[spieler])[0]
+
+    @staticmethod
+    @gemessen("StreuungsSchaetzer.aus_datenbank", "sqlite")
+    def aus_datenbank(pfad, namen=None, seit=0):
+        # Fit für viele Spieler aus allen gespeicherten Würfen mit Position: SQLite aggregiert die
+        # Summen je Spieler in einem Durchgang, NumPy rechnet daraus alle Modelle auf einmal.
+        # Liefert {(vorname, nachname): StreuungsFit}; namen schränkt auf bestimmte Spieler ein.
+        verbindung = sqlite3.connect(f"file:{pfad}?mode=ro", uri=True, timeout=10)
+        try:
+            spalten = {spalte[1] for spalte in verbindung.execute("PRAGMA table_info(spieler)")}
+            gruppe = "IFNULL(s.register_id, -s.id)" if 'register_id' in spalten else "s.id"          # ohne Register-ID je Datenbankzeile
+            zeilen = verbindung.execute(
+                "SELECT MIN(s.vorname), MIN(s.nachname), COUNT(*), SUM(w.x), SUM(w.y), SUM(w.x * w.x), SUM(w.y * w.y), SUM(w.x * w.y)"
+                " FROM wuerfe w JOIN spieler s ON s.id = w.spieler_id JOIN turniere t ON t.id = w.turnier_id"
+                f" WHERE w.x IS NOT NULL AND t.beginn >= ? GROUP BY {gruppe}", (seit,)).fetchall()
+        finally:
+            verbindung.close()
+        if namen is not None:
+            gesucht = {normalisiere_name(v, n) for v, n in namen}
+            zeilen = [z for z in zeilen if normalisiere_name(z[0], z[1]) in gesucht]
+        if not zeilen:
+            return {}
+        fits = StreuungsSchaetzer.fits([z[2:] for z in zeilen])
+        return {(z[0], z[1]): fit for z, fit in zip(zeilen, fits) if fit is not None}
+
+
+class Statistik:
+    # Laufende Statistik je Spieler in NumPy-Arrays: Aufnahmen, Summe und Quadratsumme (für Schnitt
+    # und Streuung), Zähler für 100+/140+/180 sowie Trefferverteilung nach Segment und Faktor.
+    # Jede Zelle (spieler, runde) trägt genau einen Beitrag bei; wird sie ersetzt (weiterer Wurf,
+    # Rückgängig, Korrektur), wird der alte Beitrag abgezogen und der neue addiert.
+    # Abfragen lesen nur einige Array-Einträge, unabhängig von der Länge des Turniers.
+    const_schwellen = (100, 140, 180)                                                               # 100-139, 140-179, 180
+    const_segmente = 22                                                                             # 0 = daneben, 1-20, 21 = Bull
+
+    def __init__(self, anz_spieler):
+        np = lade_modul('numpy')
+        self.anzahl = np.zeros(anz_spieler, dtype=np.int32)
+        self.summe = np.zeros(anz_spieler, dtype=np.int64)
+        self.quadrate = np.zeros(anz_spieler, dtype=np.int64)
+        self.hoch = np.zeros((anz_spieler, len(self.const_schwellen)), dtype=np.int32)
+        self.segmente = np.zeros((anz_spieler, self.const_segmente, 4), dtype=np.int32)
+        self.beitraege = {}                                                                         # (spieler, runde) -> Summe der Aufnahme
+        self.treffer = {}                                                                           # (spieler, runde) -> ((segment, faktor), ...)
+
+    def _stufe(self, summe):
+        for stufe in range(len(self.const_schwellen) - 1, -1, -1):
+            if summe >= self.const_schwellen[stufe]:
+                return stufe
+        return None
+
+    def _buche(self, spieler, summe, vorzeichen):
+        self.anzahl[spieler] += vorzeichen
+        self.summe[spieler] += vorzeichen * summe
+        self.quadrate[spieler] += vorzeichen * summe * summe
+        stufe = self._stufe(summe)
+        if stufe is not None:
+            self.hoch[spieler, stufe] += vorzeichen
+
+    def setze_aufnahme(self, spieler, runde, summe):
+        # summe None entfernt die Aufnahme (leere Zelle)
+        alt = self.beitraege.pop((spieler, runde), None)
+        if alt is not None:
+            self._buche(spieler, alt, -1)
+        if summe is not None:
+            self.beitraege[(spieler, runde)] = summe
+            self._buche(spieler, summe, 1)
+
+    def setze_treffer(self, spieler, runde, positionen):
+        # Trefferfelder einer Zelle aus den Klickpositionen im virtuellen Raum (ohne Position: kein Treffer)
+        for segment, faktor in self.treffer.pop((spieler, runde), ()):
+            self.segmente[spieler, segment, faktor] -= 1
+        treffer = []
+        for position in positionen:
+            if position is not None:
+                sektor, faktor = feld_virtuell(*position)
+                treffer.append((21 if sektor == 25 else sektor, faktor))
+        for segment, faktor in treffer:
+            self.segmente[spieler, segment, faktor] += 1
+        if treffer:
+            self.treffer[(spieler, runde)] = tuple(treffer)
+
+    # Beobachter-Schnittstelle der SpielGUI
+    def zellen_geaendert(self, deltas):
+        for spieler, runde, summe, anzahl in deltas:
+            self.setze_aufnahme(spieler, runde, summe)
+            if not anzahl:
+                self.setze_treffer(spieler, runde, ())
+
+    def runde_abgegeben(self, runde, werte, summen):
+        pass
+
+    def runde_zurueckgenommen(self, runde):
+        pass
+
+    def runde_korrigiert(self, spieler, runde, wert):
+        self.setze_aufnahme(spieler, runde, wert)
+        self.setze_treffer(spieler, runde, ())                                                      # Würfe passen nicht mehr zur korrigierten Summe
+
+    def plaetze_geaendert(self, aenderungen):
+        pass
+
+    def werte(self, spieler):
+        anzahl = int(self.anzahl[spieler])
+        schnitt = self.summe[spieler] / anzahl if anzahl else 0.0
+        streuung = math.sqrt(max(self.quadrate[spieler] / anzahl - schnitt * schnitt, 0.0)) if anzahl else 0.0
+        return {'aufnahmen': anzahl, 'schnitt': float(schnitt), 'streuung': streuung,
+                '100+': int(self.hoch[spieler, 0]), '140+': int(self.hoch[spieler, 1]), '180': int(self.hoch[spieler, 2])}
+
+    def verteilung(self, spieler):
+        # Treffer je Segment (Zeilen 0 = daneben, 1-20, 21 = Bull) und Faktor (Spalten 0-3)
+        return self.segmente[spieler]
+
+    def text(self, spieler, fit=None):
+        w = self.werte(spieler)
+        text = (f"3-Dart-Schnitt: {w['schnitt']:.1f} (\u00b1{w['streuung']:.1f}) aus {w['aufnahmen']} Aufnahmen\n"
+                f"100+: {w['100+']}   140+: {w['140+']}   180: {w['180']}")
+        if fit is not None:
+            sx, sy = fit.sigma()
+            text += f"\nStreuung um T20: \u03c3 {sx:.0f}/{sy:.0f}, Ablage {fit.ablage_x:+.0f}/{fit.ablage_y:+.0f}"
+        return text
+
+
+class TrefferHeatmap:
+    # Trefferbild im virtuellen 480x480-Raum. Statt ein Histogramm bei jedem Neuzeichnen weichzuzeichnen,
+    # wird die geglättete Dichte direkt mitgeführt: jeder Treffer addiert (bzw. beim Ersetzen einer Zelle
+    # subtrahiert) einen Gauß-Stempel. Das Einfärben nach QImage ist ein NumPy-Durchgang über das Raster,
+    # unabhängig von der Zahl der Würfe; DartscheibeLabel blendet nur das zwischengespeicherte Bild ein.
+    const_sigma = 6.0
+    const_deckkraft = 170
+
+    def __init__(self):
+        self.positionen = {}                                                                        # (spieler, runde) -> ((x, y), ...)
+        self.auswahl = None                                                                         # None = aus, -1 = alle Spieler, sonst Spielerindex
+        self.dichte = None                                                                          # Raster und Kern erst beim ersten Einblenden (NumPy)
+        self.kern1d = None
+        self.kern = None
+        self.radius = int(3 * self.const_sigma)
+        self.version = 0                                                                            # steigt bei jeder Änderung, für den Bild-Cache
+        self._bild = None
+        self._bild_version = -1
+
+    def _lege_raster_an(self):
+        np = lade_modul('numpy')
+        self.dichte = np.zeros((const_groesseScheibe, const_groesseScheibe), dtype=np.float32)
+        achse = np.arange(-self.radius, self.radius + 1, dtype=np.float32)
+        self.kern1d = np.exp(-achse ** 2 / (2 * self.const_sigma ** 2))
+        self.kern = np.outer(self.kern1d, self.kern1d)
+
+    def zeigt(self, spieler):
+        return self.auswahl == -1 or self.auswahl == spieler
+
+    def _pixel(self, position):
+        # Virtuelle Koordinaten (x nach links, y nach oben) -> Spalte, Zeile im Raster
+        x, y = position
+        return int(round(const_groesseScheibe / 2 - x)), int(round(const_groesseScheibe / 2 - y))
+
+    def _stempel(self, position, vorzeichen):
+        spalte, zeile = self._pixel(position)
+        r = self.radius
+        z0, z1 = max(zeile - r, 0), min(zeile + r + 1, const_groesseScheibe)
+        s0, s1 = max(spalte - r, 0), min(spalte + r + 1, const_groesseScheibe)
+        if z0 >= z1 or s0 >= s1:
+            return
+        self.dichte[z0:z1, s0:s1] += vorzeichen * self.kern[z0 - zeile + r:z1 - zeile + r, s0 - spalte + r:s1 - spalte + r]
+
+    def setze_treffer(self, spieler, runde, positionen):
+        # Ersetzt die Treffer einer Zelle; nur die Differenz wird in die Dichte gestempelt
+        neu = tuple(p for p in positionen if p is not None)
+        alt = self.positionen.pop((spieler, runde), ())
+        if neu:
+            self.positionen[(spieler, runde)] = neu
+        if alt == neu or not self.zeigt(spieler):
+            return False
+        for p in alt:
+            self._stempel(p, -1)
+        for p in neu:
+            self._stempel(p, 1)
+        self.version += 1
+        return True
+
+    @gemessen("TrefferHeatmap.waehle", "pixmap")
+    def waehle(self, auswahl):
+        # Neuaufbau nur beim Wechsel der Auswahl: Histogramm aller Treffer, dann separierbare Glättung
+        self.auswahl = auswahl
+        if self.dichte is None:
+            if auswahl is None:
+                return
+            self._lege_raster_an()
+        np = lade_modul('numpy')
+        self.dichte[:] = 0
+        if auswahl is not None:
+            punkte = [self._pixel(p) for (spieler, _), treffer in self.positionen.items() if self.zeigt(spieler) for p in treffer]
+            if punkte:
+                spalten, zeilen = np.array(punkte).T
+                histogramm, _, _ = np.histogram2d(zeilen, spalten, bins=const_groesseScheibe,
+                                                  range=[[-0.5, const_groesseScheibe - 0.5]] * 2)
+                geglaettet = np.apply_along_axis(np.convolve, 0, histogramm, self.kern1d, mode='same')
+                self.dichte[:] = np.apply_along_axis(np.convolve, 1, geglaettet, self.kern1d, mode='same')
+        self.version += 1
+
+    def bild(self):
+        # Eingefärbtes Overlay (blau = selten, rot = häufig) als QImage; None wenn aus oder leer
+        if self.auswahl is None:
+            return None
+        if self._bild_version != self.version:
+            np = lade_modul('numpy')
+            maximum = float(self.dichte.max())
+            if maximum <= 1e-6:
+                self._bild = None
+            else:
+                d = np.clip(self.dichte / maximum, 0, 1)
+                puffer = np.empty(d.shape + (4,), dtype=np.uint8)                                    # BGRA für Format_ARGB32
+                puffer[..., 0] = (255 * (1 - d)).astype(np.uint8)
+                puffer[..., 1] = (255 * (1 - np.abs(2 * d - 1))).astype(np.uint8)
+                puffer[..., 2] = (255 * d).astype(np.uint8)
+                puffer[..., 3] = (self.const_deckkraft * np.sqrt(d)).astype(np.uint8)
+                self._bild = QImage(puffer.data, const_groesseScheibe, const_groesseScheibe,
+                                    4 * const_groesseScheibe, QImage.Format_ARGB32).copy()
+            self._bild_version = self.version
+        return self._bild
+
+
+class StandSchnappschuss:
+    # Unveränderlicher Stand nach einer Abgabe. JSON und HTML werden erst bei der ersten
+    # Anfrage erzeugt und danach für alle weiteren Anfragen dieser Version wiederverwendet.
+    def __init__(self, spielerliste, speicher, kennung=0):
+        with speicher.lock:
+            self.version = speicher.version
+            self.runden = list(speicher.runden)                                                     # abgeschlossene Runden werden nicht mehr verändert
+            summen = list(speicher.summen)
+            beste = list(speicher.beste)
+        reihenfolge = sorted(range(len(spielerliste)), key=lambda i: (summen[i], beste[i]), reverse=True)
+        self.stand = [{'platz': platz, 'startnr': spielerliste[i].startnr, 'vorname': spielerliste[i].vorname,
+                       'nachname': spielerliste[i].nachname, 'gesamt': summen[i], 'beste_runde': beste[i]}
+                      for platz, i in enumerate(reihenfolge, 1)]
+        self.spieler = [{'startnr': s.startnr, 'vorname': s.vorname, 'nachname': s.nachname} for s in spielerliste]
+        self.etag = f'"{kennung}-{self.version}"'
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def inhalt(self, art):
+        # Liefert (Bytes, Content-Type) für "stand", "runden" oder "html"
+        with self._lock:
+            if art not in self._cache:
+                self._cache[art] = self._erzeuge(art)
+            return self._cache[art]
+
+    def _erzeuge(self, art):
+        if art == 'stand':
+            daten = {'version': self.version, 'runden': len(self.runden), 'stand': self.stand}
+            return json.dumps(daten, ensure_ascii=False).encode('utf-8'), 'application/json; charset=utf-8'
+        if art == 'runden':
+            daten = {'version': self.version, 'spieler': self.spieler, 'runden': self.runden}
+            return json.dumps(daten, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 'application/json; charset=utf-8'
+        zeilen = "".join(
+            f"<tr><td>{e['platz']}</td><td>{html.escape(e['vorname'])} {html.escape(e['nachname'])}</td>"
+            f"<td>{e['gesamt']}</td><td>{e['beste_runde']}</td></tr>"
+            for e in self.stand)
+        seite = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><meta http-equiv='refresh' content='10'>"
+                 f"<title>Dartturnier</title></head><body><h1>Zwischenstand nach Runde {len(self.runden)}</h1>"
+                 f"<table border='1' cellpadding='4'><tr><th>Platz</th><th>Spieler</th><th>Gesamt</th>"
+                 f"<th>Beste Runde</th></tr>{zeilen}</table></body></html>")
+        return seite.encode('utf-8'), 'text/html; charset=utf-8'
+
+
+class _AnzeigeHandler(BaseHTTPRequestHandler):
+    const_pfade = {'/': 'html', '/index.html': 'html', '/stand.json': 'stand', '/runden.json': 'runden'}
+
+    def do_GET(self):
+        art = self.const_pfade.get(self.path.split('?', 1)[0])
+        if art is None:
+            self.send_error(404)
+            return
+        schnappschuss = self.server.anzeige.schnappschuss
+        if self.headers.get('If-None-Match') == schnappschuss.etag:
+            self.send_response(304)
+            self.send_header('ETag', schnappschuss.etag)
+            self.end_headers()
+            return
+        daten, typ = schnappschuss.inhalt(art)
+        self.send_response(200)
+        self.send_header('Content-Type', typ)
+        self.send_header('Content-Length', str(len(daten)))
+        self.send_header('ETag', schnappschuss.etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(daten)
+
+    def log_message(self, format, *args):
+        pass                                                                                        # Abfragen der Anzeigen nicht ins Log schreiben
+
+
+class AnzeigeServer:
+    # Schreibgeschützter HTTP-Endpunkt für Zuschauer: /, /stand.json, /runden.json.
+    # Bedient wird immer der zuletzt veröffentlichte Schnappschuss, nie die Qt-Tabelle.
+    def __init__(self, spielerliste, speicher, host='127.0.0.1', port=const_httpPort):
+        self.spielerliste = spielerliste
+        self.speicher = speicher
+        self.kennung = time.time_ns() // 1000000                                                    # für das ETag: speicher.version beginnt in jedem Turnier (auch beim Fortsetzen) bei 0
+        self.schnappschuss = StandSchnappschuss(spielerliste, speicher, self.kennung)
+        self.http = ThreadingHTTPServer((host, port), _AnzeigeHandler)
+        self.http.daemon_threads = True
+        self.http.anzeige = self
+        self.port = self.http.server_address[1]
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.http.serve_forever, name="AnzeigeServer", daemon=True)
+        self.thread.start()
+        logging.info(f"Anzeige-Server läuft auf Port {self.port}")
+        return self.port
+
+    def aktualisiere(self):
+        # Nach einer Abgabe: neuen Schnappschuss atomar veröffentlichen
+        self.schnappschuss = StandSchnappschuss(self.spielerliste, self.speicher, self.kennung)
+
+    def stopp(self):
+        self.http.shutdown()
+        self.http.server_close()
+
+
+class AsyncioDienst(abc.ABC):
+    # Basis für lokale Netzwerkdienste mit eigener asyncio-Schleife in einem Hintergrund-Thread.
+    # Nachrichten sind zeilenweise JSON; langsame Clients werden getrennt statt zu puffern.
+    const_maxPuffer = 1 << 20                                                                       # Rückstau-Grenze pro Client: 1 MiB
+    const_name = "Dienst"
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.clients = set()
+        self._bereit = threading.Event()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._laufe, name=self.const_name, daemon=True)
+        self.thread.start()
+        self._bereit.wait(5)
+        return self.port
+
+    def stopp(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join(2)
+
+    def rufe_auf(self, funktion, *argumente):
+        # Threadsicherer Aufruf in der Schleife des Dienstes (z. B. aus dem GUI-Thread)
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(funktion, *argumente)
+
+    def _laufe(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._starte())
+        except OSError as e:
+            logging.error(f"{self.const_name} konnte nicht gestartet werden: {e}")
+            self._bereit.set()
+            return
+        self._bereit.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            for writer in list(self.clients):
+                writer.close()
+            aufgaben = asyncio.all_tasks(self.loop)
+            for aufgabe in aufgaben:
+                aufgabe.cancel()
+            self.loop.run_until_complete(asyncio.gather(*aufgaben, return_exceptions=True))
+            self.loop.close()
+            logging.info(f"{self.const_name} beendet")
+
+    async def _starte(self):
+        self._vorbereiten()
+        self.server = await asyncio.start_server(self._client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logging.info(f"{self.const_name} läuft auf {self.host}:{self.port}")
+
+    def _vorbereiten(self):
+        # Hook für Unterklassen, läuft bereits in der Schleife des Dienstes
+        pass
+
+    @abc.abstractmethod
+    async def _client(self, reader, writer):
+        # Bedient eine Verbindung; jeder Dienst legt sein eigenes Protokoll fest
+        ...
+
+    @staticmethod
+    def _kodiere(nachricht):
+        return (json.dumps(nachricht, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+    def _sende(self, writer, nachricht):
+        self._schreibe(writer, self._kodiere(nachricht))
+
+    def _schreibe(self, writer, daten):
+        if writer.is_closing():
+            self.clients.discard(writer)
+            return
+        if writer.transport.get_write_buffer_size() > self.const_maxPuffer:
+            logging.warning(f"{self.const_name}: Client zu langsam, Verbindung getrennt")
+            self.clients.discard(writer)
+            writer.close()
+            return
+        writer.write(daten)
+
+
+class PunkteServer(AsyncioDienst):
+    # Lokaler asyncio-Server für mehrere Scheiben. Clients senden zeilenweise JSON, z. B.
+    #   {"typ": "wurf", "id": 17, "spieler": 3, "runde": 5, "punkte": 60}
+    #   {"typ": "reset", "spieler": 3, "runde": 5}
+    # Ereignisse werden gesammelt, stapelweise in den PunkteSpeicher übernommen und als
+    #   {"typ": "delta", "v": <version>, "d": [[startnr, runde, summe, anzahl], ...]}
+    # an alle Clients zurückgeschickt (summe null = leere Zelle, anzahl = erfasste Einzelwürfe,
+    # 0 bei einer als Summe eingegebenen Aufnahme). Der Absender erhält {"typ": "ack", "ids": [...]}.
+    const_maxStapel = 512
+    const_stapelWartezeit = 0.002                                                                   # s, sammelt Ereignisse kurz für einen gemeinsamen Stapel
+    const_name = "PunkteServer"
+
+    def __init__(self, speicher, host='127.0.0.1', port=const_serverPort, bei_deltas=None):
+        super().__init__(host, port)
+        self.speicher = speicher
+        self.bei_deltas = bei_deltas                                                                # Rückruf im Server-Thread, z. B. Qt-Signal emit
+        self.warteschlange = None
+        self.fehler_anzahl = 0
+
+    def _vorbereiten(self):
+        self.warteschlange = asyncio.Queue()
+        self.loop.create_task(self._stapelverarbeitung())
+
+    async def _client(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while True:
+                zeile = await reader.readline()
+                if not zeile:
+                    break
+                try:
+                    ereignis = json.loads(zeile)
+                    if not isinstance(ereignis, dict):
+                        raise ValueError("kein Objekt")
+                except ValueError:
+                    self.fehler_anzahl += 1
+                    self._sende(writer, {'typ': 'fehler', 'grund': 'ungültiges JSON'})
+                    continue
+                self.warteschlange.put_nowait((ereignis, writer))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError) as e:                                        # Zeile über dem Puffer-Limit von readline
+            self.fehler_anzahl += 1
+            logging.warning(f"{self.const_name}: Client {writer.get_extra_info('peername')} getrennt: {e}")
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    async def _stapelverarbeitung(self):
+        while True:
+            stapel = [await self.warteschlange.get()]
+            if self.warteschlange.empty():
+                await asyncio.sleep(self.const_stapelWartezeit)
+            while len(stapel) < self.const_maxStapel and not self.warteschlange.empty():
+                stapel.append(self.warteschlange.get_nowait())
+            self._verarbeite_stapel(stapel)
+
+    def _verarbeite_stapel(self, stapel):
+        with abschnitt("Server-Stapel", "server"):
+            deltas, fehler = self.speicher.wende_an([ereignis for ereignis, _ in stapel])
+            quittungen = {}
+            for nr, (ereignis, writer) in enumerate(stapel):
+                if nr in fehler:
+                    self.fehler_anzahl += 1
+                    self._sende(writer, {'typ': 'fehler', 'id': ereignis.get('id'), 'grund': fehler[nr]})
+                elif 'id' in ereignis:
+                    quittungen.setdefault(writer, []).append(ereignis['id'])
+            for writer, ids in quittungen.items():
+                self._sende(writer, {'typ': 'ack', 'ids': ids})
+            if deltas:
+                self._verteile_deltas(deltas)
+                if self.bei_deltas is not None:
+                    self.bei_deltas(deltas)
+
+    def verteile(self, deltas):
+        # Aus dem GUI-Thread: lokal eingegebene Würfe an alle Clients weitergeben
+        self.rufe_auf(self._verteile_deltas, deltas)
+
+    def _verteile_deltas(self, deltas):
+        startnr = self.speicher.startnr
+        nachricht = {'typ': 'delta', 'v': self.speicher.version,
+                     'd': [[startnr[spieler], runde, summe, anzahl] for spieler, runde, summe, anzahl in deltas]}
+        daten = self._kodiere(nachricht)
+        for writer in list(self.clients):
+            self._schreibe(writer, daten)
+
+
+class DeltaVerteiler(AsyncioDienst):
+    # Schiebt kompakte Änderungen an externe Anzeigen, statt sie den vollen Stand abfragen zu lassen.
+    # Ein Abonnent sendet nach dem Verbinden {"abo": <letzte q oder null>} und erhält
+    #   - alle verpassten Deltas, falls sie noch im Ringpuffer liegen, sonst
+    #   - einen Schnappschuss {"t": "s", "q": ..., "spieler": [[startnr, vorname, nachname], ...],
+    #     "runden": n, "g": [gesamt], "b": [beste], "p": [platz], "z": [[startnr, runde, summe, anzahl], ...]}
+    # und danach laufend (alle Deltas setzen Werte, sind also idempotent):
+    #   {"t": "z", "q": ..., "z": [[startnr, runde, summe, anzahl], ...]}      Zelle geändert (summe null = leer)
+    #   {"t": "r", "q": ..., "r": runde, "w": [punkte], "g": [gesamt]}         Runde abgegeben
+    #   {"t": "p", "q": ..., "p": [[startnr, platz], ...]}                      Platzierung geändert
+    #   {"t": "k", "q": ..., "s": startnr, "r": runde, "w": punkte, "g": gesamt} Runde korrigiert
+    #   {"t": "u", "q": ..., "r": runde, "g": [gesamt]}                        Abgabe zurückgenommen
+    const_maxDeltas = 10000
+    const_name = "DeltaVerteiler"
+
+    def __init__(self, spielerliste, speicher, host='127.0.0.1', port=const_deltaPort):
+        super().__init__(host, port)
+        self.spielerliste = spielerliste
+        self.speicher = speicher
+        self.seq = 0
+        self.protokoll = collections.deque(maxlen=self.const_maxDeltas)                            # (seq, kodierte Zeile)
+
+    def zellen_geaendert(self, deltas):
+        startnr = self.speicher.startnr
+        self.rufe_auf(self._veroeffentliche, {'t': 'z', 'z': [[startnr[s], r, w, n] for s, r, w, n in deltas]})
+
+    def runde_abgegeben(self, runde, werte, summen):
+        self.rufe_auf(self._veroeffentliche, {'t': 'r', 'r': runde, 'w': list(werte), 'g': list(summen)})
+
+    def runde_zurueckgenommen(self, runde):
+        self.rufe_auf(self._veroeffentliche, {'t': 'u', 'r': runde, 'g': list(self.speicher.summen)})
+
+    def runde_korrigiert(self, spieler, runde, wert):
+        self.rufe_auf(self._veroeffentliche, {'t': 'k', 's': self.speicher.startnr[spieler], 'r': runde,
+                                              'w': wert, 'g': self.speicher.summen[spieler]})
+
+    def plaetze_geaendert(self, aenderungen):
+        startnr = self.speicher.startnr
+        self.rufe_auf(self._veroeffentliche, {'t': 'p', 'p': [[startnr[s], p] for s, p in aenderungen]})
+
+    def _veroeffentliche(self, nachricht):
+        self.seq += 1
+        nachricht['q'] = self.seq
+        daten = self._kodiere(nachricht)
+        self.protokoll.append((self.seq, daten))
+        for writer in list(self.clients):
+            self._schreibe(writer, daten)
+
+    def _schnappschuss(self):
+        plaetze = self.speicher.plaetze()
+        with self.speicher.lock:
+            startnr = self.speicher.startnr
+            return {'t': 's', 'q': self.seq,
+                    'spieler': [[s.startnr, s.vorname, s.nachname] for s in self.spielerliste],
+                    'runden': len(self.speicher.runden), 'g': list(self.speicher.summen),
+                    'b': list(self.speicher.beste), 'p': plaetze,
+                    'z': [[startnr[s], r, w, n] for s, r, w, n in self.speicher.offene_zellen()]}
+
+    async def _client(self, reader, writer):
+        try:
+            zeile = await reader.readline()
+            try:
+                letzte = json.loads(zeile).get('abo') if zeile else None
+            except (ValueError, AttributeError):
+                letzte = None
+            # Nachholen aus dem Ringpuffer nur, wenn lückenlos möglich
+            if isinstance(letzte, int) and self.protokoll and self.protokoll[0][0] <= letzte + 1 and letzte <= self.seq:
+                for seq, daten in self.protokoll:
+                    if seq > letzte:
+                        self._schreibe(writer, daten)
+            elif isinstance(letzte, int) and letzte == self.seq:
+                pass
+            else:
+                self._sende(writer, self._schnappschuss())
+            self.clients.add(writer)
+            while await reader.readline():
+                pass                                                                                # Abonnenten senden nichts mehr
+        except ConnectionError:
+            pass
+        except (ValueError, asyncio.LimitOverrunError) as e:                                        # Zeile über dem Puffer-Limit von readline
+            logging.warning(f"{self.const_name}: Abonnent {writer.get_extra_info('peername')} getrennt: {e}")
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+
+class PunkteClient:
+    # Einfacher asyncio-Client für den Punkteserver (Scheiben-Geräte, lokale Tests)
+    def __init__(self, host='127.0.0.1', port=const_serverPort):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def verbinde(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def sende(self, ereignis):
+        self.writer.write((json.dumps(ereignis, separators=(',', ':')) + "\n").encode('utf-8'))
+        await self.writer.drain()
+
+    async def empfange(self):
+        zeile = await self.reader.readline()
+        return json.loads(zeile) if zeile else None
+
+    async def schliesse(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class TurnierDatenbank:
+    # Turnierverlauf in SQLite (Spieler, Turniere, Runden, Würfe). Geschrieben wird ausschließlich
+    # in einem Hintergrund-Thread: Aufträge aus der GUI landen in einer Queue und werden
+    # stapelweise in einer Transaktion übernommen, damit ein Commit die Oberfläche nie blockiert.
+    # Dank WAL können Abfragen parallel über eigene Verbindungen lesen.
+    const_maxStapel = 500
+    const_schema = """
+        CREATE TABLE IF NOT EXISTS spieler (
+            id INTEGER PRIMARY KEY,
+            vorname TEXT NOT NULL,
+            nachname TEXT NOT NULL,
+            register_id INTEGER,
+            UNIQUE (vorname, nachname));
+        CREATE TABLE IF NOT EXISTS turniere (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            beginn REAL NOT NULL,
+            modus TEXT,
+            runden_soll INTEGER);
+        CREATE TABLE IF NOT EXISTS teilnehmer (
+            turnier_id INTEGER NOT NULL REFERENCES turniere(id),
+            spieler_id INTEGER NOT NULL REFERENCES spieler(id),
+            startnr INTEGER NOT NULL,
+            PRIMARY KEY (turnier_id, spieler_id));
+        CREATE TABLE IF NOT EXISTS runden (
+            turnier_id INTEGER NOT NULL REFERENCES turniere(id),
+            spieler_id INTEGER NOT NULL REFERENCES spieler(id),
+            runde INTEGER NOT NULL,
+            punkte INTEGER NOT NULL,
+            zeit REAL NOT NULL,
+            PRIMARY KEY (turnier_id, runde, spieler_id)) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS wuerfe (
+            turnier_id INTEGER NOT NULL,
+            spieler_id INTEGER NOT NULL,
+            runde INTEGER NOT NULL,
+            nr INTEGER NOT NULL,
+            punkte INTEGER NOT NULL,
+            x REAL,
+            y REAL,
+            PRIMARY KEY (turnier_id, runde, spieler_id, nr)) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS runden_spieler_zeit ON runden (spieler_id, zeit);
+        CREATE INDEX IF NOT EXISTS wuerfe_spieler ON wuerfe (spieler_id, turnier_id);
+        CREATE INDEX IF NOT EXISTS turniere_beginn ON turniere (beginn);
+    """
+
+    def __init__(self, pfad=None):
+        self.pfad = pfad or ausgabe_pfad(const_datenbank)
+        self.auftraege = queue.Queue()
+        self.turnier_id = None
+        self.spieler_ids = []                                                                       # Zeilenindex der SpielGUI -> spieler.id
+        self.thread = None
+
+    @staticmethod
+    def pfad_aus_umgebung():
+        # Pfad aus DARTS_DB, "1" (bzw. "true", "on", ...) bedeutet darts.sqlite neben darts.log; None wenn abgeschaltet
+        if not env_schalter('DARTS_DB'):
+            return None
+        wert = os.environ.get('DARTS_DB', '').strip()
+        return ausgabe_pfad(const_datenbank) if wert.lower() in const_schalterEin else wert
+
+    def verbinde(self):
+        verbindung = sqlite3.connect(self.pfad, timeout=10)
+        verbindung.execute("PRAGMA journal_mode=WAL")
+        verbindung.execute("PRAGMA synchronous=NORMAL")                                             # im WAL-Modus sicher gegen Absturz der Anwendung
+        verbindung.execute("PRAGMA foreign_keys=ON")
+        return verbindung
+
+    def start(self):
+        verbindung = self.verbinde()
+        with verbindung:
+            verbindung.executescript(self.const_schema)
+            if 'register_id' not in {spalte[1] for spalte in verbindung.execute("PRAGMA table_info(spieler)")}:
+                verbindung.execute("ALTER TABLE spieler ADD COLUMN register_id INTEGER")         # Datenbank aus älterer Version
+            verbindung.execute("CREATE UNIQUE INDEX IF NOT EXISTS spieler_register ON spieler (register_id)")
+        verbindung.close()
+        self.thread = threading.Thread(target=self._schreibe, name="Datenbank", daemon=True)
+        self.thread.start()
+
+    def stopp(self):
+        # Wartet, bis alle ausstehenden Aufträge geschrieben sind
+        if self.thread is not None:
+            self.auftraege.put(None)
+            self.thread.join(10)
+            self.thread = None
+
+    def warte(self):
+        self.auftraege.join()
+
+    def _schreibe(self):
+        verbindung = self.verbinde()
+        fertig = False
+        while not fertig:
+            stapel = [self.auftraege.get()]
+            while len(stapel) < self.const_maxStapel:
+                try:
+                    stapel.append(self.auftraege.get_nowait())
+                except queue.Empty:
+                    break
+            t0 = time.perf_counter()
+            fehler = 0
+            try:
+                verbindung.execute("BEGIN")                                                         # ein Commit für den ganzen Stapel
+                for auftrag in stapel:
+                    if auftrag is None:
+                        fertig = True
+                    elif getattr(auftrag, 'eigene_transaktion', False):
+                        verbindung.commit()                                                         # bisherige Aufträge sind unabhängig davon
+                        verbindung.execute("BEGIN")
+                        fehler += not self._fuehre_aus(verbindung, auftrag)
+                        verbindung.commit()
+                        verbindung.execute("BEGIN")
+                    else:
+                        fehler += not self._fuehre_aus(verbindung, auftrag)
+                verbindung.commit()
+            except sqlite3.Error as e:
+                if verbindung.in_transaction:
+                    verbindung.rollback()
+                logging.error(f"Datenbank: Commit für Stapel mit {len(stapel)} Aufträgen fehlgeschlagen: {e}")
+            else:
+                logging.debug(f"Datenbank: {len(stapel) - fehler} Aufträge in {(time.perf_counter() - t0) * 1000:.1f} ms")
+            for _ in stapel:
+                self.auftraege.task_done()
+        verbindung.close()
+
+    @staticmethod
+    def _fuehre_aus(verbindung, auftrag):
+        # Jeder Auftrag in einem eigenen Savepoint: ein Fehler verwirft nur diesen Auftrag, nicht den Stapel
+        verbindung.execute("SAVEPOINT auftrag")
+        try:
+            auftrag(verbindung)
+        except Exception:
+            verbindung.execute("ROLLBACK TO auftrag")
+            logging.exception(f"Datenbank: Auftrag {getattr(auftrag, '__qualname__', auftrag)} verworfen")
+            return False
+        finally:
+            verbindung.execute("RELEASE auftrag")
+        return True
+
+    def starte_turnier(self, spielerliste, modus=None, runden_soll=None, name=None, turnier_id=None, bei_turnier=None):
+        # turnier_id: beim Fortsetzen das bereits angelegte Turnier weiterverwenden;
+        # bei_turnier(id) wird im Schreib-Thread aufgerufen, sobald die ID feststeht
+        beginn = time.time()
+        name = name or time.strftime("Turnier %Y-%m-%d %H:%M", time.localtime(beginn))
+        spieler = [(s.vorname, s.nachname, s.id) for s in spielerliste]
+        startnr = [s.startnr for s in spielerliste]
+
+        def auftrag(verbindung):
+            self.spieler_ids = [self._spieler_id(verbindung, *s) for s in spieler]
+            if turnier_id and verbindung.execute("SELECT 1 FROM turniere WHERE id = ?", (turnier_id,)).fetchone():
+                self.turnier_id = turnier_id
+            else:
+                if turnier_id:
+                    logging.warning(f"Turnier {turnier_id} nicht in {self.pfad}, wird neu angelegt")
+                self.turnier_id = verbindung.execute(
+                    "INSERT INTO turniere (name, beginn, modus, runden_soll) VALUES (?, ?, ?, ?)",
+                    (name, beginn, modus, runden_soll)).lastrowid
+            verbindung.executemany("INSERT OR IGNORE INTO teilnehmer (turnier_id, spieler_id, startnr) VALUES (?, ?, ?)",
+                                   [(self.turnier_id, i, nr) for i, nr in zip(self.spieler_ids, startnr)])
+            if bei_turnier is not None:
+                bei_turnier(self.turnier_id)
+        auftrag.eigene_transaktion = True                                                           # alle folgenden Runden hängen an der Turnier-ID
+        self.auftraege.put(auftrag)
+
+    @staticmethod
+    def _spieler_id(verbindung, vorname, nachname, register_id):
+        # Spieler werden über ihre Register-ID erkannt, auch bei anderer Schreibweise des Namens;
+        # eine Zeile ohne Register-ID (ältere Datenbank) wird über den Namen übernommen
+        if register_id is not None:
+            zeile = verbindung.execute("SELECT id FROM spieler WHERE register_id = ?", (register_id,)).fetchone()
+            if zeile:
+                return zeile[0]
+        zeile = verbindung.execute("SELECT id, register_id FROM spieler WHERE vorname = ? AND nachname = ?",
+                                   (vorname, nachname)).fetchone()
+        if zeile is None:
+            return verbindung.execute("INSERT INTO spieler (vorname, nachname, register_id) VALUES (?, ?, ?)",
+                                      (vorname, nachname, register_id)).lastrowid
+        if zeile[1] is None and register_id is not None:
+            verbindung.execute("UPDATE spieler SET register_id = ? WHERE id = ?", (register_id, zeile[0]))
+        return zeile[0]
+
+    def runde_speichern(self, runde, werte, wuerfe):
+        # wuerfe: je Spieler (Punkte je Wurf, Positionen (x, y) im virtuellen Raum oder leer)
+        zeit = time.time()
+
+        def auftrag(verbindung):
+            self._speichere_runde(verbindung, runde, werte, wuerfe, zeit)
+        self.auftraege.put(auftrag)
+
+    def runden_nachtragen(self, runden):
+        # Runden eines fortgesetzten Turniers: nur die noch nicht gespeicherten übernehmen
+        zeit = time.time()
+
+        def auftrag(verbindung):
+            vorhanden = {r for r, in verbindung.execute("SELECT DISTINCT runde FROM runden WHERE turnier_id = ?",
+                                                        (self.turnier_id,))}
+            neu = [(runde, werte, wuerfe) for runde, werte, wuerfe in runden if runde not in vorhanden]
+            for runde, werte, wuerfe in neu:
+                self._speichere_runde(verbindung, runde, werte, wuerfe, zeit)
+            logging.info(f"Datenbank: {len(neu)} von {len(runden)} Runden nachgetragen")
+        self.auftraege.put(auftrag)
+
+    def _speichere_runde(self, verbindung, runde, werte, wuerfe, zeit):
+        t = self.turnier_id
+        verbindung.executemany("INSERT OR REPLACE INTO runden VALUES (?, ?, ?, ?, ?)",
+                               [(t, self.spieler_ids[s], runde, w, zeit) for s, w in enumerate(werte)])
+        zeilen = []
+        for s, (punkte, positionen) in enumerate(wuerfe):
+            for nr, p in enumerate(punkte):
+                x, y = positionen[nr] if nr < len(positionen) and positionen[nr] else (None, None)
+                zeilen.append((t, self.spieler_ids[s], runde, nr + 1, p, x, y))
+        verbindung.executemany("INSERT OR REPLACE INTO wuerfe VALUES (?, ?, ?, ?, ?, ?, ?)", zeilen)
+
+    def runde_loeschen(self, runde):
+        def auftrag(verbindung):
+            verbindung.execute("DELETE FROM runden WHERE turnier_id = ? AND runde = ?", (self.turnier_id, runde))
+            verbindung.execute("DELETE FROM wuerfe WHERE turnier_id = ? AND runde = ?", (self.turnier_id, runde))
+        self.auftraege.put(auftrag)
+
+    def runde_korrigieren(self, spieler, runde, wert):
+        # Die einzelnen Würfe passen nach einer Korrektur nicht mehr zur Summe und werden entfernt
+        def auftrag(verbindung):
+            schluessel = (self.turnier_id, runde, self.spieler_ids[spieler])
+            verbindung.execute("UPDATE runden SET punkte = ? WHERE turnier_id = ? AND runde = ? AND spieler_id = ?",
+                               (wert,) + schluessel)
+            verbindung.execute("DELETE FROM wuerfe WHERE turnier_id = ? AND runde = ? AND spieler_id = ?", schluessel)
+        self.auftraege.put(auftrag)
+
+    def abfrage(self, sql, parameter=()):
+        # Lesen über eine eigene Verbindung des aufrufenden Threads
+        verbindung = self.verbinde()
+        try:
+            return verbindung.execute(sql, parameter).fetchall()
+        finally:
+            verbindung.close()
+
+    def runden_von_spieler(self, vorname, nachname, seit=None):
+        # Alle Runden eines Spielers, optional ab einem Zeitpunkt (Unix-Zeit, z. B. Saisonbeginn)
+        return self.abfrage(
+            "SELECT t.name, r.runde, r.punkte, r.zeit FROM runden r"
+            " JOIN spieler s ON s.id = r.spieler_id JOIN turniere t ON t.id = r.turnier_id"
+            " WHERE s.vorname = ? AND s.nachname = ? AND r.zeit >= ? ORDER BY r.zeit, r.runde",
+            (vorname, nachname, seit or 0))
+
+
+class TurnierDatei:
+    # Eigenes Binärformat (.drt) für Autosave, Fortsetzen und Archiv:
+    #   Kopf (32 Byte)   Kennung, Version, Spielerzahl, Modus, Highscore/Runden, Beginn, Rundenzahl,
+    #                    Turnier-ID in der Datenbank (0 = keine)
+    #   Spielertabelle   je Spieler 64 Byte: Startnummer, Vorname, Nachname (UTF-8, mit Nullen aufgefüllt)
+    #   Rundenmatrix     je Runde und Spieler 4 x uint16: Summe, Wurf 1-3 (0xFFFF = nicht erfasst)
+    # Alle Einträge haben feste Breite, daher wird die Matrix per mmap ohne Parsen gelesen
+    # und beim Autosave nur eine Runde angehängt bzw. ein Feld überschrieben.
+    const_kennung = b'DRT1'
+    const_version = 1
+    const_kopf = struct.Struct('<4sHHcxIdII2x')
+    const_spieler = struct.Struct('<H31s31s')
+    const_nameBytes = 31                                                                            # längere Namen lehnt das Setup ab
+    const_offsetRunden = 22                                                                         # Lage der Rundenzahl im Kopf
+    const_offsetTurnier = 26
+    const_feld = 4
+    const_leer = 0xFFFF
+
+    def __init__(self, pfad, spielerliste, modus, hr, beginn, runden=None, turnier_id=0):
+        self.pfad = pfad
+        self.spielerliste = spielerliste
+        self.modus = modus
+        self.hr = hr
+        self.beginn = beginn
+        self.turnier_id = turnier_id
+        self.runden = runden                                                                        # NumPy-Sicht auf die Datei: [runde, spieler, feld]
+
+    @property
+    def groesse_runde(self):
+        return len(self.spielerliste) * self.const_feld * 2
+
+    @property
+    def beginn_matrix(self):
+        return self.const_kopf.size + len(self.spielerliste) * self.const_spieler.size
+
+    @classmethod
+    def anlegen(cls, pfad, spielerliste, modus, hr):
+        datei = cls(pfad, spielerliste, modus, int(hr), time.time())
+        with open(pfad, 'wb') as f:
+            f.write(cls.const_kopf.pack(cls.const_kennung, cls.const_version, len(spielerliste),
+                                        modus.encode('ascii'), datei.hr, datei.beginn, 0, 0))
+            for s in spielerliste:
+                f.write(cls.const_spieler.pack(s.startnr, cls._kodiere(s.vorname), cls._kodiere(s.nachname)))
+        return datei
+
+    @classmethod
+    def passt(cls, name):
+        return len(name.encode('utf-8')) <= cls.const_nameBytes
+
+    @classmethod
+    def _kodiere(cls, name):
+        # Notfalls an einer Zeichengrenze kürzen, nie mitten in einem Umlaut
+        return name.encode('utf-8')[:cls.const_nameBytes].decode('utf-8', 'ignore').encode('utf-8')
+
+    @classmethod
+    def oeffnen(cls, pfad):
+        np = lade_modul('numpy')
+        with open(pfad, 'rb') as f:
+            daten = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        kennung, version, anzahl, modus, hr, beginn, anz_runden, turnier_id = cls.const_kopf.unpack_from(daten, 0)
+        if kennung != cls.const_kennung or version != cls.const_version:
+            raise ValueError(f"{pfad} ist keine Turnierdatei (Version {cls.const_version})")
+        spielerliste = []
+        for i in range(anzahl):
+            startnr, vorname, nachname = cls.const_spieler.unpack_from(daten, cls.const_kopf.size + i * cls.const_spieler.size)
+            spielerliste.append(Spieler(vorname.rstrip(b'\0').decode('utf-8', 'ignore'),
+                                        nachname.rstrip(b'\0').decode('utf-8', 'ignore'), startnr))
+        datei = cls(pfad, spielerliste, modus.decode('ascii'), hr, beginn, turnier_id=turnier_id)
+        anz_runden = min(anz_runden, (len(daten) - datei.beginn_matrix) // max(datei.groesse_runde, 1))  # abgebrochenes Anhängen ignorieren
+        datei.runden = np.frombuffer(daten, dtype='<u2', count=anz_runden * anzahl * cls.const_feld,
+                                     offset=datei.beginn_matrix).reshape(anz_runden, anzahl, cls.const_feld)
+        return datei
+
+    @classmethod
+    def offene_runden(cls, pfad):
+        # Rundenzahl eines nicht beendeten Turniers in pfad, 0 wenn dort keins liegt
+        try:
+            return len(cls.oeffnen(pfad).runden)
+        except (OSError, ValueError, struct.error):
+            return 0
+
+    @classmethod
+    def beiseite_legen(cls, pfad):
+        # Nicht beendetes Turnier vor dem Überschreiben unter eigenem Namen aufheben
+        if not cls.offene_runden(pfad):
+            return None
+        stamm, endung = os.path.splitext(pfad)
+        ziel = time.strftime(f"{stamm}_%Y%m%d_%H%M%S{endung}", time.localtime(os.path.getmtime(pfad)))
+        os.replace(pfad, ziel)
+        logging.warning(f"Nicht beendetes Turnier nach {ziel} verschoben")
+        return ziel
+
+    def summen_je_runde(self):
+        return self.runden[:, :, 0].tolist()
+
+    def wuerfe(self, runde):
+        # Würfe aller Spieler einer Runde (ab 1) im Format von TurnierDatenbank.runde_speichern
+        return [(tuple(w for w in feld[1:] if w != self.const_leer), ()) for feld in self.runden[runde - 1].tolist()]
+
+    def haenge_runde_an(self, werte, wuerfe):
+        zeile = []
+        for wert, (punkte, _) in zip(werte, wuerfe):
+            punkte = list(punkte)[:3] if sum(punkte) == wert else []
+            zeile += [wert] + punkte + [self.const_leer] * (3 - len(punkte))
+        with open(self.pfad, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            anz_runden = (f.tell() - self.beginn_matrix) // self.groesse_runde
+            f.write(struct.pack(f'<{len(zeile)}H', *zeile))
+            f.seek(self.const_offsetRunden)
+            f.write(struct.pack('<I', anz_runden + 1))
+
+    def entferne_letzte_runde(self):
+        with open(self.pfad, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            anz_runden = (f.tell() - self.beginn_matrix) // self.groesse_runde - 1
+            f.truncate(self.beginn_matrix + anz_runden * self.groesse_runde)
+            f.seek(self.const_offsetRunden)
+            f.write(struct.pack('<I', anz_runden))
+
+    def setze_turnier_id(self, turnier_id):
+        # Wird nachgetragen, sobald die Datenbank das Turnier angelegt hat
+        self.turnier_id = turnier_id
+        with open(self.pfad, 'r+b') as f:
+            f.seek(self.const_offsetTurnier)
+            f.write(struct.pack('<I', turnier_id))
+
+    def setze_summe(self, spieler, runde, wert):
+        with open(self.pfad, 'r+b') as f:
+            f.seek(self.beginn_matrix + (runde - 1) * self.groesse_runde + spieler * self.const_feld * 2)
+            f.write(struct.pack('<4H', wert, self.const_leer, self.const_leer, self.const_leer))
+
+    def archivieren(self):
+        # Abgeschlossenes Turnier aus dem Autosave ins Archiv verschieben
+        ordner = ausgabe_pfad(const_archivOrdner)
+        os.makedirs(ordner, exist_ok=True)
+        ziel = os.path.join(ordner, time.strftime("turnier_%Y%m%d_%H%M%S.drt", time.localtime(self.beginn)))
+        os.replace(self.pfad, ziel)
+        self.pfad = ziel
+        logging.info(f"Turnier archiviert: {ziel}")
+        return ziel
+
+
+class ArchivIndex:
+    # Index über archivierte Turniere (.drt aus dem Archiv, exportierte .xlsx) in SQLite.
+    # Pro Datei werden Pfad, Änderungszeit und Größe gemerkt; aktualisiere() liest nur neue
+    # oder geänderte Dateien ein, Abfragen öffnen keine einzige Arbeitsmappe mehr.
+    const_schema = """
+        CREATE TABLE IF NOT EXISTS dateien (
+            pfad TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            groesse INTEGER NOT NULL,
+            datum REAL NOT NULL);
+        CREATE TABLE IF NOT EXISTS ergebnisse (
+            pfad TEXT NOT NULL REFERENCES dateien(pfad) ON DELETE CASCADE,
+            schluessel TEXT NOT NULL,
+            vorname TEXT NOT NULL,
+            nachname TEXT NOT NULL,
+            platz INTEGER,
+            gesamt INTEGER,
+            beste INTEGER,
+            runden INTEGER,
+            schnitt REAL,
+            datum REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS ergebnisse_spieler ON ergebnisse (schluessel, datum);
+        CREATE INDEX IF NOT EXISTS ergebnisse_datum ON ergebnisse (datum);
+        CREATE INDEX IF NOT EXISTS ergebnisse_pfad ON ergebnisse (pfad);
+    """
+
+    def __init__(self, pfad=None, ordner=None):
+        self.pfad = pfad or ausgabe_pfad(const_archivIndex)
+        self.ordner = ordner or ausgabe_pfad(const_archivOrdner)
+        self.verbindung = sqlite3.connect(self.pfad, timeout=10)
+        self.verbindung.execute("PRAGMA journal_mode=WAL")
+        self.verbindung.execute("PRAGMA foreign_keys=ON")
+        with self.verbindung:
+            self.verbindung.executescript(self.const_schema)
+
+    def schliessen(self):
+        self.verbindung.close()
+
+    @gemessen("ArchivIndex.aktualisiere", "archiv")
+    def aktualisiere(self):
+        # Liefert die Anzahl neu eingelesener Dateien
+        bekannt = {pfad: (mtime, groesse) for pfad, mtime, groesse in
+                   self.verbindung.execute("SELECT pfad, mtime, groesse FROM dateien")}
+        vorhanden = set()
+        neu = 0
+        if os.path.isdir(self.ordner):
+            for eintrag in os.scandir(self.ordner):
+                if not eintrag.is_file() or not eintrag.name.lower().endswith(('.drt', '.xlsx')):
+                    continue
+                vorhanden.add(eintrag.path)
+                info = eintrag.stat()
+                if bekannt.get(eintrag.path) == (info.st_mtime, info.st_size):
+                    continue
+                try:
+                    datum, ergebnisse = self.lies_datei(eintrag.path, info.st_mtime)
+                except Exception as e:
+                    logging.warning(f"Archiv: {eintrag.path} übersprungen: {e}")
+                    continue
+                with self.verbindung:
+                    self.verbindung.execute("DELETE FROM dateien WHERE pfad = ?", (eintrag.path,))
+                    self.verbindung.execute("INSERT INTO dateien VALUES (?, ?, ?, ?)",
+                                            (eintrag.path, info.st_mtime, info.st_size, datum))
+                    self.verbindung.executemany(
+                        "INSERT INTO ergebnisse VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(eintrag.path, normalisiere_name(v, n), v, n, platz, gesamt, beste, runden, schnitt, datum)
+                         for v, n, platz, gesamt, beste, runden, schnitt in ergebnisse])
+                neu += 1
+        entfernt = [(pfad,) for pfad in bekannt if pfad not in vorhanden]
+        with self.verbindung:
+            self.verbindung.executemany("DELETE FROM dateien WHERE pfad = ?", entfernt)
+        logging.info(f"Archiv-Index: {neu} Dateien neu eingelesen, {len(entfernt)} entfernt")
+        return neu
+
+    def lies_datei(self, pfad, mtime):
+        # Liefert (Datum, [(vorname, nachname, platz, gesamt, beste, runden, schnitt), ...])
+        if pfad.lower().endswith('.drt'):
+            datei = TurnierDatei.oeffnen(pfad)
+            summen = datei.runden[:, :, 0].astype('int64')
+            gesamt = summen.sum(axis=0).tolist()
+            beste = summen.max(axis=0).tolist() if len(summen) else [0] * len(datei.spielerliste)
+            anz_runden = len(summen)
+            reihenfolge = sorted(range(len(gesamt)), key=lambda i: (gesamt[i], beste[i]), reverse=True)
+            platz = {spieler: rang for rang, spieler in enumerate(reihenfolge, 1)}
+            return datei.beginn, [(s.vorname, s.nachname, platz[i], gesamt[i], beste[i], anz_runden,
+                                   gesamt[i] / anz_runden if anz_runden else None)
+                                  for i, s in enumerate(datei.spielerliste)]
+        wb = lade_modul('openpyxl').load_workbook(pfad, read_only=True, data_only=True)
+        try:
+            zeilen = wb.active.iter_rows(values_only=True)
+            kopf = list(next(zeilen, ()))
+            spalte = {name: kopf.index(name) for name in ("Platzierung", "Vorname", "Nachname", "Gesamtpunktzahl", "Beste Runde")
+                      if name in kopf}
+            if "Vorname" not in spalte or "Nachname" not in spalte:
+                raise ValueError("Spalten 'Vorname' und 'Nachname' fehlen")
+            ergebnisse = [(str(zellwert(z, spalte, "Vorname")).strip(), str(zellwert(z, spalte, "Nachname")).strip(),
+                           zellwert(z, spalte, "Platzierung"), zellwert(z, spalte, "Gesamtpunktzahl"), zellwert(z, spalte, "Beste Runde"),
+                           None, None)
+                          for z in zeilen if zellwert(z, spalte, "Vorname") and zellwert(z, spalte, "Nachname")]
+        finally:
+            wb.close()
+        return mtime, ergebnisse
+
+    def spieler(self, vorname, nachname):
+        # Alle archivierten Ergebnisse eines Spielers, neueste zuerst
+        return self.verbindung.execute(
+            "SELECT datum, platz, gesamt, beste, runden, schnitt, pfad FROM ergebnisse"
+            " WHERE schluessel = ? ORDER BY datum DESC", (normalisiere_name(vorname, nachname),)).fetchall()
+
+    def saison(self, von, bis):
+        # Aggregat je Spieler im Zeitraum [von, bis) (Unix-Zeit)
+        return self.verbindung.execute(
+            "SELECT MIN(vorname), MIN(nachname), COUNT(*), SUM(gesamt), MAX(beste), AVG(platz),"
+            " SUM(CASE WHEN runden IS NOT NULL THEN gesamt END) * 1.0 / NULLIF(SUM(runden), 0) FROM ergebnisse"
+            " WHERE datum >= ? AND datum < ? GROUP BY schluessel ORDER BY SUM(gesamt) DESC", (von, bis)).fetchall()
+
+    def top(self, anzahl=10, spalte='gesamt', von=0, bis=float('inf')):
+        # Beste Einzelergebnisse im Zeitraum nach gesamt, beste oder schnitt
+        if spalte not in ('gesamt', 'beste', 'schnitt'):
+            raise ValueError(f"Unbekannte Spalte: {spalte}")
+        return self.verbindung.execute(
+            f"SELECT vorname, nachname, {spalte}, datum, pfad FROM ergebnisse"
+            f" WHERE datum >= ? AND datum < ? AND {spalte} IS NOT NULL ORDER BY {spalte} DESC LIMIT ?",
+            (von, bis, anzahl)).fetchall()
+
+
+def aktualisiere_archiv_index():
+    # Im Hintergrund nach dem Archivieren eines Turniers; eigene Verbindung je Thread
+    try:
+        index = ArchivIndex()
+        try:
+            index.aktualisiere()
+        finally:
+            index.schliessen()
+    except sqlite3.Error as e:
+        logging.error(f"Archiv-Index nicht aktualisiert: {e}")
+
+
+class Lasttest:
+    # Lastgenerator für den Punkteserver: viele simulierte Scheiben senden realistische
+    # Wurffolgen (Zielpunkt Triple 20, normalverteilte Streuung, gewertet mit feld_virtuell).
+    # Gemessen wird die Zeit bis zur Quittung des Servers.
+    def __init__(self, anz_clients=200, wuerfe_pro_client=300, spieler_pro_scheibe=4,
+                 wuerfe_pro_sekunde=5.0, host='127.0.0.1', port=None, seed=None, modelle=None):
+        self.anz_clients = anz_clients
+        self.modelle = modelle                                                                      # angepasste StreuungsFit-Modelle statt zufälliger Streuung
+        self.wuerfe_pro_client = wuerfe_pro_client
+        self.spieler_pro_scheibe = spieler_pro_scheibe
+        self.wuerfe_pro_sekunde = wuerfe_pro_sekunde
+        self.host = host
+        self.port = port
+        self.zufall = random.Random(seed)
+        self.latenzen = []
+        self.gesendet = 0
+        self.fehler = 0
+        self.verbindungsfehler = 0
+        self.unbeantwortet = 0
 
-    def set_pixmap(self, pixmap):
-        self.original_pixmap = pixmap
-        self.update_pixmap()
+    def laufe(self):
+        server = None
+        if self.port is None:
+            # Eigener Server im selben Prozess mit passenden Startnummern
+            spielerliste = [Spieler("Last", str(nr), nr) for nr in range(1, self.anz_clients * self.spieler_pro_scheibe + 1)]
+            server = PunkteServer(PunkteSpeicher(spielerliste), host=self.host, port=0)
+            self.port = server.start()
+        try:
+            t0 = time.perf_counter()
+            asyncio.run(self._alle_clients())
+            dauer = time.perf_counter() - t0
+        finally:
+            if server is not None:
+                server.stopp()
+        return self.bericht(dauer)
 
-    def update_pixmap(self):
-        if not self.original_pixmap or self.original_pixmap.isNull():
+    async def _alle_clients(self):
+        await asyncio.gather(*(self._client(nr) for nr in range(self.anz_clients)))
+
+    async def _client(self, nr):
+        try:
+            client = PunkteClient(self.host, self.port)
+            await client.verbinde()
+        except OSError:
+            self.verbindungsfehler += 1
             return
-        # Skaliere die Pixmap basierend auf der aktuellen Label-Größe, behalte Seitenverhältnis bei
-        label_size = min(self.width(), self.height())
-        scaled_pixmap = self.original_pixmap.scaled(
-            label_size, label_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        super().setPixmap(scaled_pixmap)
+        offen = {}
+        empfaenger = asyncio.ensure_future(self._empfange(client, offen))
+        streuung = self.zufall.uniform(15, 45)                                                      # Streuung der Scheibe in virtuellen Pixeln
+        modell = self.zufall.choice(self.modelle) if self.modelle else None
+        ziel_x, ziel_y = zielpunkt(20, 3)
+        erster_spieler = nr * self.spieler_pro_scheibe + 1
+        await asyncio.sleep(self.zufall.random() / self.wuerfe_pro_sekunde)                          # Clients zeitlich verteilen
+        try:
+            for i in range(self.wuerfe_pro_client):
+                runde, rest = divmod(i, 3 * self.spieler_pro_scheibe)
+                spieler = erster_spieler + rest // 3
+                if runde >= 2 and rest % 3 == 0:
+                    # Ohne Abgabe nimmt der Server nur zwei offene Runden an; die Zelle vor dem Wiederverwenden leeren
+                    await client.sende({'typ': 'reset', 'spieler': spieler, 'runde': runde % 2 + 1})
+                if modell is not None:
+                    sektor, faktor = feld_virtuell(*modell.ziehe(self.zufall))
+                else:
+                    sektor, faktor = feld_virtuell(self.zufall.gauss(ziel_x, streuung), self.zufall.gauss(ziel_y, streuung))
+                ereignis_id = nr * self.wuerfe_pro_client + i
+                offen[ereignis_id] = time.perf_counter()
+                await client.sende({'typ': 'wurf', 'id': ereignis_id, 'spieler': spieler,
+                                    'runde': runde % 2 + 1, 'punkte': sektor * faktor})
+                self.gesendet += 1
+                await asyncio.sleep(self.zufall.expovariate(self.wuerfe_pro_sekunde))
+            # Auf ausstehende Quittungen warten
+            for _ in range(100):
+                if not offen:
+                    break
+                await asyncio.sleep(0.02)
+        except ConnectionError:
+            self.verbindungsfehler += 1
+        finally:
+            self.unbeantwortet += len(offen)
+            empfaenger.cancel()
+            await client.schliesse()
 
-    def resizeEvent(self, event):
-        # Bei Größenänderung des Labels Pixmap neu skalieren
-        self.update_pixmap()
-        super().resizeEvent(event)
+    async def _empfange(self, client, offen):
+        while True:
+            nachricht = await client.empfange()
+            if nachricht is None:
+                return
+            jetzt = time.perf_counter()
+            if nachricht['typ'] == 'ack':
+                for ereignis_id in nachricht['ids']:
+                    gesendet = offen.pop(ereignis_id, None)
+                    if gesendet is not None:
+                        self.latenzen.append(jetzt - gesendet)
+            elif nachricht['typ'] == 'fehler':
+                self.fehler += 1
+                offen.pop(nachricht.get('id'), None)
 
-    def mouseMoveEvent(self, event):
-        # Behandle Mausbewegungen über dem Label
-        if self.spiel_gui and self.pixmap() and not self.pixmap().isNull():
-            # Hole die Mausposition relativ zum Label
-            x = event.x()
-            y = event.y()
-            # Berechne die Punktzahl basierend auf den Koordinaten
-            punktzahl = self.spiel_gui.AuswertenScheibe(x, y, self.width(), self.height())
-            # Aktualisiere das Punktzahl-Label im SpielGUI
-            self.spiel_gui.update_punktzahl_label(punktzahl)
-        super().mouseMoveEvent(event)
-        
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton and self.spiel_gui and self.pixmap():
-            x = event.x()
-            y = event.y()
-            punktzahl = self.spiel_gui.AuswertenScheibe(x, y, self.width(), self.height())
-            self.spiel_gui.verarbeite_wurf(punktzahl)
-        super().mousePressEvent(event)
+    def bericht(self, dauer):
+        latenzen = sorted(self.latenzen)
+
+        def perzentil(p):
+            if not latenzen:
+                return 0.0
+            return latenzen[min(len(latenzen) - 1, int(p / 100 * len(latenzen)))] * 1000
+
+        return {
+            'clients': self.anz_clients,
+            'gesendet': self.gesendet,
+            'quittiert': len(latenzen),
+            'dauer_s': dauer,
+            'durchsatz_pro_s': len(latenzen) / dauer if dauer else 0.0,
+            'p50_ms': perzentil(50),
+            'p99_ms': perzentil(99),
+            'max_ms': latenzen[-1] * 1000 if latenzen else 0.0,
+            'fehler': self.fehler,
+            'verbindungsfehler': self.verbindungsfehler,
+            'unbeantwortet': self.unbeantwortet,
+        }
+
+
+def lasttest_main(argumente):
+    # Aufruf: Darts_v0.3.py --lasttest [--clients N] [--wuerfe N] [--rate R] [--port P] [--db PFAD]
+    import argparse
+    parser = argparse.ArgumentParser(prog="Darts_v0.3.py --lasttest")
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--wuerfe', type=int, default=300, help="Würfe pro Client")
+    parser.add_argument('--rate', type=float, default=5.0, help="Würfe pro Sekunde und Client")
+    parser.add_argument('--port', type=int, default=None, help="laufenden Server testen statt eines eigenen")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--db', default=None, help="Streuungsmodelle der Spieler aus dieser Datenbank simulieren")
+    args = parser.parse_args(argumente)
+    modelle = list(StreuungsSchaetzer.aus_datenbank(args.db).values()) if args.db else None
+    test = Lasttest(args.clients, args.wuerfe, wuerfe_pro_sekunde=args.rate, port=args.port, seed=args.seed, modelle=modelle)
+    ergebnis = test.laufe()
+    logging.info(f"Lasttest: {ergebnis}")
+    for schluessel, wert in ergebnis.items():
+        print(f"{schluessel:>18}: {wert:.2f}" if isinstance(wert, float) else f"{schluessel:>18}: {wert}")
+    return 0 if ergebnis['fehler'] == 0 and ergebnis['verbindungsfehler'] == 0 and ergebnis['unbeantwortet'] == 0 else 1
 
-class Spieler:
-    def __init__(self, vorname, nachname, startnr):
-        self.vorname = vorname
-        self.nachname = nachname
-        self.startnr = startnr
 
 class SetupLogik:
     def __init__(self):
         self.spielerliste = []
         self.anzZeilen = 1
 
-    def schaetzeZeit(self, modus, highscore_runden, anz_spieler):
+    def schaetzeZeit(self, modus, highscore_runden, anz_spieler, punkte_je_aufnahme=None):
+        # punkte_je_aufnahme: erwarteter Schnitt des stärksten Spielers (aus dem Streuungsmodell), sonst Erfahrungswert
         try:
             hr = int(highscore_runden)
             if hr <= 0:
                 logging.warning("Highscore/Rundenanzahl <= 0")
                 return [0, 0]
             if modus == "Highscore":
-                t = (hr * anz_spieler) / 5185.92 * 60
+                runden = hr / (punkte_je_aufnahme or const_punkteJeAufnahme)
             else:
-                t = (hr * anz_spieler) / 111 * 60
+                runden = hr
+            t = (runden * anz_spieler) / const_aufnahmenJeStunde * 60
             t_h = int(t // 60)
             t_m = int(t % 60)
             return [t_h, t_m]
@@ -127,9 +2567,10 @@ class SetupLogik:
             logging.warning(f"Ungültige Eingabe fuer Highscore/Runden: {highscore_runden}")
             return [0, 0]
 
+    @gemessen("import_spieler_excel", "excel")
     def import_spieler_excel(self, file_path):
         try:
-            wb = openpyxl.load_workbook(file_path)
+            wb = lade_modul('openpyxl').load_workbook(file_path)
             ws = wb.active
             spieler_daten = []
             
@@ -153,12 +2594,57 @@ class SetupLogik:
                 if vorname and nachname:  # Nur hinzufügen, wenn beide Felder gefüllt sind
                     spieler_daten.append((vorname, nachname))
             
+            spieler_daten, doppelt = SpielerRegister.dedupliziere(spieler_daten)
+            if doppelt:
+                logging.info(f"Import: {len(doppelt)} doppelte Namen übersprungen")
             logging.info(f"Excel-Datei erfolgreich gelesen: {len(spieler_daten)} Spieler gefunden")
             return spieler_daten
         except Exception as e:
             logging.error(f"Fehler beim Lesen der Excel-Datei: {str(e)}")
             raise e
 
+    @gemessen("import_setzliste", "excel")
+    def import_setzliste(self, file_path):
+        # Setzliste aus früheren Ergebnissen: alle Blätter werden zeilenweise im read_only-Modus gelesen,
+        # je Spieler (normalisierter Name) werden Platzierungen, Gesamtpunkte und beste Runde zusammengefasst.
+        # Liefert [(vorname, nachname, {'platz': Ø-Platz, 'gesamt': Summe, 'beste': Max, 'turniere': n}), ...]
+        # in Setzreihenfolge: bester Durchschnittsplatz, dann mehr Punkte, dann beste Runde.
+        wb = lade_modul('openpyxl').load_workbook(file_path, read_only=True, data_only=True)
+        werte = {}
+        try:
+            for ws in wb.worksheets:
+                zeilen = ws.iter_rows(values_only=True)
+                kopf = [str(k).strip() if k is not None else "" for k in next(zeilen, ())]
+                if "Vorname" not in kopf or "Nachname" not in kopf:
+                    logging.info(f"Setzliste: Blatt '{ws.title}' ohne Namensspalten übersprungen")
+                    continue
+                spalte = {name: kopf.index(name) for name in ("Vorname", "Nachname", "Platzierung", "Gesamtpunktzahl", "Beste Runde")
+                          if name in kopf}
+                for row in zeilen:
+                    vorname = str(zellwert(row, spalte, "Vorname") or "").strip()
+                    nachname = str(zellwert(row, spalte, "Nachname") or "").strip()
+                    if not vorname or not nachname:
+                        continue
+                    eintrag = werte.setdefault(normalisiere_name(vorname, nachname),
+                                               [vorname, nachname, 0, 0, 0, 0, 0])                 # Name, Summe Plätze, Anzahl Plätze, gesamt, beste, Turniere
+                    platz, gesamt, beste = (zellwert(row, spalte, name) for name in ("Platzierung", "Gesamtpunktzahl", "Beste Runde"))
+                    if isinstance(platz, (int, float)):
+                        eintrag[2] += platz
+                        eintrag[3] += 1
+                    if isinstance(gesamt, (int, float)):
+                        eintrag[4] += gesamt
+                    if isinstance(beste, (int, float)):
+                        eintrag[5] = max(eintrag[5], beste)
+                    eintrag[6] += 1
+        finally:
+            wb.close()
+        setzliste = [(v, n, {'platz': summe_platz / anz_platz if anz_platz else None, 'gesamt': gesamt,
+                             'beste': beste, 'turniere': turniere})
+                     for v, n, summe_platz, anz_platz, gesamt, beste, turniere in werte.values()]
+        setzliste.sort(key=lambda s: (s[2]['platz'] is None, s[2]['platz'] or 0, -s[2]['gesamt'], -s[2]['beste']))
+        logging.info(f"Setzliste gelesen: {len(setzliste)} Spieler aus {file_path}")
+        return setzliste
+
     def pruefeNamen(self, namen):
         # Ignoriere leere Zeilen am Ende
         gefilterte_namen = [(vorname, nachname) for vorname, nachname in namen if vorname or nachname]
@@ -178,6 +2664,8 @@ class SetupLogik:
         return gefuellte_zeilen >= 1
 
 class SetupWindow(QMainWindow):
+    schnitt_berechnet = pyqtSignal(object, object)                                                  # (Namen, erwarteter Schnitt) aus dem Hintergrund-Thread
+
     def __init__(self):
         super().__init__()
         self.logik = SetupLogik()
@@ -188,15 +2676,20 @@ class SetupWindow(QMainWindow):
         self.listeNachnamenFelder = []
         self.anzZeilen = self.logik.anzZeilen
         self.anzahl_spieler = 1
+        self._schnitt_cache = (None, None)                                                          # (Namen, erwarteter Schnitt) aus der Datenbank
+        self._schnitt_angefragt = None
+        self.schnitt_berechnet.connect(self._schnitt_uebernehmen)
         self.debounce_timer = QTimer()
         self.debounce_timer.setSingleShot(True)
         self.debounce_timer.timeout.connect(self._pruefeNamen_debounced)
         self.initUI()
+        startprofil.markiere("SetupWindow.initUI")
 
     def is_android(self):
         import platform
         return platform.system().lower() == 'android' or 'android' in sys.platform.lower()
 
+    @gemessen("SetupWindow.initUI", "layout")
     def initUI(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -265,9 +2758,17 @@ class SetupWindow(QMainWindow):
         self.btn_start = QPushButton("Start")
         self.btn_start.clicked.connect(self.start)
         self.btn_import = QPushButton("Import aus Turnier")
-        self.btn_import.clicked.connect(self.importTurnier)
+        self.btn_import.clicked.connect(lambda: self.importTurnier())
+        self.btn_setzliste = QPushButton("Setzliste importieren")
+        self.btn_setzliste.setToolTip("Spieler aus früheren Ergebnissen übernehmen und nach Platzierung, Punkten und bester Runde ordnen")
+        self.btn_setzliste.clicked.connect(lambda: self.importTurnier(setzen=True))
+        self.btn_fortsetzen = QPushButton("Turnier fortsetzen")
+        self.btn_fortsetzen.clicked.connect(self.fortsetzen)
+        self.btn_fortsetzen.setEnabled(os.path.exists(ausgabe_pfad(const_autosave)))                # nur wenn ein nicht beendetes Turnier vorliegt
         button_layout.addWidget(self.btn_start)
         button_layout.addWidget(self.btn_import)
+        button_layout.addWidget(self.btn_setzliste)
+        button_layout.addWidget(self.btn_fortsetzen)
         main_layout.addLayout(button_layout)
 
         self.spieler_grid = QGridLayout()
@@ -280,7 +2781,17 @@ class SetupWindow(QMainWindow):
         main_layout.addLayout(self.spieler_grid)
 
         self.update_schaetzung()
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, activated=trace.umschalten)
+        QShortcut(QKeySequence("Ctrl+Shift+I"), self, activated=lambda: QMessageBox.information(
+            self, "Startzeiten", startprofil.bericht() + "\n\nVerzögerte Importe:\n" + importbericht()))
+        QShortcut(QKeySequence("Ctrl+Q"), self, activated=QApplication.quit)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not startprofil.abgeschlossen:
+            startprofil.abschliessen()
 
+    @gemessen("ergaenzeZeile", "layout")
     def ergaenzeZeile(self, zeile):
         ent_vorname = QLineEdit()
         ent_nachname = QLineEdit()
@@ -294,6 +2805,7 @@ class SetupWindow(QMainWindow):
     def pruefeNamen(self):
         self.debounce_timer.start(200)
 
+    @gemessen("pruefeNamen")
     def _pruefeNamen_debounced(self):
         namen = [(f.text().strip(), n.text().strip()) for f, n in zip(self.listeVornamenFelder, self.listeNachnamenFelder)]
         
@@ -323,6 +2835,14 @@ class SetupWindow(QMainWindow):
             logging.debug(f"Neue Zeile hinzugefügt: {self.anzZeilen}")
         #self.update_schaetzung()
 
+    def setze_namen(self, zeile, vorname, nachname):
+        self.listeVornamenFelder[zeile].blockSignals(True)
+        self.listeNachnamenFelder[zeile].blockSignals(True)
+        self.listeVornamenFelder[zeile].setText(vorname)
+        self.listeNachnamenFelder[zeile].setText(nachname)
+        self.listeVornamenFelder[zeile].blockSignals(False)
+        self.listeNachnamenFelder[zeile].blockSignals(False)
+
     def update_highscoreRunden_label(self):
         modus = self.combo_modus.currentText()
         if modus == "Highscore":
@@ -333,11 +2853,46 @@ class SetupWindow(QMainWindow):
             self.lbl_erklaerung.setText(f"Das Spiel endet nach {self.ent_highscoreRunden.text().strip()} Runden.")
         self.update_schaetzung()
 
+    def erwarteter_schnitt(self):
+        # Bester erwarteter Aufnahme-Schnitt der eingetragenen Spieler aus ihren gespeicherten Würfen.
+        # Datenbank und Erwartungskarte laufen in einem Hintergrund-Thread; bis das Ergebnis da ist, None
+        pfad = TurnierDatenbank.pfad_aus_umgebung()
+        namen = tuple((f.text().strip(), n.text().strip()) for f, n in zip(self.listeVornamenFelder, self.listeNachnamenFelder)
+                      if f.text().strip() and n.text().strip())
+        if pfad is None or not namen or not os.path.exists(pfad):
+            return None
+        if self._schnitt_cache[0] == namen:
+            return self._schnitt_cache[1]
+        if self._schnitt_angefragt != namen:
+            self._schnitt_angefragt = namen
+            threading.Thread(target=self._berechne_schnitt, args=(pfad, namen), name="Schnitt", daemon=True).start()
+        return None
+
+    def _berechne_schnitt(self, pfad, namen):
+        try:
+            fits = StreuungsSchaetzer.aus_datenbank(pfad, namen)
+            schnitt = max((fit.erwartete_aufnahme() for fit in fits.values()), default=None)
+        except sqlite3.Error as e:
+            logging.warning(f"Streuungsmodelle nicht lesbar: {e}")
+            schnitt = None
+        try:
+            self.schnitt_berechnet.emit(namen, schnitt)
+        except RuntimeError:
+            pass                                                                                    # Fenster inzwischen geschlossen
+
+    def _schnitt_uebernehmen(self, namen, schnitt):
+        self._schnitt_cache = (namen, schnitt)
+        if self._schnitt_angefragt == namen:
+            self._schnitt_angefragt = None
+        self.update_schaetzung()
+
     def update_schaetzung(self):
-        t = self.logik.schaetzeZeit(self.combo_modus.currentText(), self.ent_highscoreRunden.text().strip(), self.anzahl_spieler)
+        schnitt = self.erwarteter_schnitt() if self.combo_modus.currentText() == "Highscore" else None
+        t = self.logik.schaetzeZeit(self.combo_modus.currentText(), self.ent_highscoreRunden.text().strip(), self.anzahl_spieler, schnitt)
         self.lbl_schaetzung.setText(f"Geschätzte Spielzeit: {t[0]} h, {t[1]} min")
 
-    def importTurnier(self):
+    @gemessen("importTurnier")
+    def importTurnier(self, setzen=False):
         if self.is_android():
             try:
                 from jnius import autoclass
@@ -360,7 +2915,11 @@ class SetupWindow(QMainWindow):
             return
 
         try:
-            spieler_daten = self.logik.import_spieler_excel(file_path)
+            if setzen:
+                setzliste = self.logik.import_setzliste(file_path)
+                spieler_daten = [(vorname, nachname) for vorname, nachname, _ in setzliste]
+            else:
+                spieler_daten = self.logik.import_spieler_excel(file_path)
 
             if not spieler_daten:
                 QMessageBox.information(self, "Fehler", "Die ausgewählte Excel-Datei enthält keine gültigen Spielerdaten.")
@@ -371,6 +2930,10 @@ class SetupWindow(QMainWindow):
                 (f.text().strip(), n.text().strip())
                 for f, n in zip(self.listeVornamenFelder, self.listeNachnamenFelder)
             ]
+            spieler_daten, doppelt = SpielerRegister.dedupliziere(spieler_daten, [n for n in bestehende_namen if all(n)])
+            if not spieler_daten and not setzen:
+                QMessageBox.information(self, "Import", "Alle Spieler der Datei sind bereits eingetragen.")
+                return
             erste_leere_zeile = 0
             for i, (vorname, nachname) in enumerate(bestehende_namen):
                 if not vorname and not nachname:
@@ -381,23 +2944,32 @@ class SetupWindow(QMainWindow):
                     return
                 erste_leere_zeile = i + 1
 
+            namen = spieler_daten
+            if setzen:
+                # Alle Spieler nach der Setzliste ordnen und ab Zeile 1 neu schreiben; unbekannte behalten ihre Reihenfolge am Ende
+                rang = {normalisiere_name(v, n): i for i, (v, n, _) in enumerate(setzliste)}
+                namen = sorted([name for name in bestehende_namen if all(name)] + spieler_daten,
+                               key=lambda name: rang.get(normalisiere_name(*name), len(rang)))
+                erste_leere_zeile = 0
+
             # Füge neue Zeilen hinzu, falls nötig
-            benötigte_zeilen = erste_leere_zeile + len(spieler_daten) + 1 - len(self.listeVornamenFelder)
+            benötigte_zeilen = erste_leere_zeile + len(namen) + 1 - len(self.listeVornamenFelder)
             for _ in range(max(0, benötigte_zeilen)):
                 self.anzZeilen += 1
                 self.ergaenzeZeile(self.anzZeilen)
 
             # Trage importierte Namen ein
-            for i, (vorname, nachname) in enumerate(spieler_daten):
-                zeile = erste_leere_zeile + i
-                self.listeVornamenFelder[zeile].blockSignals(True)
-                self.listeNachnamenFelder[zeile].blockSignals(True)
-                self.listeVornamenFelder[zeile].setText(vorname)
-                self.listeNachnamenFelder[zeile].setText(nachname)
-                self.listeVornamenFelder[zeile].blockSignals(False)
-                self.listeNachnamenFelder[zeile].blockSignals(False)
-
-            QMessageBox.information(self, "Erfolg", f"{len(spieler_daten)} Spieler erfolgreich importiert.")
+            for i, (vorname, nachname) in enumerate(namen):
+                self.setze_namen(erste_leere_zeile + i, vorname, nachname)
+
+            if setzen:
+                # Restliche Zeilen leeren, sonst stehen Spieler hinter einer Lücke doppelt in der Liste
+                for zeile in range(len(namen), len(self.listeVornamenFelder)):
+                    self.setze_namen(zeile, "", "")
+                logging.info(f"Spieler nach Setzliste geordnet: {len(namen)}")
+
+            hinweis = f"\n{len(doppelt)} bereits eingetragene Spieler übersprungen." if doppelt else ""
+            QMessageBox.information(self, "Erfolg", f"{len(spieler_daten)} Spieler erfolgreich importiert.{hinweis}")
             self.update_schaetzung()
         except Exception as e:
             error_msg = str(e).encode('ascii', 'replace').decode('ascii')
@@ -432,7 +3004,17 @@ class SetupWindow(QMainWindow):
             if nachname and not re.match(r'^[a-zA-ZäöüÄÖÜß\-\s]+$', nachname):
                 QMessageBox.critical(self, "Fehler", f"Zeile {i+1}: Ungültiger Nachname: {nachname}")
                 return
+            # Die Turnierdatei speichert Namen mit fester Breite; gekürzt fände das Register den Spieler beim Fortsetzen nicht wieder
+            if not TurnierDatei.passt(vorname) or not TurnierDatei.passt(nachname):
+                QMessageBox.critical(self, "Fehler", f"Zeile {i+1}: Vor- und Nachname dürfen höchstens "
+                                                     f"{TurnierDatei.const_nameBytes} Byte lang sein (Umlaute zählen doppelt).")
+                return
         
+        _, doppelt = SpielerRegister.dedupliziere([(v, n) for v, n in namen if v and n])
+        if doppelt:
+            QMessageBox.critical(self, "Fehler", "Doppelt eingetragen: " + ", ".join(f"{v} {n}" for v, n in doppelt))
+            return
+
         self.spielerliste = []
         for i, (vorname, nachname) in enumerate(namen):
             if vorname and nachname:
@@ -441,6 +3023,28 @@ class SetupWindow(QMainWindow):
         if not self.spielerliste:
             QMessageBox.critical(self, "Fehler", "Mindestens ein Spieler muss eingetragen werden!")
             return
+
+        # Ein nicht beendetes Turnier im Autosave wird sonst beiseitegelegt (autosave_<Zeit>.drt)
+        offen = TurnierDatei.offene_runden(ausgabe_pfad(const_autosave))
+        if offen:
+            antwort = QMessageBox.question(self, "Nicht beendetes Turnier",
+                                           f"Es gibt ein nicht beendetes Turnier mit {offen} Runden.\n"
+                                           "Dieses Turnier fortsetzen statt ein neues zu beginnen?",
+                                           QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel)
+            if antwort == QMessageBox.Yes:
+                self.fortsetzen()
+                return
+            if antwort != QMessageBox.No:
+                return
+
+        # Register erst jetzt fortschreiben, abgebrochene Starts hinterlassen keine Einträge
+        register = SpielerRegister.laden()
+        for s in self.spielerliste:
+            s.id = register.id_von(s.vorname, s.nachname)
+        try:
+            register.speichern()
+        except OSError as e:
+            logging.error(f"Spieler-Register nicht gespeichert: {e}")
         
         # Starte SpielWindow
         if self.combo_modus.currentText() == "Highscore":
@@ -452,8 +3056,177 @@ class SetupWindow(QMainWindow):
         self.spiel_window.showMaximized()
         self.close()
 
+    @gemessen("fortsetzen")
+    def fortsetzen(self):
+        # Nicht beendetes Turnier aus dem Autosave laden; das Passwort kommt aus den Setup-Feldern
+        if self.ent_passwort.text() != self.ent_passwort2.text():
+            QMessageBox.critical(self, "Fehler", "Passwörter stimmen nicht überein!")
+            return
+        try:
+            datei = TurnierDatei.oeffnen(ausgabe_pfad(const_autosave))
+        except (OSError, ValueError, struct.error) as e:
+            QMessageBox.critical(self, "Fehler", f"Turnier konnte nicht geladen werden: {e}")
+            logging.error(f"Autosave nicht lesbar: {e}")
+            return
+        register = SpielerRegister.laden()
+        for spieler in datei.spielerliste:
+            spieler.id = register.id_von(spieler.vorname, spieler.nachname)
+        try:
+            register.speichern()
+        except OSError as e:
+            logging.error(f"Spieler-Register nicht gespeichert: {e}")
+        self.spielerliste = datei.spielerliste
+        self.modus = datei.modus
+        self.spiel_window = SpielGUI(datei.spielerliste, datei.modus, str(datei.hr), self.ent_passwort.text(), fortsetzen=datei)
+        self.spiel_window.showMaximized()
+        self.close()
+
+class BefehlsVerlauf:
+    # Rückgängig/Wiederholen mit konstantem Aufwand pro Schritt; die Tiefe ist begrenzt,
+    # damit ein langer Turnierabend keinen Speicher ansammelt.
+    const_maxSchritte = 200
+
+    def __init__(self):
+        self.rueckgaengig = collections.deque(maxlen=self.const_maxSchritte)
+        self.wiederholen = []
+
+    def aufzeichnen(self, befehl):
+        self.rueckgaengig.append(befehl)
+        self.wiederholen.clear()
+
+    def nimm_rueckgaengig(self):
+        if not self.rueckgaengig:
+            return None
+        befehl = self.rueckgaengig.pop()
+        self.wiederholen.append(befehl)
+        return befehl
+
+    def nimm_wiederholen(self):
+        if not self.wiederholen:
+            return None
+        befehl = self.wiederholen.pop()
+        self.rueckgaengig.append(befehl)
+        return befehl
+
+    def kann_rueckgaengig(self):
+        return bool(self.rueckgaengig)
+
+    def kann_wiederholen(self):
+        return bool(self.wiederholen)
+
+    def leeren(self):
+        self.rueckgaengig.clear()
+        self.wiederholen.clear()
+
+
+# Befehle für den Verlauf: ausfuehren() liefert True, wenn sich etwas geändert hat,
+# rueckgaengig() stellt den beim Anlegen gesicherten Zustand wieder her.
+class WurfBefehl:
+    def __init__(self, spiel_gui, punktzahl, position=None):
+        self.punktzahl = punktzahl
+        self.position = position
+        self.zustand = spiel_gui.sichere_zustand()
+        self.spieler = spiel_gui.index_spieler
+        self.runde = spiel_gui.offset_runde + spiel_gui.index_runde
+        self.text = spiel_gui.tabelle.item(spiel_gui.index_spieler, spiel_gui.index_runde).text()
+        self.inhalt = spiel_gui.speicher.inhalt(self.spieler, self.runde)
+
+    def ausfuehren(self, spiel_gui):
+        anzahl = spiel_gui.wurf_count
+        spiel_gui.verarbeite_wurf(self.punktzahl, self.position)
+        return anzahl < 3
+
+    def rueckgaengig(self, spiel_gui):
+        spiel_gui.setze_zelle(self.spieler, self.runde, *self.inhalt, text=self.text)
+        spiel_gui.stelle_zustand_her(self.zustand)
+
+
+class SammelBefehl:
+    # Mehrere Würfe aus einer Schnelleingabe als ein Schritt im Verlauf
+    def __init__(self, punkte):
+        self.punkte = punkte
+        self.befehle = None
+
+    def ausfuehren(self, spiel_gui):
+        if self.befehle is None:
+            self.befehle = []
+            for punktzahl in self.punkte:
+                befehl = WurfBefehl(spiel_gui, punktzahl)
+                if befehl.ausfuehren(spiel_gui):
+                    self.befehle.append(befehl)
+        else:
+            for befehl in self.befehle:
+                befehl.ausfuehren(spiel_gui)
+        return bool(self.befehle)
+
+    def rueckgaengig(self, spiel_gui):
+        for befehl in reversed(self.befehle):
+            befehl.rueckgaengig(spiel_gui)
+
+
+class EinfuegeBefehl:
+    # Eingefügter Block oder eine als Summe eingegebene Aufnahme (spieler, runde, wuerfe, summe);
+    # für Rückgängig werden nur die überschriebenen Zellen gemerkt
+    def __init__(self, spiel_gui, eintraege):
+        self.zustand = spiel_gui.sichere_zustand()
+        self.eintraege = eintraege
+        self.vorher = [(spieler, runde) + spiel_gui.speicher.inhalt(spieler, runde)
+                       for spieler, runde, _, _ in eintraege]
+        self.texte = [spiel_gui.tabelle.item(spieler, runde - spiel_gui.offset_runde).text()
+                      for spieler, runde, _, _ in eintraege]
+
+    def ausfuehren(self, spiel_gui):
+        spiel_gui.setze_zellen(self.eintraege)
+        spiel_gui.temp_würfe = []
+        spiel_gui.wurf_count = 0
+        spiel_gui.finde_nächste_zelle(1)
+        return True
+
+    def rueckgaengig(self, spiel_gui):
+        spiel_gui.setze_zellen(self.vorher, self.texte)
+        spiel_gui.stelle_zustand_her(self.zustand)
+
+
+class AuswahlBefehl:
+    def __init__(self, spiel_gui, row, col, vorherige_row, vorherige_col):
+        self.zelle = (row, col)
+        self.zustand = spiel_gui.sichere_zustand((vorherige_row, vorherige_col))
+
+    def ausfuehren(self, spiel_gui):
+        if spiel_gui.tabelle.currentRow() != self.zelle[0] or spiel_gui.tabelle.currentColumn() != self.zelle[1]:
+            spiel_gui.tabelle.setCurrentCell(*self.zelle)                                           # beim Wiederholen
+        else:
+            spiel_gui.zelle_ausgewaehlt(*self.zelle)
+        return True
+
+    def rueckgaengig(self, spiel_gui):
+        spiel_gui.stelle_zustand_her(self.zustand)
+
+
+class AbgabeBefehl:
+    def __init__(self, spiel_gui):
+        self.zustand = spiel_gui.sichere_zustand()
+        runde = spiel_gui.speicher.anz_runden() + 1
+        self.beste = list(spiel_gui.speicher.beste)
+        self.zellen = {s: spiel_gui.speicher.inhalt(s, runde) for s in range(len(spiel_gui.spielerliste))}
+        self.positionen = {s: list(spiel_gui.positionen[(s, runde)])                                # abgabe entnimmt sie für Datenbank und Autosave
+                           for s in range(len(spiel_gui.spielerliste)) if (s, runde) in spiel_gui.positionen}
+
+    def ausfuehren(self, spiel_gui):
+        anzahl = spiel_gui.speicher.anz_runden()
+        spiel_gui.abgabe()
+        return spiel_gui.speicher.anz_runden() > anzahl
+
+    def rueckgaengig(self, spiel_gui):
+        spiel_gui.abgabe_zuruecknehmen(self.beste, self.zellen, self.positionen)
+        spiel_gui.stelle_zustand_her(self.zustand)
+
+
 class SpielGUI(QMainWindow):
-    def __init__(self, spielerliste, modus, hr, passwort):
+    deltas_empfangen = pyqtSignal(list)                                                             # Deltas aus dem Server-Thread, in den GUI-Thread übergeben
+    turnier_angelegt = pyqtSignal(int)                                                              # Turnier-ID aus dem Datenbank-Thread
+
+    def __init__(self, spielerliste, modus, hr, passwort, fortsetzen=None):
         super().__init__()
         self.spielerliste = spielerliste
         self.modus = modus
@@ -465,14 +3238,152 @@ class SpielGUI(QMainWindow):
         self.index_spieler = 0
         self.index_runde = 1
         self.offset_runde = 0
-        self.punkte = []
+        self.speicher = PunkteSpeicher(spielerliste)
+        self.punkte = self.speicher.runden
+        self.plaetze = self.speicher.plaetze()
         self.fortschritt = 0
+        self.verlauf = BefehlsVerlauf()
+        self.heatmap = TrefferHeatmap()
+        self._im_befehl = True                                                                      # Anfangsauswahl beim Aufbau nicht aufzeichnen
         self.initUI()
+        self._im_befehl = False
+        if env_schalter('DARTS_PROFIL'):
+            profiler.start()
+        self.server = None
+        if env_schalter('DARTS_SERVER'):
+            self.starte_server()
+        self.anzeige_server = None
+        if env_schalter('DARTS_HTTP'):
+            self.starte_anzeige_server()
+        # Beobachter erhalten zellen_geaendert, runde_abgegeben und plaetze_geaendert
+        self.statistik = Statistik(len(spielerliste))
+        self.streuung = StreuungsSchaetzer(len(spielerliste))
+        self.beobachter = [self.statistik]
+        self.verteiler = None
+        if env_schalter('DARTS_DELTA'):
+            wert = os.environ.get('DARTS_DELTA', '').strip()
+            port = int(wert) if wert.isdigit() and wert != '1' else const_deltaPort
+            self.verteiler = DeltaVerteiler(self.spielerliste, self.speicher,
+                                            host=os.environ.get('DARTS_DELTA_HOST', '127.0.0.1'), port=port)
+            self.verteiler.start()
+            self.beobachter.append(self.verteiler)
+        self.datenbank = None
+        self.positionen = {}                                                                        # (spieler, runde) -> Trefferpunkte der Würfe für die Datenbank
+        if env_schalter('DARTS_DB'):
+            self.starte_datenbank(fortsetzen.turnier_id if fortsetzen is not None else None)
+        self.zuschauer_fenster = None
+        self.verlauf_fenster = None
+        self.autosave = fortsetzen
+        if fortsetzen is not None:
+            self.lade_runden(fortsetzen)
+        elif env_schalter('DARTS_AUTOSAVE', True):
+            try:
+                TurnierDatei.beiseite_legen(ausgabe_pfad(const_autosave))
+                self.autosave = TurnierDatei.anlegen(ausgabe_pfad(const_autosave), spielerliste, modus, hr)
+            except OSError as e:
+                logging.error(f"Autosave nicht möglich: {e}")
+        if env_schalter('DARTS_ZUSCHAUER'):
+            QTimer.singleShot(0, self.zeige_zuschauer_fenster)
+
+    def benachrichtige(self, methode, *argumente):
+        for beobachter in self.beobachter:
+            getattr(beobachter, methode)(*argumente)
+
+    def zeige_zuschauer_fenster(self):
+        if self.zuschauer_fenster is None:
+            self.zuschauer_fenster = ZuschauerFenster(self)
+            self.beobachter.append(self.zuschauer_fenster.modell)
+        self.zuschauer_fenster.zeige()
+
+    def zeige_rundenverlauf(self):
+        if self.verlauf_fenster is None:
+            self.verlauf_fenster = RundenverlaufFenster(self)
+            self.beobachter.append(self.verlauf_fenster.modell)
+        self.verlauf_fenster.show()
+        self.verlauf_fenster.raise_()
+
+    def starte_anzeige_server(self):
+        # Port aus DARTS_HTTP, "1" bedeutet Standardport
+        wert = os.environ.get('DARTS_HTTP', '').strip()
+        port = int(wert) if wert.isdigit() and wert != '1' else const_httpPort
+        try:
+            self.anzeige_server = AnzeigeServer(self.spielerliste, self.speicher,
+                                                host=os.environ.get('DARTS_HTTP_HOST', '127.0.0.1'), port=port)
+            self.anzeige_server.start()
+        except OSError as e:
+            self.anzeige_server = None
+            logging.error(f"Anzeige-Server konnte nicht gestartet werden: {e}")
+
+    def starte_server(self):
+        # Port aus DARTS_SERVER, "1" bedeutet Standardport
+        wert = os.environ.get('DARTS_SERVER', '').strip()
+        port = int(wert) if wert.isdigit() and wert != '1' else const_serverPort
+        self.deltas_empfangen.connect(self.uebernehme_deltas)
+        self.server = PunkteServer(self.speicher, host=os.environ.get('DARTS_SERVER_HOST', '127.0.0.1'),
+                                   port=port, bei_deltas=self.deltas_empfangen.emit)
+        self.server.start()
+
+    def starte_datenbank(self, turnier_id=None):
+        # Pfad aus DARTS_DB, "1" bedeutet darts.sqlite neben darts.log; turnier_id beim Fortsetzen
+        self.datenbank = TurnierDatenbank(TurnierDatenbank.pfad_aus_umgebung())
+        try:
+            self.datenbank.start()
+        except sqlite3.Error as e:
+            logging.error(f"Datenbank {self.datenbank.pfad} nicht verfügbar: {e}")
+            self.datenbank = None
+            return
+        self.turnier_angelegt.connect(self.merke_turnier_id)
+        self.datenbank.starte_turnier(self.spielerliste, self.modus, int(self.hr) if str(self.hr).isdigit() else None,
+                                      turnier_id=turnier_id, bei_turnier=self.turnier_angelegt.emit)
+
+    def merke_turnier_id(self, turnier_id):
+        # Turnier-ID im Autosave ablegen, damit ein Fortsetzen dasselbe Turnier weiterschreibt
+        if self.autosave is not None and self.autosave.turnier_id != turnier_id:
+            try:
+                self.autosave.setze_turnier_id(turnier_id)
+            except OSError as e:
+                logging.error(f"Turnier-ID nicht im Autosave gespeichert: {e}")
+
+    @gemessen("lade_runden")
+    def lade_runden(self, datei):
+        # Abgeschlossene Runden eines fortgesetzten Turniers übernehmen
+        runden = []
+        for runde, werte in enumerate(datei.summen_je_runde(), 1):
+            wuerfe = datei.wuerfe(runde)
+            self.speicher.runde_abschliessen(werte)
+            self.statistik.zellen_geaendert([(spieler, runde, wert, len(wuerfe[spieler][0]))
+                                             for spieler, wert in enumerate(werte)])
+            runden.append((runde, werte, wuerfe))
+        if self.datenbank is not None:
+            self.datenbank.runden_nachtragen(runden)
+        datei.runden = None                                                                         # mmap freigeben, die Datei wird ab jetzt fortgeschrieben
+        self.offset_runde = self.speicher.anz_runden()
+        self.tabelle.setHorizontalHeaderLabels(self.kopfzeile())
+        self.aktualisiere_rangliste()
+        if self.anzeige_server is not None:                                                         # läuft schon, zeigte bisher einen leeren Stand
+            self.anzeige_server.aktualisiere()
+        QTimer.singleShot(0, self.update_fortschritt)                                               # ein bereits beendetes Turnier erst nach dem Aufbau abschließen
+        logging.info(f"Turnier aus {datei.pfad} fortgesetzt: {self.offset_runde} Runden")
+
+    @gemessen("uebernehme_deltas")
+    def uebernehme_deltas(self, deltas):
+        # Vom Server übernommene Zellen im sichtbaren Rundenfenster aktualisieren (ein Neuzeichnen)
+        self.tabelle.setUpdatesEnabled(False)
+        try:
+            for spieler, runde, summe, anzahl in deltas:
+                col = runde - self.offset_runde
+                if 1 <= col <= const_anzeigeRunden:
+                    self.tabelle.item(spieler, col).setText("---" if summe is None else str(summe))
+        finally:
+            self.tabelle.setUpdatesEnabled(True)
+        self.benachrichtige('zellen_geaendert', deltas)
+        self.abgeben_button.setEnabled(self.prüfe_abgabebereit())
         
     def is_android(self):
         import platform
         return platform.system().lower() == 'android' or 'android' in sys.platform.lower()
 
+    @gemessen("SpielGUI.initUI", "layout")
     def initUI(self):
         central_widget = QWidget()                                                                  # Erstelle das zentrale Widget, das alle GUI-Elemente enthält
         self.setCentralWidget(central_widget)                                                       # Setze das zentrale Widget als Hauptinhalt des Fensters
@@ -498,10 +3409,7 @@ class SpielGUI(QMainWindow):
         self.dartscheibe_label = DartscheibeLabel()                                                 # Erstelle ein QLabel, das die Dartscheibe-Grafik anzeigen wird
         self.dartscheibe_label.set_spiel_gui(self)
         try:                                                                                        # Versuche, Ressource zu laden
-            pixmap = QPixmap(":/dartscheibe.png")
-            if pixmap.isNull():
-                # Fallback: Lade aus Dateisystem
-                pixmap = QPixmap("dartscheibe.png")
+            pixmap = lade_scheibe()
             if pixmap.isNull():                                                                     # Prüfe, ob das Bild erfolgreich geladen wurde
                 raise FileNotFoundError("Dartscheibe-Grafik nicht gefunden")                        # Wenn das Bild nicht geladen werden konnte, löse eine Ausnahme aus
             self.dartscheibe_label.set_pixmap(pixmap)                                               # Skaliere das Bild, behalte das Seitenverhältnis bei
@@ -513,6 +3421,16 @@ class SpielGUI(QMainWindow):
         dartscheibe_layout.addWidget(self.dartscheibe_label)                                        # Füge das QLabel zum vertikalen Layout hinzu
         dartscheibe_layout.addWidget(self.punktzahl_label)
         dartscheibe_layout.addWidget(self.status_label)
+        self.eingabe_feld = QLineEdit()                                                             # Schnelleingabe per Tastatur/Ziffernblock, z. B. "T20 T20 5" oder "=85"
+        self.eingabe_feld.setPlaceholderText("Schnelleingabe: T20 D16 25 oder =Aufnahme (Strg+E)")
+        self.eingabe_feld.returnPressed.connect(self.schnelleingabe)
+        dartscheibe_layout.addWidget(self.eingabe_feld)
+        self.combo_heatmap = QComboBox()
+        self.combo_heatmap.addItems(["Trefferbild aus", "Trefferbild: alle Spieler"] +
+                                    [f"Trefferbild: {s.vorname} {s.nachname}" for s in self.spielerliste])
+        self.combo_heatmap.currentIndexChanged.connect(self.waehle_heatmap)
+        dartscheibe_layout.addWidget(self.combo_heatmap)
+        QShortcut(QKeySequence("Ctrl+E"), self, activated=self.eingabe_feld.setFocus)
         
         # Fortschrittsbalken erstellen
         self.progress_bar = QProgressBar(self)
@@ -529,9 +3447,8 @@ class SpielGUI(QMainWindow):
         tabelle_layout = QVBoxLayout()                                                              # Erstelle ein vertikales Layout für die Tabelle
         self.tabelle = QTableWidget()                                                               # Erstelle eine QTableWidget für die Punktetabelle
         self.tabelle.setRowCount(len(self.spielerliste))                                            # Setze die Anzahl der Zeilen basierend auf der Anzahl der Spieler
-        self.tabelle.setColumnCount(const_anzeigeRunden + 1)                                        # Setze die Anzahl der Spalten: 1 für Spielernamen + const_anzeigeRunden für Runden + 1 für Gesamtpunktzahl
-        self.tabelle.setHorizontalHeaderLabels(["Spieler"] + [f"Runde {i+1}" for i in range(const_anzeigeRunden)]) # Definiere die Spaltenüberschriften: "Spieler", "Runde 1" bis "Runde 8", "Gesamt"
-        #self.tabelle.setHorizontalHeaderLabels(["Spieler"] + [f"Runde {i+1}" for i in range(const_anzeigeRunden)] + ["Gesamt"])
+        self.tabelle.setColumnCount(const_anzeigeRunden + 3)                                        # Setze die Anzahl der Spalten: 1 für Spielernamen + const_anzeigeRunden für Runden + Gesamt + Platz
+        self.tabelle.setHorizontalHeaderLabels(self.kopfzeile())                                    # Definiere die Spaltenüberschriften: "Spieler", "Runde 1" bis "Runde 8", "Gesamt", "Platz"
         
         for i, spieler in enumerate(self.spielerliste):                                             # Fülle die erste Spalte mit Spielernamen (nicht editierbar)
             item = QTableWidgetItem(f"{spieler.vorname} {spieler.nachname}")                        # Erstelle ein Tabellenelement mit Vor- und Nachnamen des Spielers
@@ -543,9 +3460,14 @@ class SpielGUI(QMainWindow):
                 item = QTableWidgetItem("---")                                                      # Erstelle ein Tabellenelement mit Startwert "---"
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)                                    # Deaktiviere die Bearbeitung für Punkte
                 self.tabelle.setItem(row, col, item)                                                # Setze das Element in der entsprechenden Zeile und Spalte
+            for col, wert in ((const_spalteGesamt, self.speicher.summen[row]), (const_spaltePlatz, self.plaetze[row])):
+                item = QTableWidgetItem(str(wert))                                                  # Gesamt und Platz werden bei jeder Abgabe nur per setText aktualisiert
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
+                item.setTextAlignment(Qt.AlignCenter)
+                self.tabelle.setItem(row, col, item)
         
         self.tabelle.setColumnWidth = 40                                                            # Spaltenbreite
-        self.tabelle.currentCellChanged.connect(self.zelle_ausgewaehlt)                                    # Verbinde das cellChanged-Signal mit der Methode
+        self.tabelle.currentCellChanged.connect(self.zelle_gewechselt)                              # Verbinde das cellChanged-Signal mit der Methode
         self.tabelle.setMinimumWidth(300)                                                           # Setze eine Mindestbreite für die Tabelle, um sie lesbar zu halten
         self.tabelle.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)                               # Aktiviere vertikales Scrollen, wenn viele Spieler vorhanden sind
         self.tabelle.setCurrentCell(self.index_spieler,self.index_runde)
@@ -554,16 +3476,205 @@ class SpielGUI(QMainWindow):
         # Buttons für Rundenmanagement
         button_layout = QHBoxLayout()
         self.abgeben_button = QPushButton("Runde abgeben")
-        self.abgeben_button.clicked.connect(self.abgabe)
+        self.abgeben_button.clicked.connect(lambda: self.fuehre_aus(AbgabeBefehl(self)))
         self.abgeben_button.setEnabled(False) 
         #self.überspringen_button = QPushButton("Überspringen")
         #self.überspringen_button.clicked.connect(self.runde_ueberspringen)
         button_layout.addWidget(self.abgeben_button)
         #button_layout.addWidget(self.überspringen_button)
+        self.rueckgaengig_button = QPushButton("Rückgängig")
+        self.rueckgaengig_button.clicked.connect(self.rueckgaengig)
+        self.rueckgaengig_button.setEnabled(False)
+        self.wiederholen_button = QPushButton("Wiederholen")
+        self.wiederholen_button.clicked.connect(self.wiederholen)
+        self.wiederholen_button.setEnabled(False)
+        button_layout.addWidget(self.rueckgaengig_button)
+        button_layout.addWidget(self.wiederholen_button)
+        QShortcut(QKeySequence.Undo, self, activated=self.rueckgaengig)
+        QShortcut(QKeySequence.Redo, self, activated=self.wiederholen)
+        QShortcut(QKeySequence.Paste, self.tabelle, activated=self.einfuegen)
+        self.verlauf_button = QPushButton("Rundenverlauf")
+        self.verlauf_button.clicked.connect(self.zeige_rundenverlauf)
+        button_layout.addWidget(self.verlauf_button)
+        self.chk_nach_platz = QCheckBox("Nach Platz sortieren")
+        self.chk_nach_platz.toggled.connect(self.sortiere_nach_platz)
+        button_layout.addWidget(self.chk_nach_platz)
         tabelle_layout.addLayout(button_layout)
         
         main_layout.addLayout(tabelle_layout,3)                                                       # Füge das Tabellen-Layout zum Hauptlayout hinzu (rechte Hälfte)
 
+        # Verstecktes Debug-Menü: Rechtsklick bzw. langer Druck auf die Statuszeile
+        self.latenz_panel = None
+        self.status_label.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.status_label.customContextMenuRequested.connect(self.zeige_debug_menue)
+        QShortcut(QKeySequence("Ctrl+Shift+L"), self, activated=self.zeige_latenz_panel)
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=latenz.dump)
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, activated=trace.umschalten)
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=profiler.umschalten)
+        QShortcut(QKeySequence("Ctrl+Shift+A"), self, activated=self.zeige_zuschauer_fenster)
+
+    def zeige_debug_menue(self, pos):
+        menue = QMenu(self)
+        aktion_messung = menue.addAction("Latenzmessung aktiv")
+        aktion_messung.setCheckable(True)
+        aktion_messung.setChecked(latenz.aktiv)
+        aktion_messung.toggled.connect(latenz.setze_aktiv)
+        menue.addAction("Zuschauer-Anzeige öffnen", self.zeige_zuschauer_fenster)
+        menue.addAction("Zielberatung nach Streuung", self.zeige_zielberatung)
+        menue.addSeparator()
+        menue.addAction("Latenzen anzeigen", self.zeige_latenz_panel)
+        menue.addAction("Latenzen speichern", latenz.dump)
+        menue.addSeparator()
+        menue.addAction("Trace stoppen und speichern" if trace.aktiv else "Trace starten", trace.umschalten)
+        menue.addAction("Start- und Importzeiten", lambda: QMessageBox.information(
+            self, "Startzeiten", startprofil.bericht() + "\n\nVerzögerte Importe:\n" + importbericht()))
+        menue.addAction("Profiling beenden" if profiler.aktiv else "Profiling starten (cProfile/tracemalloc)", profiler.umschalten)
+        menue.exec_(self.status_label.mapToGlobal(pos))
+
+    @gemessen("zeige_zielberatung")
+    def zeige_zielberatung(self):
+        # Bester Zielpunkt und erwartete Punkte je Wurf für typische Streuungen (virtuelle Einheiten)
+        zeilen = []
+        for sigma in (5, 10, 20, 40):
+            x, y, wert = Erwartungskarte.fuer(sigma).bester_zielpunkt()
+            zeilen.append(f"Streuung {sigma:>2}: {feld_name(*feld_virtuell(x, y))} anvisieren, {wert:.1f} Punkte je Wurf")
+        QMessageBox.information(self, "Zielberatung", "\n".join(zeilen))
+
+    def zeige_latenz_panel(self):
+        if self.latenz_panel is None:
+            self.latenz_panel = LatenzPanel(self)
+        self.latenz_panel.show()
+        self.latenz_panel.raise_()
+
+    def zelle_gewechselt(self, current_row, current_column, previous_row, previous_column):
+        # Auswahl durch den Benutzer aufzeichnen; Cursorbewegungen innerhalb eines Befehls nicht
+        if self._im_befehl:
+            self.zelle_ausgewaehlt(current_row, current_column)
+        else:
+            self.fuehre_aus(AuswahlBefehl(self, current_row, current_column, previous_row, previous_column))
+
+    def fuehre_aus(self, befehl):
+        if self._im_befehl:
+            befehl.ausfuehren(self)
+            return
+        self._im_befehl = True
+        try:
+            if befehl.ausfuehren(self):
+                self.verlauf.aufzeichnen(befehl)
+        finally:
+            self._im_befehl = False
+        self.update_verlauf_buttons()
+
+    @gemessen("rueckgaengig")
+    def rueckgaengig(self):
+        befehl = self.verlauf.nimm_rueckgaengig()
+        if befehl is None:
+            return
+        self._im_befehl = True
+        try:
+            befehl.rueckgaengig(self)
+        finally:
+            self._im_befehl = False
+        self.update_verlauf_buttons()
+
+    @gemessen("wiederholen")
+    def wiederholen(self):
+        befehl = self.verlauf.nimm_wiederholen()
+        if befehl is None:
+            return
+        self._im_befehl = True
+        try:
+            befehl.ausfuehren(self)
+        finally:
+            self._im_befehl = False
+        self.update_verlauf_buttons()
+
+    def update_verlauf_buttons(self):
+        self.rueckgaengig_button.setEnabled(self.verlauf.kann_rueckgaengig())
+        self.wiederholen_button.setEnabled(self.verlauf.kann_wiederholen())
+
+    def sichere_zustand(self, zelle=None):
+        # Eingabezustand für Rückgängig: Cursor, Würfe der laufenden Aufnahme
+        if zelle is None:
+            zelle = (self.tabelle.currentRow(), self.tabelle.currentColumn())
+        return (self.index_spieler, self.index_runde, tuple(self.temp_würfe), self.wurf_count, zelle)
+
+    def stelle_zustand_her(self, zustand):
+        self.index_spieler, self.index_runde, temp_würfe, self.wurf_count, (row, col) = zustand
+        self.temp_würfe = list(temp_würfe)
+        self.tabelle.blockSignals(True)                                                             # kein erneutes zelle_ausgewaehlt, das die Würfe zurücksetzt
+        self.tabelle.setCurrentCell(row, col)
+        self.tabelle.blockSignals(False)
+        self.update_status_label()
+        self.abgeben_button.setEnabled(self.prüfe_abgabebereit())
+
+    def setze_zelle(self, spieler, runde, wuerfe, summe=None, text=None):
+        # Offene Zelle in Speicher und Tabelle setzen und alle Abnehmer informieren
+        delta = self.speicher.setze_zelle(spieler, runde, wuerfe, summe)
+        col = runde - self.offset_runde
+        if 1 <= col <= const_anzeigeRunden:
+            self.tabelle.item(spieler, col).setText(text if text is not None else ("---" if delta[2] is None else str(delta[2])))
+        if (spieler, runde) in self.positionen:                                                     # z. B. Rückgängig: nur noch vorhandene Würfe zählen
+            self.positionen[(spieler, runde)] = self.positionen[(spieler, runde)][:len(wuerfe)]
+            self.aktualisiere_treffer(spieler, runde)
+        if self.server is not None:
+            self.server.verteile([delta])
+        self.benachrichtige('zellen_geaendert', [delta])
+
+    @gemessen("setze_zellen")
+    def setze_zellen(self, eintraege, texte=None):
+        # Stapelvariante von setze_zelle: ein Neuzeichnen, ein Delta-Paket, eine Benachrichtigung
+        deltas = self.speicher.setze_zellen(eintraege)
+        self.tabelle.setUpdatesEnabled(False)
+        try:
+            for nr, (spieler, runde, summe, _) in enumerate(deltas):
+                col = runde - self.offset_runde
+                if 1 <= col <= const_anzeigeRunden:
+                    self.tabelle.item(spieler, col).setText(
+                        texte[nr] if texte is not None else ("---" if summe is None else str(summe)))
+        finally:
+            self.tabelle.setUpdatesEnabled(True)
+        if self.server is not None:
+            self.server.verteile(deltas)
+        self.benachrichtige('zellen_geaendert', deltas)
+        self.abgeben_button.setEnabled(self.prüfe_abgabebereit())
+
+    @gemessen("einfuegen")
+    def einfuegen(self):
+        # Block von Aufnahmen aus der Zwischenablage ab der aktuellen Zelle übernehmen
+        row, col = self.tabelle.currentRow(), self.tabelle.currentColumn()
+        text = QApplication.clipboard().text()
+        if row < 0 or not 1 <= col <= const_anzeigeRunden or not text.strip():
+            return
+        kopf = self.tabelle.verticalHeader()
+        zeile = kopf.visualIndex(row)                                                               # Tabelle kann nach Platz sortiert angezeigt werden
+        try:
+            hoehe, breite, felder = parse_block(text)
+            if zeile + hoehe > len(self.spielerliste) or col + breite - 1 > const_anzeigeRunden:
+                raise ValueError(f"Block mit {hoehe}x{breite} Werten passt ab dieser Zelle nicht in die Tabelle")
+        except ValueError as fehler:
+            logging.warning(f"Einfügen abgelehnt: {fehler}")
+            QMessageBox.warning(self, "Einfügen", str(fehler))
+            return
+        eintraege = [(kopf.logicalIndex(zeile + i), self.offset_runde + col + j, (), summe)         # wie eine als Summe eingegebene Aufnahme
+                     for i, j, summe in felder]
+        if eintraege:
+            self.fuehre_aus(EinfuegeBefehl(self, eintraege))
+            logging.info(f"{len(eintraege)} Aufnahmen eingefügt ab Spieler {row}, Runde {self.offset_runde + col}")
+
+    def aktualisiere_treffer(self, spieler, runde):
+        positionen = self.positionen.get((spieler, runde), ())
+        self.statistik.setze_treffer(spieler, runde, positionen)
+        self.streuung.setze_treffer(spieler, runde, positionen)
+        if self.heatmap.setze_treffer(spieler, runde, positionen):
+            self.dartscheibe_label.update()
+
+    def waehle_heatmap(self, index):
+        # 0 = aus, 1 = alle Spieler, ab 2 ein einzelner Spieler
+        self.heatmap.waehle(None if index <= 0 else index - 2)
+        self.dartscheibe_label.update()
+
+    @gemessen("zelle_ausgewaehlt")
     def zelle_ausgewaehlt(self, current_row, current_column):
         if current_row >= 0 and 1 <= current_column <= const_anzeigeRunden:
             self.index_spieler = current_row
@@ -577,14 +3688,23 @@ class SpielGUI(QMainWindow):
             self.status_label.setText("Ungültige Zelle ausgewählt")
             logging.warning("Ungültige Zelle ausgewählt")
 
-    def verarbeite_wurf(self, punktzahl):
+    @gemessen("verarbeite_wurf")
+    def verarbeite_wurf(self, punktzahl, position=None):
         if self.wurf_count < 3:
             self.temp_würfe.append(punktzahl)
             self.wurf_count += 1
+            schluessel = (self.index_spieler, self.offset_runde + self.index_runde)
+            self.positionen[schluessel] = self.positionen.get(schluessel, [])[:self.wurf_count - 1] + [position]
+            self.aktualisiere_treffer(*schluessel)
             summe = sum(self.temp_würfe)
             item = QTableWidgetItem(str(summe))
             item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.tabelle.setItem(self.index_spieler, self.index_runde, item)
+            with abschnitt("setItem"):
+                self.tabelle.setItem(self.index_spieler, self.index_runde, item)
+            delta = self.speicher.setze_zelle(self.index_spieler, self.offset_runde + self.index_runde, self.temp_würfe)
+            if self.server is not None:
+                self.server.verteile([delta])
+            self.benachrichtige('zellen_geaendert', [delta])
             self.update_status_label()
             logging.debug(f"Wurf {self.wurf_count}: {punktzahl}, Summe: {summe}")
             if self.wurf_count == 3:
@@ -596,6 +3716,7 @@ class SpielGUI(QMainWindow):
         self.abgeben_button.setEnabled(self.prüfe_abgabebereit())
             
 
+    @gemessen("finde_nächste_zelle")
     def finde_nächste_zelle(self, runde):                                                                  # Suche die nächste offene Zelle (nicht abgegebene Runde)
         for col in range(runde, const_anzeigeRunden + 1):                                               # alle Spalten durchlaufen
             for row in range(len(self.spielerliste)):                                               # alle Zeilen durchlaufen
@@ -614,6 +3735,31 @@ class SpielGUI(QMainWindow):
         self.punktzahl_label.setText(f"Punktzahl: {punktzahl}")
         logging.debug(f"Punktzahl-Label aktualisiert: {punktzahl}")
 
+    @gemessen("schnelleingabe")
+    def schnelleingabe(self):
+        # Eingabe aus dem Textfeld läuft wie Klicks über verarbeite_wurf; die nächste Zelle wählt finde_nächste_zelle
+        text = self.eingabe_feld.text()
+        if not text.strip():
+            return
+        try:
+            art, wert = parse_eingabe(text)
+            if art == 'summe':
+                if self.wurf_count:
+                    raise ValueError("Aufnahme nur in eine leere Zelle eintragen")
+                befehl = EinfuegeBefehl(self, [(self.index_spieler, self.offset_runde + self.index_runde, (), wert)])
+            else:
+                punkte = wert
+                if self.wurf_count + len(punkte) > 3:
+                    raise ValueError(f"Nur noch {3 - self.wurf_count} Würfe in dieser Zelle")
+                befehl = SammelBefehl(punkte)
+        except ValueError as fehler:
+            logging.warning(f"Schnelleingabe '{text}' abgelehnt: {fehler}")
+            self.status_label.setText(f"Eingabe ungültig: {fehler}")
+            self.eingabe_feld.selectAll()
+            return
+        self.fuehre_aus(befehl)
+        self.eingabe_feld.clear()
+
     def update_status_label(self):
         spieler = self.spielerliste[self.index_spieler]
         self.status_label.setText(
@@ -621,17 +3767,11 @@ class SpielGUI(QMainWindow):
             f"Runde: {self.index_runde}, Wurf: {self.wurf_count}/3"
         )
 
-    def AuswertenScheibe(self, x, y, label_width, label_height):
-        r_bullseye =7.5
-        r_bull = 17.5
-        r_scheibe = 178
-        r_dreifach = 100
-        b_ring = 12
-        
-        # Berechne die Größe des angezeigten Bildes
+    def virtuelle_koordinaten(self, x, y, label_width, label_height):
+        # Rechnet Label-Koordinaten in den virtuellen 480x480-Raum um (Mittelpunkt 0,0)
         pixmap = self.dartscheibe_label.pixmap()
         if not pixmap or pixmap.isNull():
-            return 0
+            return None
         pixmap_size = min(pixmap.width(), pixmap.height())
     
         # Berechne die Position des Bildes im Label (zentriert)
@@ -643,37 +3783,14 @@ class SpielGUI(QMainWindow):
         y = y - offset_y
     
         # Normalisiere Koordinaten auf einen virtuellen 480x480-Raum
-        scale = 480 / pixmap_size
-        x = (pixmap_size / 2 - x) * scale
-        y = (pixmap_size / 2 - y) * scale
-        
-        r = np.sqrt(x**2 + y**2)
-        if r <= r_bullseye:
-            punktzahl =  50
-        elif r <= r_bull:
-            punktzahl =  25
-        elif r > r_scheibe:
-            punktzahl = 0
-        else:
-            #Faktor bestimmen:
-            if r >= r_dreifach and r <= r_dreifach + b_ring:
-                faktor = 3
-            elif r >= r_scheibe - b_ring and r <= r_scheibe:
-                faktor = 2
-            else: faktor = 1
-            
-            # Winkel in Grad berechnen:
-            winkel = np.degrees(np.arctan2(y, -x))
-            if winkel < 0:
-                winkel += 360
-        
-            # Berechnung der Punktzahl basierend auf dem Winkel (vereinfacht):
-            sektoren = [6, 13, 4, 18, 1, 20, 5, 12, 9, 14, 11, 8, 16, 7, 19, 3, 17, 2, 15, 10]
-            sektorgröße = 360 / len(sektoren)
-        
-            sektor_index = (int((winkel + sektorgröße/2) // sektorgröße) % len(sektoren))
-            punktzahl = faktor * sektoren[sektor_index]
-        return punktzahl
+        scale = const_groesseScheibe / pixmap_size
+        return (pixmap_size / 2 - x) * scale, (pixmap_size / 2 - y) * scale
+
+    def AuswertenScheibe(self, x, y, label_width, label_height):
+        koordinaten = self.virtuelle_koordinaten(x, y, label_width, label_height)
+        if koordinaten is None:
+            return 0
+        return punktzahl_virtuell(*koordinaten)
     
     def prüfe_abgabebereit(self):
         for row in range(len(self.spielerliste)):                                               # alle Zeilen durchlaufen
@@ -682,6 +3799,7 @@ class SpielGUI(QMainWindow):
                 return False
         return True
     
+    @gemessen("abgabe")
     def abgabe(self):
         if self.prüfe_abgabebereit():
             übertrag = []
@@ -693,10 +3811,20 @@ class SpielGUI(QMainWindow):
                     item_rechts = self.tabelle.item(row, col)
                     item_links.setText(item_rechts.text())
                 item_ende = self.tabelle.item(row, const_anzeigeRunden)
-                item_ende.setText("---")
-            self.punkte.append(übertrag)
+                summe = self.speicher.summe(row, self.offset_runde + const_anzeigeRunden + 1)     # evtl. schon vom Server erfasst
+                item_ende.setText("---" if summe is None else str(summe))
+            runde_wuerfe = [(tuple(self.speicher.wuerfe(row, self.offset_runde + 1)),
+                             self.positionen.pop((row, self.offset_runde + 1), ())) for row in range(len(self.spielerliste))]
+            runde = self.speicher.runde_abschliessen(übertrag)
+            if self.datenbank is not None:
+                self.datenbank.runde_speichern(runde, übertrag, runde_wuerfe)
+            if self.autosave is not None:
+                self.autosave.haenge_runde_an(übertrag, runde_wuerfe)
+            self.benachrichtige('runde_abgegeben', runde, übertrag, self.speicher.summen)
+            self.aktualisiere_rangliste(übertrag)
             self.offset_runde += 1
-            self.tabelle.setHorizontalHeaderLabels(["Spieler"] + [f"Runde {self.offset_runde+i+1}" for i in range(const_anzeigeRunden)])
+            with abschnitt("Kopfzeile", "layout"):
+                self.tabelle.setHorizontalHeaderLabels(self.kopfzeile())
             #Cursor Tabelle verschieben
             if self.index_runde >= 2:
                 self.index_runde -= 1
@@ -704,17 +3832,39 @@ class SpielGUI(QMainWindow):
             #Abgabebereitschaft prüfen, ggf. Button deaktivieren
             self.abgeben_button.setEnabled(self.prüfe_abgabebereit())
             logging.debug(self.punkte)
+            profiler.runde_abgeschlossen(self.offset_runde)
+            if self.anzeige_server is not None:
+                self.anzeige_server.aktualisiere()
             self.update_fortschritt()
 
+    @gemessen("abgabe_zuruecknehmen")
+    def abgabe_zuruecknehmen(self, beste, zellen, positionen):
+        # Gegenstück zu abgabe: letzte Runde aus dem Speicher nehmen und Spalten zurückschieben
+        runde = self.speicher.anz_runden()
+        werte = self.speicher.runde_zuruecknehmen(beste, zellen)
+        for spieler, treffer in positionen.items():                                                 # Heatmap, Statistik und Streuung zählen sie weiterhin
+            self.positionen[(spieler, runde)] = list(treffer)
+        for row in range(len(self.spielerliste)):
+            for col in range(const_anzeigeRunden, 1, -1):
+                self.tabelle.item(row, col).setText(self.tabelle.item(row, col - 1).text())
+            self.tabelle.item(row, 1).setText(str(werte[row]))
+        self.offset_runde -= 1
+        with abschnitt("Kopfzeile", "layout"):
+            self.tabelle.setHorizontalHeaderLabels(self.kopfzeile())
+        if self.datenbank is not None:
+            self.datenbank.runde_loeschen(runde)
+        if self.autosave is not None:
+            self.autosave.entferne_letzte_runde()
+        self.benachrichtige('runde_zurueckgenommen', runde)
+        self.aktualisiere_rangliste(werte)
+        if self.anzeige_server is not None:
+            self.anzeige_server.aktualisiere()
+        self.update_fortschritt()
+
+    @gemessen("update_fortschritt")
     def update_fortschritt(self):
         if self.modus == "h":
-            max_summe = 0
-            for spieler in range(len(self.spielerliste)):
-                summe = 0
-                for runde in range(self.offset_runde):
-                    summe += self.punkte[runde][spieler]
-                if summe > max_summe:
-                    max_summe = summe
+            max_summe = self.speicher.hoechste_summe()
             fortschritt = (max_summe / int(self.hr)) * 100
         elif self.modus == "r":
             fortschritt = (self.offset_runde / int(self.hr)) * 100
@@ -722,18 +3872,375 @@ class SpielGUI(QMainWindow):
             fortschritt = 0
         self.progress_bar.setValue(int(fortschritt))
         if fortschritt >= 100:
-            self.e = ende(self.passwort, self.spielerliste, self.punkte)
+            trace.markiere("Spielende", "event")
+            profiler.stopp()
+            if self.autosave is not None:
+                try:
+                    self.autosave.archivieren()
+                    threading.Thread(target=aktualisiere_archiv_index, name="ArchivIndex", daemon=True).start()
+                except OSError as e:
+                    logging.error(f"Archivieren fehlgeschlagen: {e}")
+                self.autosave = None
+            self.e = ende(self.passwort, self.spielerliste, self.punkte, self.statistik)
             self.e.show()
             self.close()
+
+    @gemessen("korrigiere_runde")
+    def korrigiere_runde(self, spieler, runde, wert):
+        # Korrektur einer bereits abgegebenen Runde; nur der betroffene Spieler wird neu berechnet
+        try:
+            if not 1 <= runde <= self.speicher.anz_runden():
+                raise ValueError(f"Runde {runde} ist nicht abgegeben")
+            wert = summe_aus_text(str(wert))                                                        # wie bei jeder Eingabe: 0-180 ohne unmögliche Summen
+        except ValueError as fehler:
+            QMessageBox.warning(self, "Fehler", f"Ungültige Korrektur: {fehler}")
+            return False
+        alt = self.speicher.korrigiere(spieler, runde, wert)
+        if alt == wert:
+            return True
+        logging.info(f"Korrektur: Spieler {spieler}, Runde {runde}: {alt} -> {wert}")
+        self.verlauf.leeren()                                                                       # gesicherte Zustände passen nicht mehr zur korrigierten Runde
+        self.update_verlauf_buttons()
+        if self.datenbank is not None:
+            self.datenbank.runde_korrigieren(spieler, runde, wert)
+        if self.autosave is not None:
+            self.autosave.setze_summe(spieler, runde, wert)
+        self.benachrichtige('runde_korrigiert', spieler, runde, wert)
+        self.positionen.pop((spieler, runde), None)                                                 # Würfe passen nicht mehr zur korrigierten Summe,
+        self.aktualisiere_treffer(spieler, runde)                                                   # auch Heatmap und Streuung vergessen sie
+        geaendert = [0] * len(self.spielerliste)
+        geaendert[spieler] = 1
+        self.aktualisiere_rangliste(geaendert)
+        if self.anzeige_server is not None:
+            self.anzeige_server.aktualisiere()
+        self.update_fortschritt()
+        return True
+
+    def kopfzeile(self):
+        return ["Spieler"] + [f"Runde {self.offset_runde+i+1}" for i in range(const_anzeigeRunden)] + ["Gesamt", "Platz"]
+
+    @gemessen("aktualisiere_rangliste")
+    def aktualisiere_rangliste(self, geaenderte_werte=None):
+        # Gesamt nur für Spieler mit Punkten in der Runde, Platz nur bei tatsächlicher Änderung neu setzen
+        for row, wert in enumerate(geaenderte_werte if geaenderte_werte is not None else [1] * len(self.spielerliste)):
+            if wert:
+                item = self.tabelle.item(row, const_spalteGesamt)
+                item.setText(str(self.speicher.summen[row]))
+                item.setToolTip(self.statistik.text(row, self.streuung.fit(row)))
+        plaetze = self.speicher.plaetze()
+        aenderungen = [(i, p) for i, (p, alt) in enumerate(zip(plaetze, self.plaetze)) if p != alt]
+        self.plaetze = plaetze
+        for row, platz in aenderungen:
+            self.tabelle.item(row, const_spaltePlatz).setText(str(platz))
+        if aenderungen:
+            self.benachrichtige('plaetze_geaendert', aenderungen)
+            if self.chk_nach_platz.isChecked():
+                self.sortiere_nach_platz(True)
+
+    def sortiere_nach_platz(self, aktiv):
+        # Nur die Anzeige-Reihenfolge der Zeilen ändern; Items und Zeilenindizes bleiben unverändert
+        kopf = self.tabelle.verticalHeader()
+        if aktiv:
+            reihenfolge = sorted(range(len(self.spielerliste)), key=lambda i: (self.plaetze[i], i))
+        else:
+            reihenfolge = range(len(self.spielerliste))
+        for ziel, zeile in enumerate(reihenfolge):
+            aktuell = kopf.visualIndex(zeile)
+            if aktuell != ziel:
+                kopf.moveSection(aktuell, ziel)
+
+    def closeEvent(self, event):
+        # Sitzung endet auch beim vorzeitigen Schließen des Fensters
+        profiler.stopp()
+        if self.server is not None:
+            self.server.stopp()
+            self.server = None
+        if self.anzeige_server is not None:
+            self.anzeige_server.stopp()
+            self.anzeige_server = None
+        if self.verteiler is not None:
+            self.verteiler.stopp()
+            self.verteiler = None
+        if self.datenbank is not None:
+            self.datenbank.stopp()
+            self.datenbank = None
+        if self.zuschauer_fenster is not None:
+            self.zuschauer_fenster.close()
+        if self.verlauf_fenster is not None:
+            self.verlauf_fenster.close()
+        super().closeEvent(event)
             
 
 
+class StandModell(QAbstractTableModel):
+    # Tabellenmodell für die Zuschaueranzeige: liest direkt aus dem PunkteSpeicher der SpielGUI.
+    # Änderungen melden nur die betroffenen Zeilen (dataChanged), damit Qt nur diese neu zeichnet.
+    const_spalten = ["Platz", "Spieler", "Gesamt", "Aktuelle Runde"]
+
+    def __init__(self, spiel_gui):
+        super().__init__()
+        self.spiel_gui = spiel_gui
+        self.speicher = spiel_gui.speicher
+        self.spielerliste = spiel_gui.spielerliste
+        self.plaetze = spiel_gui.plaetze
+        self.reihenfolge = self._sortiere()
+        self.position = self._positionen()
+
+    def _sortiere(self):
+        return sorted(range(len(self.spielerliste)), key=lambda i: (self.plaetze[i], i))
+
+    def _positionen(self):
+        position = [0] * len(self.reihenfolge)
+        for pos, spieler in enumerate(self.reihenfolge):
+            position[spieler] = pos
+        return position
+
+    def aktuelle_runde(self):
+        return self.speicher.anz_runden() + 1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.reihenfolge)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.const_spalten)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if section == 3:
+                return f"Runde {self.aktuelle_runde()}"
+            return self.const_spalten[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole and index.column() != 1:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+        spieler = self.reihenfolge[index.row()]
+        col = index.column()
+        if col == 0:
+            return str(self.plaetze[spieler])
+        if col == 1:
+            s = self.spielerliste[spieler]
+            return f"{s.vorname} {s.nachname}"
+        if col == 2:
+            return str(self.speicher.summen[spieler])
+        summe = self.speicher.summe(spieler, self.aktuelle_runde())
+        return "---" if summe is None else str(summe)
+
+    # Beobachter-Schnittstelle der SpielGUI
+    def zellen_geaendert(self, deltas):
+        aktuelle_runde = self.aktuelle_runde()
+        for spieler, runde, _, _ in deltas:
+            if runde == aktuelle_runde:
+                index = self.index(self.position[spieler], 3)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def runde_abgegeben(self, runde, werte, summen):
+        # Gesamt und aktuelle Runde ändern sich für alle Spieler
+        self.headerDataChanged.emit(Qt.Horizontal, 3, 3)
+        if self.reihenfolge:
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self.reihenfolge) - 1, 3), [Qt.DisplayRole])
+
+    def runde_zurueckgenommen(self, runde):
+        self.runde_abgegeben(runde, None, None)
+
+    def runde_korrigiert(self, spieler, runde, wert):
+        index = self.index(self.position[spieler], 2)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def plaetze_geaendert(self, aenderungen):
+        self.plaetze = self.spiel_gui.plaetze
+        neue_reihenfolge = self._sortiere()
+        # Nur Positionen neu zeichnen, an denen jetzt ein anderer Spieler steht oder sich der Platz änderte
+        geaendert = {pos for pos, (neu, alt) in enumerate(zip(neue_reihenfolge, self.reihenfolge)) if neu != alt}
+        self.reihenfolge = neue_reihenfolge
+        self.position = self._positionen()
+        geaendert.update(self.position[spieler] for spieler, _ in aenderungen)
+        for pos in sorted(geaendert):
+            self.dataChanged.emit(self.index(pos, 0), self.index(pos, 3), [Qt.DisplayRole])
+
+
+class ZuschauerFenster(QMainWindow):
+    # Schreibgeschützte Vollbild-Anzeige für den Beamer; teilt das Modell mit der SpielGUI
+    def __init__(self, spiel_gui):
+        super().__init__()
+        self.setWindowTitle("Dartturnier – Zwischenstand")
+        self.modell = StandModell(spiel_gui)
+        self.ansicht = QTableView()
+        self.ansicht.setModel(self.modell)
+        self.ansicht.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.ansicht.setSelectionMode(QAbstractItemView.NoSelection)
+        self.ansicht.setFocusPolicy(Qt.NoFocus)
+        self.ansicht.verticalHeader().setVisible(False)
+        self.ansicht.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.ansicht.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        schrift = QFont()
+        schrift.setPointSize(20)
+        self.ansicht.setFont(schrift)
+        self.ansicht.verticalHeader().setDefaultSectionSize(44)
+        self.setCentralWidget(self.ansicht)
+        QShortcut(QKeySequence("Esc"), self, activated=self.close)
+
+    def zeige(self):
+        # Bevorzugt auf dem zweiten Bildschirm (Beamer) im Vollbild
+        bildschirme = QApplication.screens()
+        if len(bildschirme) > 1:
+            self.setGeometry(bildschirme[1].geometry())
+        self.showFullScreen()
+
+
+class RundenverlaufModell(QAbstractTableModel):
+    # Virtualisierte Sicht auf alle abgegebenen Runden: Zeilen = Spieler, Spalten = Runden.
+    # Die Werte werden erst beim Zeichnen aus dem PunkteSpeicher gelesen; es gibt keine Items,
+    # daher bleibt der Speicherbedarf der Ansicht unabhängig von der Rundenzahl.
+    # Die Spaltenzahl führt das Modell selbst: die SpielGUI meldet Abgaben erst nach der Änderung
+    # am Speicher, das Modell übernimmt sie zwischen begin/end, wie Qt es verlangt.
+    def __init__(self, spiel_gui):
+        super().__init__()
+        self.spiel_gui = spiel_gui
+        self.speicher = spiel_gui.speicher
+        self.spielerliste = spiel_gui.spielerliste
+        self.anz_runden = self.speicher.anz_runden()
+        self.korrektur_aktiv = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.spielerliste)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.anz_runden
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.korrektur_aktiv:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        try:
+            wert = int(str(value).strip())
+        except ValueError:
+            return False
+        # Die SpielGUI prüft den Wert und meldet die Änderung über runde_korrigiert zurück
+        return self.spiel_gui.korrigiere_runde(index.row(), index.column() + 1, wert)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"Runde {section + 1}"
+        spieler = self.spielerliste[section]
+        return f"{spieler.vorname} {spieler.nachname}"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole or index.column() >= self.speicher.anz_runden():
+            return None
+        return str(self.speicher.runden[index.column()][index.row()])
+
+    # Beobachter-Schnittstelle der SpielGUI
+    def zellen_geaendert(self, deltas):
+        pass                                                                                        # offene Runden erscheinen erst nach der Abgabe
+
+    def runde_abgegeben(self, runde, werte, summen):
+        self.beginInsertColumns(QModelIndex(), self.anz_runden, runde - 1)
+        self.anz_runden = runde
+        self.endInsertColumns()
+
+    def runde_zurueckgenommen(self, runde):
+        if runde > self.anz_runden:
+            return
+        self.beginRemoveColumns(QModelIndex(), runde - 1, self.anz_runden - 1)
+        self.anz_runden = runde - 1
+        self.endRemoveColumns()
+
+    def runde_korrigiert(self, spieler, runde, wert):
+        index = self.index(spieler, runde - 1)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def plaetze_geaendert(self, aenderungen):
+        pass
+
+
+class RundenverlaufFenster(QMainWindow):
+    # Gesamter Rundenverlauf mit Sprung zu einer beliebigen Runde
+    const_spaltenbreite = 80
+
+    def __init__(self, spiel_gui):
+        super().__init__(spiel_gui)
+        self.setWindowTitle("Rundenverlauf")
+        self.resize(900, 500)
+        self.modell = RundenverlaufModell(spiel_gui)
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+
+        sprung_layout = QHBoxLayout()
+        sprung_layout.addWidget(QLabel("Gehe zu Runde:"))
+        self.spin_runde = QSpinBox()
+        self.spin_runde.setMinimum(1)
+        self.spin_runde.setMaximum(max(1, self.modell.columnCount()))
+        self.spin_runde.valueChanged.connect(self.springe_zu)
+        sprung_layout.addWidget(self.spin_runde)
+        sprung_layout.addStretch()
+        self.chk_korrektur = QCheckBox("Korrektur erlauben")
+        self.chk_korrektur.toggled.connect(self.korrektur_umschalten)
+        sprung_layout.addWidget(self.chk_korrektur)
+        self.spiel_gui = spiel_gui
+        layout.addLayout(sprung_layout)
+
+        self.ansicht = QTableView()
+        self.ansicht.setModel(self.modell)
+        self.ansicht.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Feste Spaltenbreiten: Qt muss für das Scrollen keine Inhalte vermessen
+        kopf = self.ansicht.horizontalHeader()
+        kopf.setSectionResizeMode(QHeaderView.Fixed)
+        kopf.setDefaultSectionSize(self.const_spaltenbreite)
+        self.ansicht.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.ansicht.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        layout.addWidget(self.ansicht)
+        self.modell.columnsInserted.connect(self._runden_geaendert)
+        self.modell.columnsRemoved.connect(self._runden_geaendert)
+
+    def korrektur_umschalten(self, aktiv):
+        # Korrekturen sind dem Turnierleiter vorbehalten
+        if aktiv:
+            passwort, ok = QInputDialog.getText(self, "Korrektur", "Passwort:", QLineEdit.Password)
+            if not ok or passwort != str(self.spiel_gui.passwort):
+                if ok:
+                    QMessageBox.warning(self, "Fehler", "Falsches Passwort!")
+                self.chk_korrektur.blockSignals(True)
+                self.chk_korrektur.setChecked(False)
+                self.chk_korrektur.blockSignals(False)
+                return
+        self.modell.korrektur_aktiv = aktiv
+        self.ansicht.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+                                     if aktiv else QAbstractItemView.NoEditTriggers)
+
+    def _runden_geaendert(self):
+        self.spin_runde.setMaximum(max(1, self.modell.columnCount()))
+
+    def springe_zu(self, runde):
+        if 1 <= runde <= self.modell.columnCount():
+            self.ansicht.scrollTo(self.modell.index(0, runde - 1), QAbstractItemView.PositionAtCenter)
+
+
 class ende(QMainWindow):
-    def __init__(self, passwort, spielerliste, punkte):
+    def __init__(self, passwort, spielerliste, punkte, statistik=None):
         super().__init__()
         self.passwort = str(passwort)
         self.spielerliste = spielerliste
         self.punkte = punkte
+        self.statistik = statistik
         self.initUI()
         
     def initUI(self):
@@ -771,6 +4278,7 @@ class ende(QMainWindow):
         # Passwortfeld leeren
         self.password_input.clear()
 
+    @gemessen("save_excel", "excel")
     def save_excel(self):
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Ergebnisse speichern", "Turnierergebnisse.xlsx", "Excel-Dateien (*.xlsx);;Alle Dateien (*.*)"
@@ -797,19 +4305,24 @@ class ende(QMainWindow):
                 ergebnisse.append({
                     'spieler': spieler,
                     'gesamtpunktzahl': gesamtpunktzahl,
-                    'beste_runde': beste_runde
+                    'beste_runde': beste_runde,
+                    'statistik': self.statistik.werte(i) if self.statistik is not None else None
                 })
             
             # Sortiere nach Gesamtpunktzahl (absteigend), bei Gleichstand nach bester Runde
             ergebnisse.sort(key=lambda x: (x['gesamtpunktzahl'], x['beste_runde']), reverse=True)
             
             # Erstelle Excel-Datei
+            openpyxl = lade_modul('openpyxl')
+            get_column_letter = lade_modul('openpyxl.utils').get_column_letter
             wb = openpyxl.Workbook()
             ws = wb.active
             ws.title = "Turnierergebnisse"
             
             # Kopfzeile
             headers = ["Platzierung", "Vorname", "Nachname", "Gesamtpunktzahl", "Beste Runde"]
+            if self.statistik is not None:
+                headers += ["3-Dart-Schnitt", "Streuung", "100+", "140+", "180"]
             for col, header in enumerate(headers, 1):
                 ws[f"{get_column_letter(col)}1"] = header
             
@@ -820,9 +4333,13 @@ class ende(QMainWindow):
                 ws[f"C{row}"] = ergebnis['spieler'].nachname
                 ws[f"D{row}"] = ergebnis['gesamtpunktzahl']
                 ws[f"E{row}"] = ergebnis['beste_runde']
+                if ergebnis['statistik'] is not None:
+                    w = ergebnis['statistik']
+                    for col, wert in enumerate((round(w['schnitt'], 2), round(w['streuung'], 2), w['100+'], w['140+'], w['180']), 6):
+                        ws[f"{get_column_letter(col)}{row}"] = wert
             
             # Spaltenbreiten anpassen
-            for col in range(1, 6):
+            for col in range(1, len(headers) + 1):
                 ws.column_dimensions[get_column_letter(col)].width = 15
             
             # Speichere die Datei
@@ -848,10 +4365,84 @@ class test:
         window.showMaximized()
         sys.exit(app.exec_())
 
+class WarmStart:
+    # Hält einen vorinitialisierten Prozess im Hintergrund. Ein erneuter Programmstart mit
+    # --warmstart meldet sich nur per QLocalSocket beim laufenden Prozess, der dann ein neues
+    # Setup-Fenster mit bereits geladenen Modulen und dekodierter Dartscheibe öffnet.
+    const_serverName = "darts-turnier-warmstart"
+
+    def __init__(self, app):
+        self.app = app
+        self.fenster = None
+        self.server = QLocalServer()
+        self.server.newConnection.connect(self._neue_verbindung)
+
+    @classmethod
+    def sende(cls, befehl):
+        # Liefert True, wenn ein residenter Prozess den Befehl angenommen hat
+        socket = QLocalSocket()
+        socket.connectToServer(cls.const_serverName)
+        if not socket.waitForConnected(500):
+            return False
+        socket.write(QByteArray(befehl.encode('utf-8') + b"\n"))
+        socket.waitForBytesWritten(1000)
+        socket.disconnectFromServer()
+        return True
+
+    def starte(self):
+        if not self.server.listen(self.const_serverName):
+            # Verwaister Socket eines abgestürzten Prozesses
+            QLocalServer.removeServer(self.const_serverName)
+            self.server.listen(self.const_serverName)
+        self.app.setQuitOnLastWindowClosed(False)
+        logging.info("Warmstart-Modus aktiv")
+        self.neues_turnier()
+        QTimer.singleShot(0, lade_scheibe)                                                          # Dartscheibe schon vor dem ersten Spiel dekodieren
+
+    def _neue_verbindung(self):
+        socket = self.server.nextPendingConnection()
+        socket.readyRead.connect(lambda: self._lese_befehl(socket))
+
+    def _lese_befehl(self, socket):
+        while socket.canReadLine():
+            befehl = bytes(socket.readLine()).decode('utf-8').strip()
+            logging.info(f"Warmstart-Befehl: {befehl}")
+            if befehl == "neu":
+                self.neues_turnier()
+            elif befehl == "beenden":
+                self.app.quit()
+
+    def neues_turnier(self):
+        # Laufendes Turnier nach vorne holen, sonst neues Setup-Fenster öffnen
+        for fenster in self.app.topLevelWidgets():
+            if isinstance(fenster, (SetupWindow, SpielGUI, ende)) and fenster.isVisible():
+                fenster.raise_()
+                fenster.activateWindow()
+                return
+        self.fenster = SetupWindow()
+        self.fenster.show()
+
+
 def main():
+    if '--lasttest' in sys.argv:
+        argumente = sys.argv[1:]
+        argumente.remove('--lasttest')
+        sys.exit(lasttest_main(argumente))
+    warmstart_modus = '--warmstart' in sys.argv or env_schalter('DARTS_WARMSTART')
+    if '--beenden' in sys.argv:
+        sys.exit(0 if WarmStart.sende("beenden") else 1)
+    if warmstart_modus and WarmStart.sende("neu"):
+        logging.info("Neues Turnier an residenten Prozess übergeben")
+        sys.exit(0)
     app = QApplication(sys.argv)
-    window = SetupWindow()
-    window.show()
+    startprofil.markiere("QApplication")
+    if warmstart_modus:
+        warmstart = WarmStart(app)
+        warmstart.starte()
+    else:
+        window = SetupWindow()
+        window.show()
+    QTimer.singleShot(0, vorwaermen)                                                               # erst nach dem ersten Anzeigen vorladen
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,30 @@
+# Lädt Darts_v0.3.py als Modul "darts", ohne Bildschirm und ohne darts.log im Arbeitsverzeichnis
+import importlib.util
+import logging
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+logging.getLogger().addHandler(logging.NullHandler())                                               # basicConfig des Moduls greift dann nicht
+
+const_ordner = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, const_ordner)                                                                    # für resources.py
+
+if 'darts' not in sys.modules:
+    _spec = importlib.util.spec_from_file_location('darts', os.path.join(const_ordner, 'Darts_v0.3.py'))
+    _darts = importlib.util.module_from_spec(_spec)
+    sys.modules['darts'] = _darts
+    _spec.loader.exec_module(_darts)
+
+darts = sys.modules['darts']
+
+
+@pytest.fixture
+def speicher():
+    # Drei Spieler (Startnummern 10-12) mit zwei abgegebenen Runden
+    speicher = darts.PunkteSpeicher([darts.Spieler(f"Vorname{i}", f"Nachname{i}", 10 + i) for i in range(3)])
+    speicher.runde_abschliessen([60, 100, 26])
+    speicher.runde_abschliessen([140, 45, 26])
+    return speicher
@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+import darts
+
+
+@pytest.mark.parametrize("wert", ["1", "true", "Yes", " on ", "ja"])
+def test_pfad_aus_umgebung_schalter_nimmt_standardpfad(monkeypatch, wert):
+    monkeypatch.setenv('DARTS_DB', wert)
+    assert darts.TurnierDatenbank.pfad_aus_umgebung() == darts.ausgabe_pfad(darts.const_datenbank)
+
+
+@pytest.mark.parametrize("wert", ["", "0", "false", "off", "nein"])
+def test_pfad_aus_umgebung_abgeschaltet(monkeypatch, wert):
+    monkeypatch.setenv('DARTS_DB', wert)
+    assert darts.TurnierDatenbank.pfad_aus_umgebung() is None
+
+
+def test_pfad_aus_umgebung_eigener_pfad(monkeypatch, tmp_path):
+    pfad = os.path.join(str(tmp_path), "turniere.sqlite")
+    monkeypatch.setenv('DARTS_DB', pfad)
+    assert darts.TurnierDatenbank.pfad_aus_umgebung() == pfad
@@ -0,0 +1,14 @@
+import pytest
+
+import darts
+
+
+def test_parse_block():
+    hoehe, breite, eintraege = darts.parse_block("60\t\t100\r\n45;140\n")
+    assert (hoehe, breite) == (2, 3)
+    assert eintraege == [(0, 0, 60), (0, 2, 100), (1, 0, 45), (1, 1, 140)]
+
+
+def test_parse_block_meldet_erstes_ungueltiges_feld():
+    with pytest.raises(ValueError, match=r"2 ungültige Aufnahme\(n\), erste in Zeile 1, Spalte 2: 1e2"):
+        darts.parse_block("60\t1e2\n181\t5")
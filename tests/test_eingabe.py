@@ -0,0 +1,51 @@
+import pytest
+
+import darts
+
+
+@pytest.mark.parametrize("text, erwartet", [
+    ("T20", 60), ("d16", 32), ("S5", 5), ("5", 5), ("0", 0), ("25", 25), ("50", 50),
+    ("SB", 25), ("Bull", 25), ("Bullseye", 50), ("DB", 50), ("D25", 50),
+])
+def test_wurf_aus_text(text, erwartet):
+    assert darts.wurf_aus_text(text) == erwartet
+
+
+@pytest.mark.parametrize("text", ["T25", "21", "D0", "X3", "", "T"])
+def test_wurf_aus_text_ungueltig(text):
+    with pytest.raises(ValueError):
+        darts.wurf_aus_text(text)
+
+
+@pytest.mark.parametrize("text, erwartet", [("0", 0), ("85", 85), ("180", 180), ("162", 162)])
+def test_summe_aus_text(text, erwartet):
+    assert darts.summe_aus_text(text) == erwartet
+
+
+@pytest.mark.parametrize("text", ["181", "163", "179", "12.0", "1e2", "-5", "", "١٢"])
+def test_summe_aus_text_ungueltig(text):
+    with pytest.raises(ValueError):
+        darts.summe_aus_text(text)
+
+
+def test_parse_eingabe_wuerfe():
+    assert darts.parse_eingabe("T20 T20 5") == ('wuerfe', [60, 60, 5])
+    assert darts.parse_eingabe(" t19,d16 ") == ('wuerfe', [57, 32])
+    assert darts.parse_eingabe("20") == ('wuerfe', [20])
+
+
+def test_parse_eingabe_summe():
+    assert darts.parse_eingabe("=45") == ('summe', 45)
+    assert darts.parse_eingabe("= 100") == ('summe', 100)
+    assert darts.parse_eingabe("85") == ('summe', 85)                                              # über 60 kann kein Einzelwurf sein
+
+
+@pytest.mark.parametrize("text", ["", "T20 T20 T20 T20", "=179", "=12.0", "200", "T21"])
+def test_parse_eingabe_ungueltig(text):
+    with pytest.raises(ValueError):
+        darts.parse_eingabe(text)
+
+
+@pytest.mark.parametrize("sektor, faktor", [(25, 1), (25, 2), (20, 3), (16, 2), (5, 1)])
+def test_wurf_aus_text_versteht_feld_name(sektor, faktor):
+    assert darts.wurf_aus_text(darts.feld_name(sektor, faktor)) == sektor * faktor
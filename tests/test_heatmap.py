@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+import darts
+
+np = pytest.importorskip('numpy')
+
+
+def test_raster_erst_beim_einblenden():
+    heatmap = darts.TrefferHeatmap()
+    heatmap.setze_treffer(0, 1, ((10.0, 20.0), None))
+    heatmap.waehle(None)
+    assert heatmap.dichte is None and heatmap.bild() is None
+    heatmap.waehle(0)
+    assert heatmap.dichte is not None and heatmap.bild() is not None
+
+
+def test_nachtraeglich_eingeblendet_wie_laufend_gestempelt():
+    laufend, spaet = darts.TrefferHeatmap(), darts.TrefferHeatmap()
+    laufend.waehle(-1)
+    zufall = random.Random(2)
+    for runde in range(1, 20):
+        treffer = [(zufall.uniform(-150, 150), zufall.uniform(-150, 150)) for _ in range(3)]
+        for heatmap in (laufend, spaet):
+            heatmap.setze_treffer(runde % 3, runde, treffer)
+            heatmap.setze_treffer(runde % 3, runde, treffer[:2])                                    # ersetzte Zelle
+    spaet.waehle(-1)
+    assert np.allclose(laufend.dichte, spaet.dichte, atol=1e-5)
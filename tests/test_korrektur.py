@@ -0,0 +1,15 @@
+def test_korrigiere_fuehrt_summe_beste_und_rangliste_nach(speicher):
+    schnappschuss = speicher.runden[0]
+    assert speicher.plaetze() == [1, 2, 3]
+    assert speicher.korrigiere(0, 2, 40) == 140
+    assert speicher.summen[0] == 100 and speicher.beste[0] == 60                                   # bisheriges Maximum gesunken
+    assert speicher.plaetze() == [2, 1, 3]
+    assert speicher.korrigiere(2, 1, 180) == 26
+    assert speicher.beste[2] == 180 and speicher.hoechste_summe() == 206
+    assert speicher.runden[0] is not schnappschuss and schnappschuss == [60, 100, 26]              # Zeile ersetzt, nicht verändert
+
+
+def test_korrigiere_ohne_aenderung_zaehlt_keine_version(speicher):
+    version = speicher.version
+    assert speicher.korrigiere(1, 1, 100) == 100
+    assert speicher.version == version
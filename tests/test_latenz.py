@@ -0,0 +1,30 @@
+import threading
+
+import darts
+
+
+def test_histogramm_perzentile():
+    histogramm = darts.LatenzHistogramm()
+    for dauer_us in [100] * 90 + [10000] * 10:
+        histogramm.erfasse(dauer_us)
+    assert histogramm.anzahl == 100 and histogramm.maximum_us == 10000
+    assert 100 <= histogramm.perzentil(50) < 100 * 1.19
+    assert 10000 <= histogramm.perzentil(99) <= 10000
+    assert histogramm.mittelwert() == 1090
+
+
+def test_erfassen_aus_mehreren_threads():
+    monitor = darts.LatenzMonitor()
+
+    def messe(nr):
+        for i in range(2000):
+            monitor.erfasse(f"handler{i % 7}", nr + 1)
+
+    threads = [threading.Thread(target=messe, args=(nr,)) for nr in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    zeilen = monitor.bericht()
+    assert len(zeilen) == 7
+    assert sum(zeile[1] for zeile in zeilen) == 8 * 2000
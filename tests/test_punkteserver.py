@@ -0,0 +1,46 @@
+import pytest
+
+def test_wende_an_sammelt_wuerfe_und_deltas(speicher):
+    deltas, fehler = speicher.wende_an([
+        {'spieler': 10, 'runde': 3, 'punkte': 60},
+        {'spieler': 10, 'runde': 3, 'punkte': 57},
+        {'spieler': 11, 'runde': 4, 'punkte': 25},
+    ])
+    assert fehler == {}
+    assert deltas == [(0, 3, 117, 2), (1, 4, 25, 1)]
+    assert speicher.wuerfe(0, 3) == [60, 57]
+
+
+@pytest.mark.parametrize("ereignis, meldung", [
+    ({'spieler': 99, 'runde': 3, 'punkte': 20}, "unbekannter Spieler"),
+    ({'spieler': 10, 'runde': 2, 'punkte': 20}, "Runde bereits abgegeben oder ungültig"),
+    ({'spieler': 10, 'runde': True, 'punkte': 20}, "Runde bereits abgegeben oder ungültig"),
+    ({'spieler': 10, 'runde': "3", 'punkte': 20}, "Runde bereits abgegeben oder ungültig"),
+    ({'spieler': 10, 'runde': 5, 'punkte': 20}, "Runde liegt zu weit voraus"),
+    ({'spieler': 10, 'runde': 3, 'punkte': 23}, "ungültige Punktzahl"),
+    ({'spieler': 10, 'runde': 3, 'punkte': 61}, "ungültige Punktzahl"),
+    ({'spieler': 10, 'runde': 3, 'punkte': True}, "ungültige Punktzahl"),
+    ({'spieler': 10, 'runde': 3, 'punkte': 20.0}, "ungültige Punktzahl"),
+])
+def test_wende_an_weist_ungueltiges_ab(speicher, ereignis, meldung):
+    version = speicher.version
+    assert speicher.wende_an([ereignis]) == ([], {0: meldung})
+    assert speicher.version == version
+
+
+def test_wende_an_hoechstens_drei_wuerfe_und_reset(speicher):
+    deltas, fehler = speicher.wende_an([{'spieler': 12, 'runde': 3, 'punkte': 20}] * 4 + [{'spieler': 11, 'runde': 3, 'typ': 'reset'}])
+    assert fehler == {3: "bereits drei Würfe"}
+    assert deltas == [(2, 3, 60, 3), (1, 3, None, 0)]
+    deltas, fehler = speicher.wende_an([{'spieler': 12, 'runde': 3, 'typ': 'reset'}, {'spieler': 12, 'runde': 3, 'punkte': 50}])
+    assert fehler == {} and deltas == [(2, 3, 50, 1)]
+
+
+def test_wende_an_laesst_eingegebene_summe_stehen(speicher):
+    assert speicher.setze_zelle(0, 3, (), summe=100) == (0, 3, 100, 0)
+    deltas, fehler = speicher.wende_an([{'spieler': 10, 'runde': 3, 'punkte': 20}])
+    assert deltas == [] and fehler == {0: "Aufnahme bereits als Summe erfasst"}
+    assert speicher.inhalt(0, 3) == ((), 100)
+    deltas, fehler = speicher.wende_an([{'spieler': 10, 'runde': 3, 'typ': 'reset'}, {'spieler': 10, 'runde': 3, 'punkte': 20}])
+    assert fehler == {} and deltas == [(0, 3, 20, 1)]
+    assert speicher.inhalt(0, 3) == ((20,), None)
@@ -0,0 +1,34 @@
+import darts
+
+
+def test_rangliste_teilt_gleichstand():
+    index = darts.RanglistenIndex(4)
+    for spieler, schluessel in enumerate([(300, 100), (500, 140), (300, 100), (300, 60)]):
+        index.aktualisiere(spieler, schluessel)
+    assert [index.platz(s) for s in range(4)] == [2, 1, 2, 4]
+    assert index.spitze() == (500, 140)
+
+
+def test_rangliste_aktualisiere_alle_wie_einzeln():
+    schluessel = [(120, 60), (120, 80), (0, 0), (45, 45), (120, 60)]
+    einzeln = darts.RanglistenIndex(len(schluessel))
+    for spieler, wert in enumerate(schluessel):
+        einzeln.aktualisiere(spieler, wert)
+    gesamt = darts.RanglistenIndex(len(schluessel))
+    gesamt.aktualisiere_alle(iter(schluessel))
+    assert gesamt.sortiert == einzeln.sortiert
+    assert [gesamt.platz(s) for s in range(5)] == [einzeln.platz(s) for s in range(5)] == [2, 1, 5, 4, 2]
+    gesamt.aktualisiere(2, (200, 100))
+    assert gesamt.platz(2) == 1 and gesamt.platz(1) == 2
+
+
+def test_runde_abschliessen_und_zuruecknehmen(speicher):
+    speicher.setze_zellen([(0, 3, [60, 60, 60], None), (1, 3, (), 85), (2, 4, [5], None)])
+    assert sorted(speicher.offene_zellen()) == [(0, 3, 180, 3), (1, 3, 85, 0), (2, 4, 5, 1)]
+    beste, zellen = list(speicher.beste), {0: speicher.inhalt(0, 3), 1: speicher.inhalt(1, 3)}
+    assert speicher.runde_abschliessen([180, 85, 0]) == 3
+    assert speicher.offene_zellen() == [(2, 4, 5, 1)]
+    assert speicher.plaetze() == [1, 2, 3]
+    assert speicher.runde_zuruecknehmen(beste, zellen) == [180, 85, 0]
+    assert speicher.summen == [200, 145, 52] and speicher.beste == [140, 100, 26]
+    assert speicher.inhalt(0, 3) == ((60, 60, 60), None) and speicher.inhalt(1, 3) == ((), 85)
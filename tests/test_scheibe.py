@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+import darts
+
+np = pytest.importorskip('numpy')
+
+
+def test_punktzahl_raster_wie_punktzahl_virtuell():
+    # Gitter über die ganze Scheibe samt Rand und zufällige Punkte knapp innerhalb und außerhalb jeder Ringgrenze
+    # (genau auf der Grenze unterscheiden sich math.hypot und np.hypot im letzten Bit)
+    achse = np.arange(-190, 191, 1.5)
+    x, y = np.meshgrid(achse, achse)
+    zufall = random.Random(7)
+    grenzen = [darts.const_rBullseye, darts.const_rBull, darts.const_rDreifach, darts.const_rDreifach + darts.const_bRing,
+               darts.const_rScheibe - darts.const_bRing, darts.const_rScheibe]
+    punkte = [(r * np.cos(w), r * np.sin(w)) for grenze in grenzen for r in (grenze - 0.01, grenze + 0.01) for w in (zufall.uniform(0, 2 * np.pi) for _ in range(50))]
+    x = np.concatenate([x.ravel(), [p[0] for p in punkte]])
+    y = np.concatenate([y.ravel(), [p[1] for p in punkte]])
+    raster = darts.punktzahl_raster(x, y)
+    einzeln = np.array([darts.punktzahl_virtuell(a, b) for a, b in zip(x.tolist(), y.tolist())])
+    assert np.array_equal(raster, einzeln)
+
+
+@pytest.mark.parametrize("sektor, faktor", [(20, 3), (20, 2), (20, 1), (6, 3), (3, 2), (25, 1), (25, 2)])
+def test_zielpunkt_trifft_feld(sektor, faktor):
+    assert darts.feld_virtuell(*darts.zielpunkt(sektor, faktor)) == (sektor, faktor)
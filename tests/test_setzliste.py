@@ -0,0 +1,9 @@
+import darts
+
+
+def test_zellwert():
+    spalte = {"Vorname": 1, "Nachname": 2, "Platzierung": 5}
+    zeile = (None, "Anna", "B", 3)
+    assert darts.zellwert(zeile, spalte, "Vorname") == "Anna"
+    assert darts.zellwert(zeile, spalte, "Platzierung") is None                                     # Zeile kürzer als der Kopf
+    assert darts.zellwert(zeile, spalte, "Beste Runde") is None                                     # Spalte fehlt
@@ -0,0 +1,14 @@
+import darts
+
+
+def test_normalisiere_name_umlaute_und_leerraum():
+    assert darts.normalisiere_name("Jörg ", " Müller-Lüdenscheidt") == "joerg|mueller luedenscheidt"
+    assert darts.normalisiere_name("joerg", "mueller   luedenscheidt") == "joerg|mueller luedenscheidt"
+
+
+def test_normalisiere_name_akzente_und_eszett():
+    assert darts.normalisiere_name("René", "Straße") == "rene|strasse"
+
+
+def test_normalisiere_name_trennt_vor_und_nachname():
+    assert darts.normalisiere_name("Anna Maria", "B") != darts.normalisiere_name("Anna", "Maria B")
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+import darts
+
+np = pytest.importorskip('numpy')
+
+
+def summen(punkte):
+    x, y = np.array(punkte, dtype=float).T
+    return [len(x), x.sum(), y.sum(), (x * x).sum(), (y * y).sum(), (x * y).sum()]
+
+
+def test_fits_schaetzt_ablage_und_kovarianz():
+    ziel_x, ziel_y = darts.zielpunkt(20, 3)
+    zufall = random.Random(3)
+    punkte = [(ziel_x + 4 + zufall.gauss(0, 10), ziel_y - 2 + zufall.gauss(0, 20)) for _ in range(400)]
+    fit, = darts.StreuungsSchaetzer.fits(summen(punkte))
+    x, y = np.array(punkte).T
+    assert fit.anzahl == 400
+    assert (fit.ablage_x, fit.ablage_y) == pytest.approx((x.mean() - ziel_x, y.mean() - ziel_y))
+    assert (fit.cxx, fit.cyy, fit.cxy) == pytest.approx((x.var(), y.var(), np.cov(x, y, bias=True)[0, 1]))
+    assert fit.sigma() == pytest.approx((10, 20), rel=0.15)
+
+
+def test_fits_je_zeile_und_zu_wenig_wuerfe():
+    n = darts.StreuungsSchaetzer.const_minWuerfe
+    zeilen = [summen([(i, -i) for i in range(n)]), summen([(1, 1)] * (n - 1)), [0] * 6]
+    fits = darts.StreuungsSchaetzer.fits(zeilen)
+    assert len(fits) == 3 and fits[1] is None and fits[2] is None
+    assert fits[0].korrelation() == pytest.approx(-1)
+
+
+def test_fit_aus_setze_treffer_wie_fits():
+    schaetzer = darts.StreuungsSchaetzer(2)
+    zufall = random.Random(5)
+    punkte = {runde: tuple((zufall.uniform(-50, 50), zufall.uniform(-50, 50)) for _ in range(3)) for runde in range(1, 6)}
+    for runde, treffer in punkte.items():
+        schaetzer.setze_treffer(0, runde, treffer + (None,))
+    schaetzer.setze_treffer(0, 5, ((0.0, 0.0),))                                                    # ersetzte Zelle wird abgezogen
+    punkte[5] = ((0.0, 0.0),)
+    erwartet, = darts.StreuungsSchaetzer.fits(summen([p for treffer in punkte.values() for p in treffer]))
+    fit = schaetzer.fit(0)
+    assert fit.anzahl == erwartet.anzahl == 13
+    assert (fit.ablage_x, fit.ablage_y, fit.cxx, fit.cyy, fit.cxy) == \
+        pytest.approx((erwartet.ablage_x, erwartet.ablage_y, erwartet.cxx, erwartet.cyy, erwartet.cxy))
+    assert schaetzer.fit(1) is None
@@ -0,0 +1,75 @@
+import pytest
+
+import darts
+
+pytest.importorskip('numpy')
+
+
+def spielerliste():
+    return [darts.Spieler("Jörg", "Müller-Lüdenscheidt", 1), darts.Spieler("Anna", "B", 7), darts.Spieler("X" * 40, "Y", 3)]
+
+
+def test_anlegen_anhaengen_oeffnen(tmp_path):
+    pfad = str(tmp_path / "turnier.drt")
+    datei = darts.TurnierDatei.anlegen(pfad, spielerliste(), "H", "12")
+    datei.haenge_runde_an([180, 100, 26], [((60, 60, 60), ()), ((), ()), ((20, 5, 1), ())])
+    datei.haenge_runde_an([40, 0, 7], [((20, 20), ()), ((0, 0, 0), ()), ((5, 5), ())])           # Würfe passen nicht zur Summe
+    datei.setze_turnier_id(42)
+
+    gelesen = darts.TurnierDatei.oeffnen(pfad)
+    assert (gelesen.modus, gelesen.hr, gelesen.turnier_id) == ("H", 12, 42)
+    assert gelesen.beginn == pytest.approx(datei.beginn)
+    assert [(s.vorname, s.nachname, s.startnr) for s in gelesen.spielerliste] == \
+        [("Jörg", "Müller-Lüdenscheidt", 1), ("Anna", "B", 7), ("X" * 31, "Y", 3)]
+    assert gelesen.summen_je_runde() == [[180, 100, 26], [40, 0, 7]]
+    assert gelesen.wuerfe(1) == [((60, 60, 60), ()), ((), ()), ((20, 5, 1), ())]
+    assert gelesen.wuerfe(2) == [((20, 20), ()), ((0, 0, 0), ()), ((), ())]
+    assert darts.TurnierDatei.offene_runden(pfad) == 2
+
+
+def test_setze_summe_und_entferne_letzte_runde(tmp_path):
+    pfad = str(tmp_path / "turnier.drt")
+    datei = darts.TurnierDatei.anlegen(pfad, spielerliste(), "R", 5)
+    for runde in range(3):
+        datei.haenge_runde_an([runde, 10, 20], [((runde,), ()), ((10,), ()), ((20,), ())])
+    datei.setze_summe(1, 2, 99)
+    datei.entferne_letzte_runde()
+    gelesen = darts.TurnierDatei.oeffnen(pfad)
+    assert gelesen.turnier_id == 0
+    assert gelesen.summen_je_runde() == [[0, 10, 20], [1, 99, 20]]
+    assert gelesen.wuerfe(2)[1] == ((), ())
+
+
+def test_abgebrochenes_anhaengen_wird_ignoriert(tmp_path):
+    pfad = str(tmp_path / "turnier.drt")
+    datei = darts.TurnierDatei.anlegen(pfad, spielerliste(), "H", 10)
+    datei.haenge_runde_an([1, 2, 3], [((1,), ()), ((2,), ()), ((3,), ())])
+    with open(pfad, 'r+b') as f:
+        f.seek(datei.const_offsetRunden)
+        f.write((2).to_bytes(4, 'little'))                                                          # Rundenzahl erhöht, Daten fehlen
+        f.seek(0, 2)
+        f.write(b'\0' * 5)
+    assert darts.TurnierDatei.oeffnen(pfad).summen_je_runde() == [[1, 2, 3]]
+
+
+def test_offene_runden_und_beiseite_legen(tmp_path):
+    pfad = str(tmp_path / "autosave.drt")
+    assert darts.TurnierDatei.offene_runden(pfad) == 0
+    (tmp_path / "kaputt.drt").write_bytes(b'XXXX' + b'\0' * 40)
+    assert darts.TurnierDatei.offene_runden(str(tmp_path / "kaputt.drt")) == 0
+
+    datei = darts.TurnierDatei.anlegen(pfad, spielerliste(), "H", 10)
+    assert darts.TurnierDatei.beiseite_legen(pfad) is None                                          # ohne Runden nichts aufzuheben
+    datei.haenge_runde_an([1, 2, 3], [((), ()), ((), ()), ((), ())])
+    ziel = darts.TurnierDatei.beiseite_legen(pfad)
+    assert ziel.startswith(str(tmp_path / "autosave_")) and ziel.endswith(".drt")
+    assert darts.TurnierDatei.offene_runden(ziel) == 1
+    assert darts.TurnierDatei.offene_runden(pfad) == 0
+
+
+def test_lange_namen_an_zeichengrenze_gekuerzt(tmp_path):
+    assert darts.TurnierDatei.passt("Ä" * 15 + "x") and not darts.TurnierDatei.passt("Ä" * 16)
+    pfad = str(tmp_path / "turnier.drt")
+    darts.TurnierDatei.anlegen(pfad, [darts.Spieler("Ä" * 20, "Müller", 1)], "H", 10)
+    spieler, = darts.TurnierDatei.oeffnen(pfad).spielerliste
+    assert (spieler.vorname, spieler.nachname) == ("Ä" * 15, "Müller")